@@ -15,6 +15,7 @@ from models.day import DayDao
 from models.image import ImageDao
 from models.post import PostDao
 from models.comment import CommentDao
+from models.user_module_stats import UserModuleStatsDao
 from settings import DatabaseSettings
 
 settings = DatabaseSettings()
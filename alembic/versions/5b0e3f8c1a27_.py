@@ -0,0 +1,29 @@
+"""empty message
+
+Revision ID: 5b0e3f8c1a27
+Revises: d41c7e9b2f60
+Create Date: 2026-10-18 15:20:44.118903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b0e3f8c1a27'
+down_revision: Union[str, None] = 'd41c7e9b2f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_posts_module_id_date_id', 'posts',
+                    ['module_id', sa.text('date DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_posts_date_id', 'posts', [sa.text('date DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_posts_date_id', table_name='posts')
+    op.drop_index('ix_posts_module_id_date_id', table_name='posts')
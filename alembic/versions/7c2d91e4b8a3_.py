@@ -0,0 +1,47 @@
+"""empty message
+
+Revision ID: 7c2d91e4b8a3
+Revises: 5b0e3f8c1a27
+Create Date: 2026-10-18 16:45:09.374120
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2d91e4b8a3'
+down_revision: Union[str, None] = '5b0e3f8c1a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# posts.module_id is already covered by ix_posts_module_id_date_id (revision 5b0e3f8c1a27).
+INDEXES = [
+    ('ix_days_user_id_module_id_date', 'days', ['user_id', 'module_id', 'date']),
+    ('ix_days_module_id_date', 'days', ['module_id', 'date']),
+    ('ix_actions_module_id_role', 'actions', ['module_id', 'role']),
+    ('ix_actions_user_id_role', 'actions', ['user_id', 'role']),
+    ('ix_comments_day_id', 'comments', ['day_id']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction and does not block writes.
+    # A failed run leaves an INVALID index that if_not_exists would skip, so it is dropped first.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            invalid = op.get_bind().execute(
+                sa.text("SELECT 1 FROM pg_index WHERE indexrelid = to_regclass(:name) AND NOT indisvalid"),
+                {'name': name}
+            ).scalar()
+            if invalid:
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,48 @@
+"""empty message
+
+Revision ID: a5a6b12d6a1d
+Revises: 8e84aff62f2f
+Create Date: 2026-10-18 10:12:41.204317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5a6b12d6a1d'
+down_revision: Union[str, None] = '8e84aff62f2f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('user_module_stats',
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('module_id', sa.Uuid(), nullable=False),
+    sa.Column('marks_sum', sa.Float(), nullable=False),
+    sa.Column('marks_count', sa.Integer(), nullable=False),
+    sa.Column('days_count', sa.Integer(), nullable=False),
+    sa.Column('absences', sa.Integer(), nullable=False),
+    sa.Column('last_mark_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['module_id'], ['modules.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'module_id')
+    )
+    op.execute("""
+        INSERT INTO user_module_stats (user_id, module_id, marks_sum, marks_count, days_count, absences, last_mark_at)
+        SELECT days.user_id, days.module_id,
+               COALESCE(SUM(days.mark), 0),
+               COUNT(days.mark),
+               COUNT(days.id),
+               COUNT(*) FILTER (WHERE attendance.type = 'ABSENT'),
+               MAX(days.date) FILTER (WHERE days.mark IS NOT NULL)
+        FROM days JOIN attendance ON attendance.id = days.presence_id
+        GROUP BY days.user_id, days.module_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('user_module_stats')
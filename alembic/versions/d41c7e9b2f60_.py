@@ -0,0 +1,62 @@
+"""empty message
+
+Revision ID: d41c7e9b2f60
+Revises: a5a6b12d6a1d
+Create Date: 2026-10-18 14:02:17.530841
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from repositories.blob_store import LocalBlobStore
+from settings import StorageSettings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41c7e9b2f60'
+down_revision: Union[str, None] = 'a5a6b12d6a1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+blob_store = LocalBlobStore(StorageSettings().blob_root)
+
+
+def upgrade() -> None:
+    op.add_column('images', sa.Column('digest', sa.String(length=64), nullable=True))
+    op.add_column('images', sa.Column('content_type', sa.String(length=100), nullable=True))
+    op.add_column('images', sa.Column('size', sa.Integer(), nullable=True))
+
+    connection = op.get_bind()
+    image_ids = connection.execute(sa.text("SELECT id FROM images")).scalars().all()
+    for image_id in image_ids:
+        image_data = connection.execute(sa.text("SELECT image_data FROM images WHERE id = :id"),
+                                        {'id': image_id}).scalar_one()
+        digest, size = blob_store.put_bytes(bytes(image_data))
+        connection.execute(
+            sa.text("UPDATE images SET digest = :digest, content_type = :content_type, size = :size WHERE id = :id"),
+            {'digest': digest, 'content_type': 'application/octet-stream', 'size': size, 'id': image_id})
+
+    op.alter_column('images', 'digest', nullable=False)
+    op.alter_column('images', 'content_type', nullable=False)
+    op.alter_column('images', 'size', nullable=False)
+    op.create_index(op.f('ix_images_digest'), 'images', ['digest'], unique=False)
+    op.drop_column('images', 'image_data')
+
+
+def downgrade() -> None:
+    op.add_column('images', sa.Column('image_data', sa.LargeBinary(), nullable=True))
+
+    connection = op.get_bind()
+    rows = connection.execute(sa.text("SELECT id, digest FROM images")).fetchall()
+    for image_id, digest in rows:
+        with open(blob_store.path(digest), 'rb') as file:
+            connection.execute(sa.text("UPDATE images SET image_data = :data WHERE id = :id"),
+                               {'data': file.read(), 'id': image_id})
+
+    op.alter_column('images', 'image_data', nullable=False)
+    op.drop_index(op.f('ix_images_digest'), table_name='images')
+    op.drop_column('images', 'size')
+    op.drop_column('images', 'content_type')
+    op.drop_column('images', 'digest')
@@ -5,7 +5,7 @@
 """
 
 from fastapi import APIRouter
-from api.v1 import users_routes, auth, modules, action_routes, statistics_routes, posts_routes
+from api.v1 import users_routes, auth, modules, action_routes, statistics_routes, posts_routes, metrics_routes
 
 api_v1_router = APIRouter(prefix="/v1")
 api_v1_router.include_router(users_routes.router, prefix="/users", tags=["Users"])
@@ -14,4 +14,5 @@ api_v1_router.include_router(modules.router, prefix="/modules", tags=["Modules"]
 api_v1_router.include_router(action_routes.router, prefix="/actions", tags=["Actions"])
 api_v1_router.include_router(statistics_routes.router, prefix="/statistics", tags=["Statistics"])
 api_v1_router.include_router(posts_routes.router, prefix="/posts", tags=["Posts"])
+api_v1_router.include_router(metrics_routes.router, prefix="/metrics", tags=["Metrics"])
 api_routers = [api_v1_router]
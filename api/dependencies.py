@@ -15,10 +15,13 @@ from repositories.modules import ModulesRepository
 from repositories.db import get_async_session, get_redis_session
 from repositories.posts_repository import PostsRepository
 from repositories.refresh_token import RefreshTokenRepository
+from repositories.statistics_repository import StatisticsRepository
+from repositories.user_module_stats_repository import UserModuleStatsRepository
 from repositories.users import UsersRepository
 from services.actions_service import ActionsService
 from services.auth_service import AuthService
 from services.days_service import DaysService
+from services.export_service import ExportService
 from services.modules_service import ModulesService
 from services.posts_service import PostsService
 from services.statistics_service import StatisticsService
@@ -79,7 +82,8 @@ def get_modules_service(session: AsyncSession = Depends(get_async_session)) -> M
 def get_actions_service(session: AsyncSession = Depends(get_async_session)) -> ActionsService:
 
     actions_repo = ActionsRepository(session=session)
-    return ActionsService(actions_repo=actions_repo)
+    modules_repo = ModulesRepository(session=session)
+    return ActionsService(actions_repo=actions_repo, modules_repo=modules_repo)
 
 
 def get_days_service(session: AsyncSession = Depends(get_async_session)) -> DaysService:
@@ -89,9 +93,16 @@ def get_days_service(session: AsyncSession = Depends(get_async_session)) -> Days
     return DaysService(days_repo=days_repo, actions_repo=actions_repo)
 
 
-def get_statistics_service(session: AsyncSession = Depends(get_async_session)) -> StatisticsService:
+def get_export_service(session: AsyncSession = Depends(get_async_session)) -> ExportService:
     days_repo = DaysRepository(session=session)
-    return StatisticsService(days_repo=days_repo)
+
+    return ExportService(days_repo=days_repo)
+
+
+def get_statistics_service(session: AsyncSession = Depends(get_async_session)) -> StatisticsService:
+    statistics_repo = StatisticsRepository(session=session)
+    user_module_stats_repo = UserModuleStatsRepository(session=session)
+    return StatisticsService(statistics_repo=statistics_repo, user_module_stats_repo=user_module_stats_repo)
 
 
 def get_posts_service(session: AsyncSession = Depends(get_async_session)) -> PostsService:
@@ -15,6 +15,7 @@ from starlette import status
 from constants.http_headers import HttpHeaders
 from repositories.db import get_redis_session, get_async_session
 from repositories.refresh_token import RefreshTokenRepository
+from repositories.user_cache import UserCache
 from repositories.users import UsersRepository
 from schemas.token import TokenUserNotFoundException, TokenExpiredException, TokenCorruptedException
 from schemas.users.user import UserRole, UserInfo
@@ -116,4 +117,10 @@ async def get_current_user(user: UserRole = Depends(validate_token),
     Returns:
         UserInfo: Информация о текущем пользователе.
     """
-    return await users_repo.get_user(user_id=user.user_id)
+
+    user_cache = UserCache()
+    current_user = await user_cache.get(user.user_id)
+    if current_user is None:
+        current_user = await users_repo.get_user(user_id=user.user_id)
+        await user_cache.set(current_user)
+    return current_user
@@ -1,19 +1,30 @@
 import uuid
-from typing import Annotated, List
+from datetime import datetime
+from typing import Annotated, List, Optional, Dict, Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from starlette import status
 
-from api.dependencies import get_actions_service, get_days_service
-from api.dependencies_user import get_current_user
+from api.dependencies import get_actions_service, get_days_service, get_export_service
+from api.dependencies_user import get_current_user, validate_token
+from helpers.json_response_helper import user_marks_list_serializer
+from models.user import Roles
 from schemas.actions.action_add_request import ActionAddRequest
+from schemas.cursor import CursorCorruptedException
 from schemas.days.day_add_request import DayAddRequest
+from schemas.days.day_import_result import DayImportResult
 from schemas.days.day_module import DayModule
+from schemas.days.module_gradebook import ModuleGradebook
+from schemas.exports.export_format import ExportFormat
 from schemas.modules.module_users import ModuleUsers
-from schemas.users.user import UserInfo
+from schemas.users.user import UserInfo, UserRole
 from schemas.users.user_marks import UserMarks
+from schemas.users.user_marks_page import UserMarksPage
 from services.actions_service import ActionsService
 from services.days_service import DaysService
+from services.export_service import ExportService
 
 router = APIRouter()
 
@@ -55,18 +66,40 @@ async def add_day(day: DayAddRequest, days_service: Annotated[DaysService, Depen
         pass
 
 
-@router.get('/module/{id}/marks', status_code=status.HTTP_200_OK)
-async def get_module_days(id: uuid.UUID, days_service: Annotated[DaysService, Depends(get_days_service)]):
+@router.post('/marks/bulk', status_code=status.HTTP_201_CREATED)
+async def add_days(days: Annotated[List[Dict[str, Any]], Body()],
+                   days_service: Annotated[DaysService, Depends(get_days_service)]) -> DayImportResult:
     try:
-        await days_service.get_days_by_module(id)
-    except:
-        pass
+        return await days_service.import_days(days)
+    except IntegrityError as error:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail="Marks reference unknown users or modules") from error
+
+
+@router.post('/marks/bulk/csv', status_code=status.HTTP_201_CREATED)
+async def add_days_csv(request: Request,
+                       days_service: Annotated[DaysService, Depends(get_days_service)]) -> DayImportResult:
+    try:
+        content = (await request.body()).decode('utf-8-sig')
+        return await days_service.import_days_csv(content)
+    except UnicodeDecodeError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="CSV must be UTF-8 encoded") from error
+    except IntegrityError as error:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail="Marks reference unknown users or modules") from error
+
+
+@router.get('/module/{id}/marks', status_code=status.HTTP_200_OK)
+async def get_module_days(id: uuid.UUID, days_service: Annotated[DaysService, Depends(get_days_service)]
+                          ) -> ModuleGradebook:
+    return await days_service.get_days_by_module(id)
 
 
 @router.get('/user/{id}/marks', status_code=status.HTTP_200_OK)
 async def get_user_days(id: uuid.UUID, days_service: Annotated[DaysService, Depends(get_days_service)]) -> List[UserMarks]:
     try:
-        return await days_service.get_days_by_user(id)
+        return user_marks_list_serializer.response(await days_service.get_days_by_user(id))
     except:
         pass
 
@@ -74,13 +107,55 @@ async def get_user_days(id: uuid.UUID, days_service: Annotated[DaysService, Depe
 @router.get('/users/marks', status_code=status.HTTP_200_OK)
 async def get_users_days(days_service: Annotated[DaysService, Depends(get_days_service)]) -> List[UserMarks]:
     try:
-        return await days_service.get_days_users()
+        return user_marks_list_serializer.response(await days_service.get_days_users())
     except:
         pass
 
+
+@router.get('/users/marks/page', status_code=status.HTTP_200_OK)
+async def get_users_days_page(days_service: Annotated[DaysService, Depends(get_days_service)],
+                              limit: int = Query(default=100, ge=1, le=1000),
+                              cursor: Optional[str] = None) -> UserMarksPage:
+    try:
+        return await days_service.get_days_users_page(limit=limit, cursor=cursor)
+    except CursorCorruptedException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="Cursor is corrupted") from error
+
+
+@router.get('/users/marks/stream', status_code=status.HTTP_200_OK)
+async def stream_users_days(days_service: Annotated[DaysService, Depends(get_days_service)]) -> StreamingResponse:
+
+    async def to_ndjson():
+        async for user_marks in days_service.stream_days_users():
+            yield user_marks.model_dump_json() + '\n'
+
+    return StreamingResponse(to_ndjson(), media_type='application/x-ndjson')
+
+
+@router.get('/marks/export', status_code=status.HTTP_200_OK)
+async def export_days(export_service: Annotated[ExportService, Depends(get_export_service)],
+                      current_user: UserRole = Depends(validate_token),
+                      format: ExportFormat = ExportFormat.PARQUET,
+                      module_id: Optional[uuid.UUID] = None,
+                      date_from: Optional[datetime] = None,
+                      date_to: Optional[datetime] = None,
+                      teacher_id: Optional[uuid.UUID] = None) -> StreamingResponse:
+    if current_user.role == Roles.STUDENT.value:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                            detail="Export is only allowed for teachers and admins")
+    if current_user.role == Roles.TEACHER.value:
+        teacher_id = uuid.UUID(str(current_user.user_id))
+
+    content = export_service.export_marks(format, module_id=module_id, date_from=date_from, date_to=date_to,
+                                          teacher_id=teacher_id)
+    return StreamingResponse(content, media_type=format.media_type,
+                             headers={'Content-Disposition': f'attachment; filename="marks.{format.extension}"'})
+
+
 @router.get('/users/marks/{teacher_id}', status_code=status.HTTP_200_OK)
 async def get_users_days_by_teacher_id(teacher_id: uuid.UUID, days_service: Annotated[DaysService, Depends(get_days_service)]) -> List[UserMarks]:
     try:
-        return await days_service.get_days_by_teacher(teacher_id=teacher_id)
+        return user_marks_list_serializer.response(await days_service.get_days_by_teacher(teacher_id=teacher_id))
     except:
         pass
\ No newline at end of file
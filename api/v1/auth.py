@@ -123,6 +123,33 @@ async def logout_user(auth_service: Annotated[AuthService, Depends(get_auth_serv
                             headers=auth_service.http_headers.WWW_AUTHENTICATE_BEARER) from error
 
 
+@router.post("/logout-all", status_code=status.HTTP_200_OK)
+async def logout_everywhere(auth_service: Annotated[AuthService, Depends(get_auth_service)], response: Response,
+                            refresh_token: Annotated[str | None, Cookie()] = None) -> Response:
+    """
+    Заканчивает все сессии пользователя на всех устройствах.
+
+        :param auth_service: Сервис для работы с авторизациями.
+        :param refresh_token: Токен обновления пользователя из куки.
+        :return: Код статуса HTTP 200 OK при успешном выходе из всех сессий.
+        :raise: HTTPException: HTTP 401 Unauthorized, если токен обновления не найден или его срок действия истёк.
+    """
+
+    try:
+        await auth_service.logout_everywhere(refresh_token)
+        response.delete_cookie('refresh_token')
+        response.status_code = 200
+        return response
+    except TokenRefreshNotFoundException as error:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
+                            detail="Token not found, log in again",
+                            headers=auth_service.http_headers.WWW_AUTHENTICATE_BEARER) from error
+    except TokenExpiredException as error:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
+                            detail="Token has expired, log in again",
+                            headers=auth_service.http_headers.WWW_AUTHENTICATE_BEARER) from error
+
+
 @router.post("/refresh", status_code=status.HTTP_200_OK)
 async def refresh(auth_service: Annotated[AuthService, Depends(get_auth_service)],
                   response: Response,
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, HTTPException
+from starlette import status
+
+from api.dependencies_user import validate_token
+from models.user import Roles
+from repositories.db import engine
+from repositories.db_metrics import database_metrics
+from schemas.metrics.database_metrics import DatabaseMetrics
+from schemas.users.user import UserRole
+
+router = APIRouter()
+
+
+@router.get('/db', status_code=status.HTTP_200_OK)
+async def get_database_metrics(current_user: UserRole = Depends(validate_token)) -> DatabaseMetrics:
+    if current_user.role != Roles.ADMIN.value:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                            detail="Metrics are only allowed for admins")
+    return database_metrics.snapshot(engine)
@@ -1,15 +1,21 @@
 import uuid
-from typing import List, Union
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from starlette import status
 
 from api.dependencies import get_posts_service
+from helpers.json_response_helper import post_info_list_serializer
+from schemas.cursor import CursorCorruptedException
 from schemas.posts.post_add_request import PostAddRequest
 from schemas.posts.post_info import PostInfo
+from schemas.posts.posts_page import PostsPage
 from services.posts_service import PostsService
+from settings import FeedSettings
 
 router = APIRouter()
+feed_settings = FeedSettings()
 
 
 @router.post('/add', status_code=status.HTTP_201_CREATED)
@@ -23,14 +29,58 @@ async def add_post(post_add: PostAddRequest, posts_service: PostsService = Depen
 @router.get('/{module_id}/feed', status_code=status.HTTP_200_OK)
 async def get_posts(module_id: uuid.UUID, posts_service: PostsService = Depends(get_posts_service)) -> Union[List[PostInfo]]:
     try:
-        return await posts_service.get_posts_by_module(module_id)
+        return post_info_list_serializer.response(await posts_service.get_posts_by_module(module_id))
     except:
         pass
 
 
-@router.get('/all', status_code=status.HTTP_200_OK)
+@router.get('/all', status_code=status.HTTP_200_OK, response_model=List[PostInfo])
 async def get_all_posts(posts_service: PostsService = Depends(get_posts_service)):
     try:
-        return await posts_service.get_all_posts()
+        return post_info_list_serializer.response(await posts_service.get_all_posts())
     except:
         pass
+
+
+@router.get('/{module_id}/feed/page', status_code=status.HTTP_200_OK)
+async def get_posts_page(module_id: uuid.UUID, posts_service: PostsService = Depends(get_posts_service),
+                         limit: int = Query(default=20, ge=1, le=100),
+                         cursor: Optional[str] = None) -> PostsPage:
+    try:
+        return await posts_service.get_posts_page(limit=limit, cursor=cursor, module_id=module_id)
+    except CursorCorruptedException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="Cursor is corrupted") from error
+
+
+@router.get('/all/page', status_code=status.HTTP_200_OK)
+async def get_all_posts_page(posts_service: PostsService = Depends(get_posts_service),
+                             limit: int = Query(default=20, ge=1, le=100),
+                             cursor: Optional[str] = None) -> PostsPage:
+    try:
+        return await posts_service.get_posts_page(limit=limit, cursor=cursor)
+    except CursorCorruptedException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="Cursor is corrupted") from error
+
+
+@router.get('/{module_id}/events', status_code=status.HTTP_200_OK)
+async def stream_posts(module_id: uuid.UUID, posts_service: PostsService = Depends(get_posts_service),
+                       last_event_id: Optional[str] = Header(default=None)) -> StreamingResponse:
+    try:
+        posts = posts_service.stream_module_posts(module_id, last_event_id=last_event_id)
+    except CursorCorruptedException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="Last-Event-ID is corrupted") from error
+
+    async def to_event_stream():
+        yield f"retry: {feed_settings.feed_retry_ms}\n\n"
+        async for event in posts:
+            if event is None:
+                yield ": ping\n\n"
+                continue
+            event_id, post = event
+            yield f"id: {event_id}\nevent: post\ndata: {post.model_dump_json()}\n\n"
+
+    return StreamingResponse(to_event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
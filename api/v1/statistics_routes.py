@@ -1,17 +1,54 @@
 import uuid
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends
 from starlette import status
 
 from api.dependencies import get_statistics_service
+from schemas.statistics.marks_statistics import MarksStatistics
+from schemas.statistics.statistics_group import TimeBucket
+from schemas.statistics.user_module_stats import UserModuleStats
 from services.statistics_service import StatisticsService
 
 router = APIRouter()
 
 
 @router.get('/average/{user_id}', status_code=status.HTTP_200_OK)
-async def get_user_average(user_id: uuid.UUID, statistics_service: StatisticsService = Depends(get_statistics_service)) -> float:
+async def get_user_average(user_id: uuid.UUID, statistics_service: StatisticsService = Depends(get_statistics_service)) -> Optional[float]:
     try:
         return await statistics_service.get_user_statistics(user_id)
     except:
-        pass
\ No newline at end of file
+        pass
+
+
+@router.get('/user/{user_id}/summary', status_code=status.HTTP_200_OK)
+async def get_user_summary(user_id: uuid.UUID, statistics_service: StatisticsService = Depends(get_statistics_service)
+                           ) -> List[UserModuleStats]:
+    return await statistics_service.get_user_module_summary(user_id)
+
+
+@router.get('/module/{module_id}/summary', status_code=status.HTTP_200_OK)
+async def get_module_summary(module_id: uuid.UUID, statistics_service: StatisticsService = Depends(get_statistics_service)
+                             ) -> List[UserModuleStats]:
+    return await statistics_service.get_module_summary(module_id)
+
+
+@router.get('/module/{module_id}', status_code=status.HTTP_200_OK)
+async def get_module_statistics(module_id: uuid.UUID, bucket: Optional[TimeBucket] = None,
+                                statistics_service: StatisticsService = Depends(get_statistics_service)
+                                ) -> List[MarksStatistics]:
+    return await statistics_service.get_module_statistics(module_id, bucket=bucket)
+
+
+@router.get('/module/{module_id}/cohort', status_code=status.HTTP_200_OK)
+async def get_cohort_statistics(module_id: uuid.UUID, bucket: Optional[TimeBucket] = None,
+                                statistics_service: StatisticsService = Depends(get_statistics_service)
+                                ) -> List[MarksStatistics]:
+    return await statistics_service.get_cohort_statistics(module_id, bucket=bucket)
+
+
+@router.get('/teacher/{teacher_id}', status_code=status.HTTP_200_OK)
+async def get_teacher_statistics(teacher_id: uuid.UUID, bucket: Optional[TimeBucket] = None,
+                                 statistics_service: StatisticsService = Depends(get_statistics_service)
+                                 ) -> List[MarksStatistics]:
+    return await statistics_service.get_teacher_statistics(teacher_id, bucket=bucket)
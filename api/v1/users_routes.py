@@ -1,20 +1,27 @@
 import uuid
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
 
 from api.dependencies import get_users_service
 from api.dependencies_user import get_current_user, validate_token
+from helpers.http_cache_helper import HttpCacheHelper
+from helpers.json_response_helper import user_list_serializer
+from helpers.multipart_helper import MultipartFileReader
 from models.user import Roles
-from schemas.images.image_add_request import ImageAddRequest
+from schemas.images.image_info import ImageInfo, ImageNotFoundException, ImageSizeNotAllowedException, \
+    ImageTooLargeException, ImageTypeNotAllowedException, MultipartInvalidException, RangeNotSatisfiableException
 
 from schemas.users.user import UserListResponse, UserNotFoundException, \
     UsersNotFoundException, UserInfo, RoleNotFoundException, \
     UserRole, UserUpdateRequest, UserExistsException
 
 from services.users_service import UsersService
+from settings import StorageSettings
 
 router = APIRouter()
+storage_settings = StorageSettings()
 
 
 @router.get("/me", status_code=status.HTTP_200_OK)
@@ -29,7 +36,7 @@ async def get_all_users(user_service: Annotated[UsersService, Depends(get_users_
         if current_user.role != Roles.ADMIN.value:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                                 detail="The list of users only allowed for admins")
-        return await user_service.get_users()
+        return user_list_serializer.response(await user_service.get_users())
     except UsersNotFoundException as error:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
                             detail="Users not found" + str(error)) from error
@@ -93,6 +100,47 @@ async def get_user(user_id: uuid.UUID, user_service: Annotated[UsersService, Dep
                             detail="User not found" + str(error)) from error
 
 
+@router.get("/{user_id}/image", status_code=status.HTTP_200_OK)
+async def get_user_image(user_id: uuid.UUID, request: Request,
+                         user_service: Annotated[UsersService, Depends(get_users_service)],
+                         size: Optional[int] = None) -> Response:
+    try:
+        image = await user_service.get_user_image(user_id=user_id, size=size)
+    except ImageNotFoundException as error:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                            detail="Image not found") from error
+    except ImageSizeNotAllowedException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"Allowed sizes: {storage_settings.image_thumbnail_sizes}") from error
+
+    etag = HttpCacheHelper.etag(image.digest, image.variant)
+    headers = {
+        'ETag': etag,
+        'Cache-Control': f'public, max-age={storage_settings.image_cache_max_age}',
+        'Accept-Ranges': 'bytes'
+    }
+    if HttpCacheHelper.none_match(request.headers.get('if-none-match'), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    try:
+        byte_range = HttpCacheHelper.parse_range(request.headers.get('range'), request.headers.get('if-range'),
+                                                 etag, image.size)
+    except RangeNotSatisfiableException:
+        return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                        headers={**headers, 'Content-Range': f'bytes */{image.size}'})
+
+    if byte_range is None:
+        path = user_service.image_path(image)
+        if path:
+            return FileResponse(path, media_type=image.content_type, headers=headers)
+        return StreamingResponse(user_service.read_image(image), media_type=image.content_type,
+                                 headers={**headers, 'Content-Length': str(image.size)})
+    start, end = byte_range
+    headers.update({'Content-Range': f'bytes {start}-{end}/{image.size}', 'Content-Length': str(end - start + 1)})
+    return StreamingResponse(user_service.read_image(image, start=start, length=end - start + 1),
+                             status_code=status.HTTP_206_PARTIAL_CONTENT, media_type=image.content_type,
+                             headers=headers)
+
+
 @router.put("/", status_code=status.HTTP_200_OK)
 async def update_user(update_user_: UserUpdateRequest,
                       user_service: Annotated[UsersService, Depends(get_users_service)], current_user: UserInfo = Depends(get_current_user)):
@@ -105,12 +153,49 @@ async def update_user(update_user_: UserUpdateRequest,
                             detail="User exists" + str(exc)) from exc
 
 
-@router.put('/image', status_code=status.HTTP_200_OK)
-async def update_user_image(image_add_request: ImageAddRequest,user_service: Annotated[UsersService, Depends(get_users_service)]):
+def _limit_upload_size(request: Request) -> None:
+    content_length = request.headers.get('content-length')
+    if content_length and content_length.isdigit() \
+            and int(content_length) > storage_settings.image_max_size + storage_settings.upload_chunk_size:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail="Image is too large")
+
+
+IMAGE_UPLOAD_BODY = {
+    'requestBody': {
+        'required': True,
+        'content': {
+            'multipart/form-data': {
+                'schema': {
+                    'type': 'object',
+                    'required': ['file'],
+                    'properties': {'file': {'type': 'string', 'format': 'binary'}}
+                }
+            }
+        }
+    }
+}
+
+
+@router.put('/image', status_code=status.HTTP_200_OK, dependencies=[Depends(_limit_upload_size)],
+            openapi_extra=IMAGE_UPLOAD_BODY)
+async def update_user_image(request: Request, user_service: Annotated[UsersService, Depends(get_users_service)],
+                            current_user: UserInfo = Depends(get_current_user)) -> ImageInfo:
     try:
-        await user_service.add_image(image_add_request=image_add_request)
-    except:
-        pass
+        upload = MultipartFileReader(request.headers.get('content-type', ''), request.stream())
+        await upload.open('file')
+        return await user_service.set_user_image(user_id=current_user.id, name=upload.filename or 'image',
+                                                 content_type=upload.content_type or '',
+                                                 chunks=upload.chunks())
+    except MultipartInvalidException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="Expected a multipart/form-data body with a file field") from error
+    except ImageTypeNotAllowedException as error:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                            detail="Only images are allowed") from error
+    except ImageTooLargeException as error:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail="Image is too large") from error
 
 @router.delete('/{user_id}', status_code=status.HTTP_200_OK)
 async def delete_user(user_id: uuid.UUID, user_service: Annotated[UsersService, Depends(get_users_service)],
@@ -0,0 +1,127 @@
+"""
+Модуль json_benchmark
+
+Сравнивает время ответа списочных эндпоинтов до и после быстрой сериализации
+на синтетических строках без базы данных.
+
+"before" повторяет прежний путь: модели создаются с валидацией, затем FastAPI проверяет
+их по response_model и кодирует json.dumps. "after" создает модели из строк без валидации
+и кодирует их заранее собранным сериализатором.
+
+Usage:
+    python -m commands.json_benchmark
+    python -m commands.json_benchmark --users 2000 --marks 50 --number 5
+"""
+
+import argparse
+import asyncio
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from helpers.json_response_helper import FastJSONResponse, user_marks_list_serializer, post_info_list_serializer
+from models.attendance import AttendanceTypes
+from models.type_of_mark import MarkTypes
+from models.user import Roles
+from schemas.days.day_info import DayInfo
+from schemas.modules.module_info import ModuleInfo
+from schemas.posts.post_info import PostInfo
+from schemas.users.user import UserInfo
+from schemas.users.user_marks import UserMarks
+
+
+def _marks(users: int, marks: int) -> List[SimpleNamespace]:
+    modules = [(uuid.uuid4(), f'Module {i}') for i in range(10)]
+    start = datetime(2024, 1, 1)
+    rows = []
+    for user in range(users):
+        user_id = uuid.uuid4()
+        for mark in range(marks):
+            module_id, module_title = modules[mark % len(modules)]
+            rows.append(SimpleNamespace(
+                user_id=user_id, first_name=f'Name{user}', last_name=f'Surname{user}', id=uuid.uuid4(),
+                presence=AttendanceTypes.PRESENT, type_of_mark=MarkTypes.LABMARK, mark=float(mark % 5 + 1),
+                module_id=module_id, module_title=module_title, date=start + timedelta(days=mark)
+            ))
+    return rows
+
+
+def _users_marks(rows: List[SimpleNamespace], construct: bool) -> List[UserMarks]:
+    user_marks_model = UserMarks.model_construct if construct else UserMarks
+    day_info_model = DayInfo.model_construct if construct else DayInfo
+    users_marks = {}
+    for row in rows:
+        user_marks = users_marks.get(row.user_id)
+        if user_marks is None:
+            user_marks = users_marks[row.user_id] = user_marks_model(
+                id=row.user_id, first_name=row.first_name, last_name=row.last_name, days=[])
+        user_marks.days.append(day_info_model(
+            id=row.id, presence=row.presence, type_of_mark=row.type_of_mark, mark=row.mark, user_id=row.user_id,
+            module_id=row.module_id, module_title=row.module_title, date=row.date))
+    return list(users_marks.values())
+
+
+def _posts(count: int, construct: bool) -> List[PostInfo]:
+    post_model = PostInfo.model_construct if construct else PostInfo
+    user_model = UserInfo.model_construct if construct else UserInfo
+    module_model = ModuleInfo.model_construct if construct else ModuleInfo
+    authors = [user_model(id=uuid.uuid4(), first_name='Teacher', last_name=f'Surname{i}',
+                          phone_number=f'+7999000{i:04d}', city='Moscow', address='Main street 1',
+                          email=f'teacher{i}@example.com', role=Roles.TEACHER) for i in range(20)]
+    modules = [module_model(id=uuid.uuid4(), title=f'Module {i}', alias=f'm{i}', hours_taught=72)
+               for i in range(10)]
+    start = datetime(2024, 1, 1)
+    return [post_model(id=uuid.uuid4(), title=f'Post {i}', text='Lorem ipsum dolor sit amet. ' * 10,
+                       date=start + timedelta(minutes=i), author=authors[i % len(authors)],
+                       module=modules[i % len(modules)]) for i in range(count)]
+
+
+def _before(response_type, build: Callable[[], list]) -> Callable[[], bytes]:
+    field = create_response_field(name='response', type_=response_type)
+
+    def run() -> bytes:
+        content = asyncio.run(serialize_response(field=field, response_content=build()))
+        return JSONResponse(content).body
+
+    return run
+
+
+def _measure(name: str, before: Callable[[], bytes], after: Callable[[], bytes], number: int) -> None:
+    before_s = timeit.timeit(before, number=number) / number
+    after_s = timeit.timeit(after, number=number) / number
+    print(f"{name:<12} before {before_s * 1000:>9.1f} ms   after {after_s * 1000:>9.1f} ms   "
+          f"x{before_s / after_s:.1f}   {len(after()) // 1024} KiB")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure list endpoint serialization before/after fast JSON.")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--marks", type=int, default=40)
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = _marks(args.users, args.marks)
+    _measure("users/marks",
+             _before(List[UserMarks], lambda: _users_marks(rows, construct=False)),
+             lambda: user_marks_list_serializer.response(_users_marks(rows, construct=True)).body,
+             args.number)
+    _measure("posts/all",
+             _before(List[PostInfo], lambda: _posts(args.posts, construct=False)),
+             lambda: post_info_list_serializer.response(_posts(args.posts, construct=True)).body,
+             args.number)
+    print(f"{'render':<12} JSONResponse vs FastJSONResponse for a plain dict:")
+    payload = {'items': [{'id': str(uuid.uuid4()), 'value': i, 'name': f'item {i}'} for i in range(50000)]}
+    _measure("dict", lambda: JSONResponse(payload).body, lambda: FastJSONResponse(payload).body, args.number)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
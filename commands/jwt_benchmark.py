@@ -0,0 +1,52 @@
+"""
+Модуль jwt_benchmark
+
+Измеряет скорость подписи и проверки токенов для каждого алгоритма подписи.
+Ключ ES256 генерируется на время запуска, настройки приложения не используются.
+
+Usage:
+    python -m commands.jwt_benchmark
+    python -m commands.jwt_benchmark --number 20000
+"""
+
+import argparse
+import sys
+import time
+import timeit
+import uuid
+
+from ecdsa import SigningKey, NIST256p
+
+from services.jwt_signers import JwtSigner, HmacJwtSigner, EcdsaJwtSigner
+
+
+def _claims() -> dict:
+    return {
+        'token_id': str(uuid.uuid4()),
+        'role': 'student',
+        'user_id': str(uuid.uuid4()),
+        'exp': int(time.time()) + 3600
+    }
+
+
+def _measure(name: str, signer: JwtSigner, number: int) -> None:
+    claims = _claims()
+    token = signer.encode(claims)
+    encode_s = timeit.timeit(lambda: signer.encode(claims), number=number)
+    decode_s = timeit.timeit(lambda: signer.decode(token), number=number)
+    print(f"{name:<6} encode {number / encode_s:>10.0f} ops/s   decode {number / decode_s:>10.0f} ops/s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure JWT sign/verify throughput per signing backend.")
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    pem = SigningKey.generate(curve=NIST256p).to_pem().decode()
+    _measure("HS256", HmacJwtSigner(uuid.uuid4().hex), args.number)
+    _measure("ES256", EcdsaJwtSigner({'bench': pem}, 'bench'), args.number)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Модуль marks_benchmark
+
+Сравнивает прежний и текущий запросы оценок на синтетических данных в базе данных.
+
+Команда заполняет таблицы users, modules, actions и days в одной транзакции,
+обновляет статистику планировщика, замеряет запросы и откатывает транзакцию,
+поэтому в базе данных ничего не остается. Нужна база с примененными миграциями:
+справочники attendance и type_of_mark берутся из нее.
+
+Usage:
+    python -m commands.marks_benchmark teacher
+    python -m commands.marks_benchmark module-user
+    python -m commands.marks_benchmark teacher --days 1000000 --number 3
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Sized
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from models.action import ActionDao
+from models.day import DayDao
+from models.user import UserDao, Roles
+from repositories.days_repository import DaysRepository
+from schemas.days.day_info import DayInfo
+from repositories.db import async_session_maker
+
+SEED_STATEMENTS = [
+    """
+    INSERT INTO users (id, first_name, last_name, phone_number, city, address, email, password_hash, role)
+    SELECT gen_random_uuid(), 'Bench', 'Student ' || g, 'bs' || g, 'Bench', 'Bench street',
+           'bench-student-' || g || '@example.com', '', 'STUDENT'::roles
+    FROM generate_series(1, :students) AS g
+    """,
+    """
+    INSERT INTO users (id, first_name, last_name, phone_number, city, address, email, password_hash, role)
+    SELECT gen_random_uuid(), 'Bench', 'Teacher ' || g, 'bt' || g, 'Bench', 'Bench street',
+           'bench-teacher-' || g || '@example.com', '', 'TEACHER'::roles
+    FROM generate_series(1, :teachers) AS g
+    """,
+    """
+    INSERT INTO modules (id, title, alias, hours_taught)
+    SELECT gen_random_uuid(), 'Bench module ' || g, 'bm' || g, 72
+    FROM generate_series(1, :modules) AS g
+    """,
+    """
+    INSERT INTO actions (id, user_id, module_id, role)
+    SELECT gen_random_uuid(), t.ids[1 + m.n % array_length(t.ids, 1)], m.id, 'TEACHER'::roles
+    FROM (SELECT id, row_number() OVER () AS n FROM modules WHERE title LIKE 'Bench module %') AS m,
+         (SELECT array_agg(id) AS ids FROM users WHERE email LIKE 'bench-teacher-%') AS t
+    """,
+    """
+    INSERT INTO days (id, presence_id, type_of_mark_id, mark, date, user_id, module_id)
+    SELECT gen_random_uuid(), a.ids[1 + g % array_length(a.ids, 1)], k.ids[1 + g % array_length(k.ids, 1)],
+           g % 5 + 1, timestamp '2024-01-01' + (g % 365) * interval '1 day',
+           s.ids[1 + g % array_length(s.ids, 1)], m.ids[1 + (g / 7) % array_length(m.ids, 1)]
+    FROM generate_series(1, :days) AS g,
+         (SELECT array_agg(id) AS ids FROM users WHERE email LIKE 'bench-student-%') AS s,
+         (SELECT array_agg(id) AS ids FROM modules WHERE title LIKE 'Bench module %') AS m,
+         (SELECT array_agg(id) AS ids FROM attendance) AS a,
+         (SELECT array_agg(id) AS ids FROM type_of_mark) AS k
+    """,
+    "ANALYZE users",
+    "ANALYZE modules",
+    "ANALYZE actions",
+    "ANALYZE days"
+]
+
+
+async def _seed(session: AsyncSession, args: argparse.Namespace) -> None:
+    params = {'students': args.students, 'teachers': args.teachers, 'modules': args.modules, 'days': args.days}
+    for statement in SEED_STATEMENTS:
+        await session.execute(text(statement), params)
+
+
+async def _measure(name: str, session: AsyncSession, query: Callable[[], Awaitable[Sized]], number: int) -> None:
+    timings = []
+    for _ in range(number):
+        session.expunge_all()
+        started = time.perf_counter()
+        result = await query()
+        timings.append(time.perf_counter() - started)
+    print(f"{name:<8} best {min(timings) * 1000:>9.1f} ms   mean {sum(timings) / number * 1000:>9.1f} ms   "
+          f"{len(result)} items")
+
+
+async def _legacy_teacher_marks(session: AsyncSession, teacher_id: uuid.UUID) -> List[List[DayDao]]:
+    """
+    Прежний путь: все пользователи со всеми оценками, фильтр модулей в Python.
+    """
+
+    module_ids = (await session.execute(
+        select(ActionDao.module_id).filter(ActionDao.user_id == teacher_id, ActionDao.role == Roles.TEACHER)
+    )).scalars().all()
+    users = (await session.execute(
+        select(UserDao).options(selectinload(UserDao.days).options(
+            selectinload(DayDao.module), selectinload(DayDao.type_of_mark), selectinload(DayDao.presence)))
+    )).scalars().all()
+    return [[day for day in user.days if day.module_id in module_ids] for user in users]
+
+
+async def teacher(session: AsyncSession, number: int) -> None:
+    teacher_id = (await session.execute(text(
+        "SELECT user_id FROM actions WHERE user_id IN "
+        "(SELECT id FROM users WHERE email LIKE 'bench-teacher-%') LIMIT 1"
+    ))).scalar_one()
+    days_repo = DaysRepository(session=session)
+    await _measure("before", session, lambda: _legacy_teacher_marks(session, teacher_id), number)
+    await _measure("after", session, lambda: days_repo.get_days_by_teacher_id(teacher_id), number)
+
+
+async def _legacy_module_user_marks(session: AsyncSession, user_id: uuid.UUID,
+                                    module_id: uuid.UUID) -> List[DayInfo]:
+    """
+    Прежний путь: `(user) and (module)` в filter оставлял только условие по пользователю,
+    поэтому читались оценки пользователя по всем модулям со связанными строками.
+    """
+
+    days = (await session.execute(
+        select(DayDao).filter(DayDao.user_id == user_id).options(
+            selectinload(DayDao.module), selectinload(DayDao.type_of_mark), selectinload(DayDao.presence))
+    )).scalars().all()
+    return [DayInfo(id=day.id, presence=day.presence.type, type_of_mark=day.type_of_mark.type_of_mark,
+                    mark=day.mark, user_id=day.user_id, module_id=day.module_id, module_title=day.module.title,
+                    date=day.date) for day in days]
+
+
+async def module_user(session: AsyncSession, number: int) -> None:
+    user_id, module_id = (await session.execute(text(
+        "SELECT user_id, module_id FROM days WHERE user_id IN "
+        "(SELECT id FROM users WHERE email LIKE 'bench-student-%') LIMIT 1"
+    ))).one()
+    days_repo = DaysRepository(session=session)
+    await _measure("before", session, lambda: _legacy_module_user_marks(session, user_id, module_id), number)
+    await _measure("after", session, lambda: days_repo.get_days_by_module_user(user_id, module_id), number)
+
+
+SCENARIOS: Dict[str, Callable[[AsyncSession, int], Awaitable[None]]] = {
+    'teacher': teacher,
+    'module-user': module_user
+}
+
+
+async def run(args: argparse.Namespace) -> int:
+    async with async_session_maker() as session:
+        started = time.perf_counter()
+        await _seed(session, args)
+        print(f"seeded {args.days} days in {time.perf_counter() - started:.1f} s")
+        try:
+            await SCENARIOS[args.scenario](session, args.number)
+        finally:
+            await session.rollback()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare mark queries on a seeded days table.")
+    parser.add_argument("scenario", choices=list(SCENARIOS))
+    parser.add_argument("--days", type=int, default=1_000_000)
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--teachers", type=int, default=50)
+    parser.add_argument("--modules", type=int, default=200)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+Модуль statistics_rollup
+
+Команда обслуживания таблицы user_module_stats.
+
+Usage:
+    python -m commands.statistics_rollup rebuild
+    python -m commands.statistics_rollup check
+"""
+
+import argparse
+import asyncio
+import sys
+
+from repositories.db import async_session_maker
+from repositories.user_module_stats_repository import UserModuleStatsRepository
+
+
+async def rebuild() -> int:
+    async with async_session_maker() as session:
+        await UserModuleStatsRepository(session=session).rebuild()
+    print("user_module_stats rebuilt")
+    return 0
+
+
+async def check() -> int:
+    async with async_session_maker() as session:
+        inconsistencies = await UserModuleStatsRepository(session=session).find_inconsistencies()
+    for user_id, module_id in inconsistencies:
+        print(f"user_id={user_id} module_id={module_id} differs from recompute")
+    print(f"{len(inconsistencies)} inconsistent rows")
+    return 1 if inconsistencies else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Maintain the user_module_stats rollup table.")
+    parser.add_argument("command", choices=["rebuild", "check"])
+    args = parser.parse_args()
+    command = rebuild if args.command == "rebuild" else check
+    return asyncio.run(command())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
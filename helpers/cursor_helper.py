@@ -0,0 +1,62 @@
+"""
+Модуль CursorHelper
+
+Этот модуль предоставляет класс `CursorHelper` для кодирования и декодирования
+непрозрачных курсоров keyset-пагинации.
+
+Классы:
+    CursorHelper: Утилита для работы с курсорами пагинации.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, List
+
+from schemas.cursor import CursorCorruptedException
+
+
+class CursorHelper:
+    """
+    Кодирует значения ключа последней записи страницы в строку и обратно.
+    """
+
+    @staticmethod
+    def encode(*values: Any) -> str:
+        """
+        Кодирует значения ключа в курсор.
+
+        Args:
+            values (Any): Значения ключа последней записи страницы.
+
+        Returns:
+            str: Непрозрачный курсор.
+        """
+
+        raw = json.dumps([str(value) for value in values])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode(cursor: str, size: int) -> List[str]:
+        """
+        Декодирует курсор в строковые значения ключа.
+
+        Args:
+            cursor (str): Курсор, полученный от клиента.
+            size (int): Ожидаемое количество значений в ключе.
+
+        Returns:
+            List[str]: Значения ключа.
+
+        Raises:
+            CursorCorruptedException: Если курсор поврежден.
+        """
+
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValueError) as exc:
+            raise CursorCorruptedException from exc
+        if not isinstance(values, list) or len(values) != size \
+                or not all(isinstance(value, str) for value in values):
+            raise CursorCorruptedException
+        return values
@@ -0,0 +1,97 @@
+"""
+Модуль HttpCacheHelper
+
+Этот модуль предоставляет класс `HttpCacheHelper` для условных запросов и запросов
+диапазонов байт (RFC 9110).
+
+Классы:
+    HttpCacheHelper: Утилита для работы с заголовками ETag, If-None-Match, If-Range и Range.
+"""
+
+import re
+from typing import Optional, Tuple
+
+from schemas.images.image_info import RangeNotSatisfiableException
+
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class HttpCacheHelper:
+    """
+    Проверяет условные заголовки запроса и разбирает заголовок Range.
+    """
+
+    @staticmethod
+    def etag(digest: str, variant: Optional[str] = None) -> str:
+        """
+        Строгий ETag по хэшу содержимого.
+
+        Args:
+            digest (str): Хэш содержимого.
+            variant (Optional[str]): Имя производного файла.
+
+        Returns:
+            str: Значение заголовка ETag.
+        """
+
+        return f'"{digest}.{variant}"' if variant else f'"{digest}"'
+
+    @staticmethod
+    def none_match(if_none_match: Optional[str], etag: str) -> bool:
+        """
+        Проверяет, совпадает ли ETag с одним из значений If-None-Match (слабое сравнение).
+
+        Args:
+            if_none_match (Optional[str]): Значение заголовка If-None-Match.
+            etag (str): Текущий ETag.
+
+        Returns:
+            bool: True, если клиент уже имеет актуальную версию и можно ответить 304.
+        """
+
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == '*':
+            return True
+        tags = (tag.strip().removeprefix('W/') for tag in if_none_match.split(','))
+        return etag in tags
+
+    @staticmethod
+    def parse_range(range_header: Optional[str], if_range: Optional[str], etag: str,
+                    size: int) -> Optional[Tuple[int, int]]:
+        """
+        Разбирает заголовок Range с одним диапазоном.
+
+        Несколько диапазонов, неизвестные единицы и If-Range с другим ETag
+        игнорируются, в этих случаях отдается весь файл.
+
+        Args:
+            range_header (Optional[str]): Значение заголовка Range.
+            if_range (Optional[str]): Значение заголовка If-Range.
+            etag (str): Текущий ETag.
+            size (int): Размер файла в байтах.
+
+        Returns:
+            Optional[Tuple[int, int]]: Первый и последний байт диапазона включительно или None.
+
+        Raises:
+            RangeNotSatisfiableException: Если диапазон лежит за пределами файла.
+        """
+
+        if not range_header or (if_range and if_range.strip() != etag):
+            return None
+        match = RANGE_PATTERN.match(range_header.strip())
+        if not match or match.group(1) == match.group(2) == '':
+            return None
+        first, last = match.groups()
+        if first == '':
+            length = int(last)
+            if length == 0 or size == 0:
+                raise RangeNotSatisfiableException
+            return max(size - length, 0), size - 1
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        if start >= size:
+            raise RangeNotSatisfiableException
+        return start, min(int(last), size - 1) if last else size - 1
@@ -0,0 +1,72 @@
+"""
+Модуль JsonResponseHelper
+
+Этот модуль предоставляет быстрый JSON-ответ и заранее собранные сериализаторы
+для больших списков.
+
+FastJSONResponse кодирует ответ сериализатором pydantic-core вместо json.dumps
+и используется приложением по умолчанию. Обработчики списков возвращают ответ,
+уже сериализованный через JsonSerializer: FastAPI не проверяет возвращенный Response
+по response_model, поэтому модели, собранные репозиториями из строк запроса,
+не валидируются и не обходятся повторно.
+
+Классы:
+    FastJSONResponse: JSON-ответ на основе pydantic-core.
+    JsonSerializer: Сериализатор заданного типа, собранный один раз при импорте.
+"""
+
+from typing import Any, Generic, List, Type, TypeVar
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+from schemas.posts.post_info import PostInfo
+from schemas.users.user import UserListResponse
+from schemas.users.user_marks import UserMarks
+
+T = TypeVar('T')
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON-ответ, который кодируется сериализатором pydantic-core.
+
+    Готовые байты отдаются без изменений.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
+
+
+class JsonSerializer(Generic[T]):
+    """
+    Сериализатор значений заданного типа в JSON.
+
+    Схема сериализации строится один раз при создании, поэтому экземпляры
+    создаются на уровне модуля.
+    """
+
+    def __init__(self, type_: Type[T]):
+        self.adapter = TypeAdapter(type_)
+
+    def response(self, value: T, status_code: int = 200) -> FastJSONResponse:
+        """
+        Сериализует значение в ответ без проверки по response_model.
+
+        Args:
+            value (T): Значение, собранное приложением.
+            status_code (int): Код ответа.
+
+        Returns:
+            FastJSONResponse: Ответ с готовым JSON.
+        """
+
+        return FastJSONResponse(self.adapter.dump_json(value), status_code=status_code)
+
+
+post_info_list_serializer = JsonSerializer(List[PostInfo])
+user_list_serializer = JsonSerializer(UserListResponse)
+user_marks_list_serializer = JsonSerializer(List[UserMarks])
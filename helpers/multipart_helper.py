@@ -0,0 +1,129 @@
+"""
+Модуль MultipartHelper
+
+Этот модуль предоставляет класс `MultipartFileReader` для потокового чтения файла
+из тела запроса multipart/form-data.
+
+UploadFile заставляет Starlette прочитать и сохранить все тело запроса до вызова
+обработчика. MultipartFileReader разбирает тело по мере получения из request.stream()
+и отдает содержимое файла блоками, поэтому файл целиком не хранится ни в памяти,
+ни во временном файле, а чтение прекращается, как только потребитель перестает
+запрашивать блоки.
+
+Классы:
+    MultipartFileReader: Потоковое чтение одного файла из multipart/form-data.
+"""
+
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from multipart.multipart import MultipartParser, FormParserError, parse_options_header
+
+from schemas.images.image_info import MultipartInvalidException
+
+
+class MultipartFileReader:
+    """
+    Читает поле-файл из тела multipart/form-data по мере поступления данных.
+
+    Attributes:
+        filename (Optional[str]): Имя файла из заголовка части.
+        content_type (Optional[str]): MIME-тип файла из заголовка части.
+    """
+
+    def __init__(self, content_type: str, stream: AsyncIterator[bytes]):
+        mime_type, params = parse_options_header(content_type)
+        if mime_type != b'multipart/form-data' or not params.get(b'boundary'):
+            raise MultipartInvalidException
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+        self._stream = stream
+        self._pending: List[Tuple[str, object]] = []
+        self._header_field = b''
+        self._header_value = b''
+        self._headers: Dict[bytes, bytes] = {}
+        self._parser = MultipartParser(params[b'boundary'], callbacks={
+            'on_part_begin': self._on_part_begin,
+            'on_header_field': self._on_header_field,
+            'on_header_value': self._on_header_value,
+            'on_header_end': self._on_header_end,
+            'on_headers_finished': self._on_headers_finished,
+            'on_part_data': self._on_part_data,
+            'on_part_end': self._on_part_end
+        })
+        self._events = self._read_events()
+
+    async def open(self, field_name: str) -> None:
+        """
+        Читает тело до начала содержимого файла, пропуская остальные поля.
+
+        Args:
+            field_name (str): Имя поля формы с файлом.
+
+        Raises:
+            MultipartInvalidException: Если тело повреждено или поля с файлом нет.
+        """
+
+        async for event, value in self._events:
+            if event != 'headers':
+                continue
+            disposition, params = parse_options_header(value.get(b'content-disposition', b''))
+            if disposition == b'form-data' and params.get(b'name') == field_name.encode() \
+                    and b'filename' in params:
+                self.filename = params[b'filename'].decode('utf-8', 'replace')
+                self.content_type = value.get(b'content-type', b'').decode('latin-1')
+                return
+        raise MultipartInvalidException
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """
+        Отдает содержимое файла, найденного open, по блокам по мере получения.
+
+        Raises:
+            MultipartInvalidException: Если тело оборвалось до конца файла.
+        """
+
+        async for event, value in self._events:
+            if event == 'data':
+                yield value
+            elif event == 'end':
+                return
+        raise MultipartInvalidException
+
+    async def _read_events(self) -> AsyncIterator[Tuple[str, object]]:
+        try:
+            async for chunk in self._stream:
+                self._parser.write(chunk)
+                for event in self._drain():
+                    yield event
+            self._parser.finalize()
+        except FormParserError as exc:
+            raise MultipartInvalidException from exc
+        for event in self._drain():
+            yield event
+
+    def _drain(self) -> List[Tuple[str, object]]:
+        events, self._pending = self._pending, []
+        return events
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b''
+        self._header_value = b''
+
+    def _on_headers_finished(self) -> None:
+        self._pending.append(('headers', self._headers))
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self._pending.append(('data', bytes(data[start:end])))
+
+    def _on_part_end(self) -> None:
+        self._pending.append(('end', None))
@@ -1,42 +1,55 @@
 """
 Модуль PasswordHelper
 
-Этот модуль предоставляет класс `PasswordHelper` для хэширования и проверки паролей
-с использованием соли.
+Этот модуль предоставляет класс `PasswordHelper` для хэширования и проверки паролей.
+
+Новые пароли хэшируются функцией scrypt со случайной солью и хранятся в формате
+`scrypt$n$r$p$salt$hash`. Старые хэши SHA-256 с общей солью по-прежнему проверяются,
+а needs_rehash сообщает, что хэш нужно пересчитать.
+
+Методы класса выполняют вычисления синхронно и занимают процессор на десятки
+миллисекунд, поэтому из обработчиков запросов их следует вызывать через PasswordService.
 
 Классы:
-    PasswordHelper: Утилита для хэширования и проверки паролей с использованием соли.
+    PasswordHelper: Утилита для хэширования и проверки паролей.
 
 Constants:
     - settings: Объект настроек паролей
 """
 
+import base64
 import hashlib
+import hmac
+import os
 
 from settings import PasswordSettings
 
 settings = PasswordSettings()
 
-
-
-
-
+SCRYPT_PREFIX = 'scrypt'
+SALT_SIZE = 16
 
 
 class PasswordHelper:
     """
-    Инициализирует объект PasswordHelper с заданным значением соли.
+    Инициализирует объект PasswordHelper с параметрами scrypt из настроек.
 
     Attributes:
-        salt (str): Строка соль для хэширования паролей.
+        salt (str): Общая соль устаревших хэшей SHA-256.
+        n (int): Параметр стоимости scrypt.
+        r (int): Размер блока scrypt.
+        p (int): Параметр параллелизма scrypt.
     """
 
     def __init__(self):
         self.salt = settings.password_salt
+        self.n = settings.scrypt_n
+        self.r = settings.scrypt_r
+        self.p = settings.scrypt_p
 
     def hash_password(self, password: str) -> str:
         """
-        Hashing passed password using salt.
+        Hashing passed password with scrypt and a random salt.
 
         Args:
             password (str): Password to hash.
@@ -45,9 +58,10 @@ class PasswordHelper:
             str: password hash.
         """
 
-        password_hash = str(password) + self.salt
-        hashed = hashlib.sha256(password_hash.encode()).hexdigest()
-        return hashed
+        salt = os.urandom(SALT_SIZE)
+        hashed = self._scrypt(password, salt, self.n, self.r, self.p)
+        return '$'.join((SCRYPT_PREFIX, str(self.n), str(self.r), str(self.p),
+                         self._b64encode(salt), self._b64encode(hashed)))
 
     def check_password(self, login_password: str, password: str) -> bool:
         """
@@ -55,10 +69,50 @@ class PasswordHelper:
 
         Args:
             login_password (str): Введенный пользователем пароль.
-            password (str): Хэш-значение пароля для сравнения.
+            password (str): Хэш-значение пароля для сравнения в формате scrypt или SHA-256.
 
         Returns:
             bool: True, если хэш-значения совпадают, иначе False.
         """
 
-        return self.hash_password(password=login_password) == password
+        if not password.startswith(SCRYPT_PREFIX + '$'):
+            return hmac.compare_digest(self._hash_legacy(login_password), password)
+        try:
+            _, n, r, p, salt, hashed = password.split('$')
+            expected = self._b64decode(hashed)
+            actual = self._scrypt(login_password, self._b64decode(salt), int(n), int(r), int(p))
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    def needs_rehash(self, password: str) -> bool:
+        """
+        Проверяет, нужно ли пересчитать хэш пароля.
+
+        Args:
+            password (str): Сохраненный хэш пароля.
+
+        Returns:
+            bool: True для хэшей SHA-256 и хэшей scrypt с устаревшими параметрами.
+        """
+
+        if not password.startswith(SCRYPT_PREFIX + '$'):
+            return True
+        return password.split('$')[1:4] != [str(self.n), str(self.r), str(self.p)]
+
+    def _hash_legacy(self, password: str) -> str:
+        password_hash = str(password) + self.salt
+        return hashlib.sha256(password_hash.encode()).hexdigest()
+
+    @staticmethod
+    def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        maxmem = 128 * r * (n + p + 2) + 1024 * 1024
+        return hashlib.scrypt(str(password).encode(), salt=salt, n=n, r=r, p=p, maxmem=maxmem)
+
+    @staticmethod
+    def _b64encode(value: bytes) -> str:
+        return base64.b64encode(value).decode()
+
+    @staticmethod
+    def _b64decode(value: str) -> bytes:
+        return base64.b64decode(value, validate=True)
@@ -0,0 +1,82 @@
+"""
+Модуль TTLCache
+
+Этот модуль предоставляет класс `TTLCache` - ограниченный по размеру LRU-кэш
+с временем жизни записей.
+
+Классы:
+    TTLCache: LRU-кэш с ограничением размера и временем жизни записей.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    LRU-кэш с ограничением размера и временем жизни записей.
+
+    Безопасен для использования из нескольких потоков: синхронные зависимости
+    FastAPI, например validate_token, выполняются в пуле потоков.
+
+    Attributes:
+        maxsize (int): Максимальное количество записей.
+        ttl (float): Время жизни записи по умолчанию в секундах.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Получает значение по ключу.
+
+        Args:
+            key (Hashable): Ключ записи.
+
+        Returns:
+            Optional[Any]: Значение или None, если записи нет или ее время жизни истекло.
+        """
+
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Сохраняет значение, вытесняя самую давно использованную запись при переполнении.
+
+        Args:
+            key (Hashable): Ключ записи.
+            value (Any): Значение.
+            ttl (Optional[float]): Время жизни записи в секундах. По умолчанию используется ttl кэша.
+        """
+
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._items[key] = (time.monotonic() + ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
@@ -12,12 +12,18 @@ Attributes:
 import uvicorn
 from fastapi import FastAPI
 from api.api import api_routers
+from helpers.json_response_helper import FastJSONResponse
+from repositories.db import async_session_maker, close_connections
+from repositories.post_events import PostEventsBroker
+from repositories.reference_data import ReferenceDataCache
+from services.password_service import PasswordService
+from services.thumbnail_service import ThumbnailService
 from settings import ServerSettings
 from fastapi.middleware.cors import CORSMiddleware
 
 
 settings = ServerSettings()
-app = FastAPI()
+app = FastAPI(default_response_class=FastJSONResponse)
 
 origins = ["http://localhost:3000", "http://localhost:3001", "https://edutrack.duckdns.org", "https://edutrack.duckdns.org"]
 
@@ -30,6 +36,21 @@ app.add_middleware(
     expose_headers=["Content-Disposition"]
 )
 
+
+@app.on_event("startup")
+async def load_reference_data() -> None:
+    async with async_session_maker() as session:
+        await ReferenceDataCache().refresh(session)
+
+
+@app.on_event("shutdown")
+async def close_pools() -> None:
+    await PostEventsBroker().close()
+    await close_connections()
+    PasswordService().shutdown()
+    ThumbnailService().shutdown()
+
+
 for api_router in api_routers:
     app.include_router(api_router, prefix="/api")
 
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, Enum
+from sqlalchemy import ForeignKey, Enum, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from models.base import BaseModel
@@ -18,3 +18,7 @@ class ActionDao(BaseModel):
 
     module: Mapped["ModuleDao"] = relationship(back_populates="actions")
     user: Mapped["UserDao"] = relationship(back_populates="actions")
+
+
+Index('ix_actions_module_id_role', ActionDao.module_id, ActionDao.role)
+Index('ix_actions_user_id_role', ActionDao.user_id, ActionDao.role)
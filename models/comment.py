@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, String, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from models.base import BaseModel
@@ -18,3 +18,6 @@ class CommentDao(BaseModel):
 
     day: Mapped["DayDao"] = relationship(back_populates='comments')
     author: Mapped["UserDao"] = relationship(back_populates='comments')
+
+
+Index('ix_comments_day_id', CommentDao.day_id)
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List
 from uuid import UUID
 
-from sqlalchemy import Float, DateTime, ForeignKey
+from sqlalchemy import Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from models.attendance import AttendanceDao
 from models.type_of_mark import TypeOfMarkDao
@@ -27,3 +27,7 @@ class DayDao(BaseModel):
     type_of_mark: Mapped["TypeOfMarkDao"] = relationship(back_populates='day')
 
     comments: Mapped[List["CommentDao"]] = relationship(back_populates='day')
+
+
+Index('ix_days_user_id_module_id_date', DayDao.user_id, DayDao.module_id, DayDao.date)
+Index('ix_days_module_id_date', DayDao.module_id, DayDao.date)
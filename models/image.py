@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import String, LargeBinary, ForeignKey
+from sqlalchemy import String, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from models.base import BaseModel
@@ -12,7 +12,8 @@ class ImageDao(BaseModel):
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(50))
-    image_data: Mapped[bytes] = mapped_column(LargeBinary)
+    digest: Mapped[str] = mapped_column(String(64), index=True)
+    content_type: Mapped[str] = mapped_column(String(100))
+    size: Mapped[int] = mapped_column(Integer)
 
     user: Mapped["UserDao"] = relationship(back_populates='image')
-
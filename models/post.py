@@ -1,7 +1,7 @@
 import datetime
 import uuid
 
-from sqlalchemy import ForeignKey, String, DateTime
+from sqlalchemy import ForeignKey, String, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from models.base import BaseModel
@@ -20,3 +20,7 @@ class PostDao(BaseModel):
 
     author: Mapped["UserDao"] = relationship(back_populates="posts")
     module: Mapped["ModuleDao"] = relationship(back_populates="posts")
+
+
+Index('ix_posts_module_id_date_id', PostDao.module_id, PostDao.date.desc(), PostDao.id.desc())
+Index('ix_posts_date_id', PostDao.date.desc(), PostDao.id.desc())
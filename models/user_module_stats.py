@@ -0,0 +1,19 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Float, Integer, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models.base import BaseModel
+
+
+class UserModuleStatsDao(BaseModel):
+    __tablename__ = 'user_module_stats'
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey('users.id'), primary_key=True)
+    module_id: Mapped[UUID] = mapped_column(ForeignKey('modules.id'), primary_key=True)
+    marks_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    marks_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    days_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    absences: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_mark_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
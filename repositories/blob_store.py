@@ -0,0 +1,228 @@
+"""
+Модуль blob_store
+
+Этот модуль содержит хранилище двоичных файлов с адресацией по содержимому.
+
+Файл сохраняется под своим хэшем SHA-256, поэтому одинаковые файлы хранятся один раз,
+а записи в базе данных содержат только хэш и метаданные. Файл принимается и отдается
+блоками, целиком в памяти он не находится.
+
+Производные файлы (например, уменьшенные копии изображений) хранятся рядом с исходным
+под именем варианта. Вариант однозначно определяется исходным файлом, поэтому
+тоже хранится один раз для одинаковых исходных файлов.
+
+Classes:
+    - BlobStore: Интерфейс хранилища файлов.
+    - LocalBlobStore: Хранилище файлов в локальном каталоге.
+"""
+
+import asyncio
+import hashlib
+import os
+import uuid
+from abc import ABC, abstractmethod
+from typing import AsyncIterable, AsyncIterator, Optional, Tuple
+
+
+class BlobStore(ABC):
+    """
+    Интерфейс хранилища файлов, адресуемых хэшем SHA-256.
+    """
+
+    @abstractmethod
+    async def put(self, chunks: AsyncIterable[bytes]) -> Tuple[str, int]:
+        """
+        Сохраняет файл.
+
+        Args:
+            chunks (AsyncIterable[bytes]): Содержимое файла по блокам.
+
+        Returns:
+            Tuple[str, int]: Хэш SHA-256 и размер файла в байтах.
+        """
+
+    @abstractmethod
+    async def put_variant(self, digest: str, variant: str, data: bytes) -> int:
+        """
+        Сохраняет производный файл рядом с исходным.
+
+        Args:
+            digest (str): Хэш SHA-256 исходного файла.
+            variant (str): Имя варианта.
+            data (bytes): Содержимое производного файла.
+
+        Returns:
+            int: Размер файла в байтах.
+        """
+
+    @abstractmethod
+    async def exists(self, digest: str) -> bool:
+        """
+        Проверяет наличие файла.
+
+        Args:
+            digest (str): Хэш SHA-256 файла.
+        """
+
+    @abstractmethod
+    async def size(self, digest: str, variant: Optional[str] = None) -> Optional[int]:
+        """
+        Размер файла или его варианта.
+
+        Args:
+            digest (str): Хэш SHA-256 исходного файла.
+            variant (Optional[str]): Имя варианта.
+
+        Returns:
+            Optional[int]: Размер в байтах или None, если файла нет.
+        """
+
+    @abstractmethod
+    def read(self, digest: str, start: int = 0, length: Optional[int] = None,
+             chunk_size: int = 64 * 1024, variant: Optional[str] = None) -> AsyncIterator[bytes]:
+        """
+        Читает файл по блокам.
+
+        Args:
+            digest (str): Хэш SHA-256 файла.
+            start (int): Смещение первого байта.
+            length (Optional[int]): Количество байт, по умолчанию до конца файла.
+            chunk_size (int): Размер блока.
+            variant (Optional[str]): Имя варианта, по умолчанию исходный файл.
+        """
+
+    @abstractmethod
+    async def delete(self, digest: str) -> None:
+        """
+        Удаляет файл, если он существует.
+
+        Args:
+            digest (str): Хэш SHA-256 файла.
+        """
+
+    def local_path(self, digest: str, variant: Optional[str] = None) -> Optional[str]:
+        """
+        Путь к файлу в локальной файловой системе, если хранилище его предоставляет.
+        Позволяет отдавать файл средствами сервера без чтения в приложении.
+
+        Args:
+            digest (str): Хэш SHA-256 файла.
+            variant (Optional[str]): Имя варианта.
+        """
+
+        return None
+
+
+class LocalBlobStore(BlobStore):
+    """
+    Хранилище файлов в локальном каталоге.
+
+    Файл с хэшем abcdef... хранится как root/ab/cd/abcdef..., его варианты как
+    root/ab/cd/abcdef....<variant>. Запись идет во временный
+    файл в том же каталоге, который после завершения переименовывается, поэтому
+    читатели никогда не видят недописанный файл.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path(self, digest: str, variant: Optional[str] = None) -> str:
+        name = f'{digest}.{variant}' if variant else digest
+        return os.path.join(self.root, digest[:2], digest[2:4], name)
+
+    def local_path(self, digest: str, variant: Optional[str] = None) -> Optional[str]:
+        return self.path(digest, variant)
+
+    async def put(self, chunks: AsyncIterable[bytes]) -> Tuple[str, int]:
+        tmp_dir = os.path.join(self.root, 'tmp')
+        await asyncio.to_thread(os.makedirs, tmp_dir, exist_ok=True)
+        tmp_path = os.path.join(tmp_dir, uuid.uuid4().hex)
+        hasher = hashlib.sha256()
+        size = 0
+        file = await asyncio.to_thread(open, tmp_path, 'wb')
+        try:
+            try:
+                async for chunk in chunks:
+                    hasher.update(chunk)
+                    size += len(chunk)
+                    await asyncio.to_thread(file.write, chunk)
+            finally:
+                await asyncio.to_thread(file.close)
+            digest = hasher.hexdigest()
+            await asyncio.to_thread(self._commit, tmp_path, self.path(digest))
+        except BaseException:
+            await asyncio.to_thread(self._unlink, tmp_path)
+            raise
+        return digest, size
+
+    def put_bytes(self, data: bytes) -> Tuple[str, int]:
+        """
+        Синхронно сохраняет файл из памяти. Используется в миграциях и командах обслуживания.
+
+        Args:
+            data (bytes): Содержимое файла.
+
+        Returns:
+            Tuple[str, int]: Хэш SHA-256 и размер файла в байтах.
+        """
+
+        digest = hashlib.sha256(data).hexdigest()
+        self._write(self.path(digest), data)
+        return digest, len(data)
+
+    async def put_variant(self, digest: str, variant: str, data: bytes) -> int:
+        await asyncio.to_thread(self._write, self.path(digest, variant), data)
+        return len(data)
+
+    async def exists(self, digest: str) -> bool:
+        return await asyncio.to_thread(os.path.exists, self.path(digest))
+
+    async def size(self, digest: str, variant: Optional[str] = None) -> Optional[int]:
+        try:
+            return (await asyncio.to_thread(os.stat, self.path(digest, variant))).st_size
+        except FileNotFoundError:
+            return None
+
+    async def read(self, digest: str, start: int = 0, length: Optional[int] = None,
+                   chunk_size: int = 64 * 1024, variant: Optional[str] = None) -> AsyncIterator[bytes]:
+        file = await asyncio.to_thread(open, self.path(digest, variant), 'rb')
+        try:
+            await asyncio.to_thread(file.seek, start)
+            remaining = length
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await asyncio.to_thread(file.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(file.close)
+
+    async def delete(self, digest: str) -> None:
+        await asyncio.to_thread(self._unlink, self.path(digest))
+
+    def _write(self, path: str, data: bytes) -> None:
+        tmp_dir = os.path.join(self.root, 'tmp')
+        os.makedirs(tmp_dir, exist_ok=True)
+        tmp_path = os.path.join(tmp_dir, uuid.uuid4().hex)
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _commit(tmp_path: str, path: str) -> None:
+        if os.path.exists(path):
+            os.unlink(tmp_path)
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _unlink(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
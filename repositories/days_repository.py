@@ -1,19 +1,28 @@
 import uuid
-from typing import List, Iterable
+from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
+from typing import List, Iterable, AsyncIterable, AsyncIterator, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, any_, or_
-from sqlalchemy.orm import selectinload, contains_eager
+from sqlalchemy import select, insert, any_, or_, Select, tuple_, cast, func, Date, ARRAY, Uuid, literal
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import contains_eager
 from sqlalchemy.sql.selectable import and_
 
+from models.action import ActionDao
 from models.attendance import AttendanceDao
 from models.day import DayDao
+from models.module import ModuleDao
 from models.type_of_mark import TypeOfMarkDao
-from models.user import UserDao
+from models.user import UserDao, Roles
 from repositories.base import BaseRepository
+from repositories.reference_data import ReferenceDataCache
+from repositories.user_module_stats_repository import UserModuleStatsRepository
 from schemas.days.day import Day
 from schemas.days.day_info import DayInfo
 from schemas.days.day_module import DayModule
+from schemas.days.module_gradebook import ModuleGradebook
 from schemas.modules.module_info import ModuleInfo
 from schemas.users.user_marks import UserMarks
 
@@ -21,123 +30,374 @@ from schemas.users.user_marks import UserMarks
 class DaysRepository(BaseRepository):
 
     model = DayDao
+    reference_data = ReferenceDataCache()
 
     async def add_day(self, day: Day):
         try:
-            stmt_to_select_type_of_mark = select(TypeOfMarkDao).filter(TypeOfMarkDao.type_of_mark == day.type_of_mark)
-            type_of_mark = await self.session.execute(stmt_to_select_type_of_mark)
-            type_of_mark = type_of_mark.scalar_one_or_none()
-
-            stmt_to_select_type_of_attendance = select(AttendanceDao).filter(AttendanceDao.type == day.presence)
-            type_of_attendance = await self.session.execute(stmt_to_select_type_of_attendance)
-            type_of_attendance = type_of_attendance.scalar_one_or_none()
-
-            day_dump = day.model_dump()
-            del day_dump["presence"]
-            del day_dump["type_of_mark"]
-            day_dump["presence_id"] = type_of_attendance.id
-            day_dump["type_of_mark_id"] = type_of_mark.id
-            await self._add(day_dump)
+            day_dump = (await self._to_days_dump([day]))[0]
+
+            await self.session.execute(insert(DayDao).values(day_dump))
+            await UserModuleStatsRepository(session=self.session).apply_day(day)
+            await self.session.commit()
         except Exception as exc:
             print(exc)
 
-    async def get_days_by_module_id(self, module_id: UUID) -> List[Day]:
-        stmt_to_select_days = select(DayDao).filter(DayDao.module_id == module_id).options(
-            selectinload(DayDao.module),
-            selectinload(DayDao.user)
+    async def add_days(self, days: List[Day]) -> None:
+        """
+        Добавляет оценки одной транзакцией.
+
+        Идентификаторы справочников берутся из кэша, оценки вставляются многострочным INSERT.
+
+        Args:
+            days (List[Day]): Оценки для добавления.
+        """
+
+        if not days:
+            return
+
+        days_dump = await self._to_days_dump(days)
+
+        try:
+            await self.session.execute(insert(DayDao), days_dump)
+            await UserModuleStatsRepository(session=self.session).apply_days(days)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+    async def get_existing_references(self, user_ids: Iterable[UUID], module_ids: Iterable[UUID]
+                                      ) -> Tuple[Set[UUID], Set[UUID]]:
+        """
+        Проверяет, какие пользователи и модули существуют, одним запросом на таблицу.
+
+        Args:
+            user_ids (Iterable[UUID]): Идентификаторы пользователей.
+            module_ids (Iterable[UUID]): Идентификаторы модулей.
+
+        Returns:
+            Tuple[Set[UUID], Set[UUID]]: Существующие идентификаторы пользователей и модулей.
+        """
+
+        existing = []
+        for model, ids in ((UserDao, list(user_ids)), (ModuleDao, list(module_ids))):
+            if not ids:
+                existing.append(set())
+                continue
+            stmt_to_select_ids = select(model.id).filter(model.id == any_(literal(ids, ARRAY(Uuid))))
+            existing.append(set((await self.session.execute(stmt_to_select_ids)).scalars().all()))
+        return existing[0], existing[1]
+
+    async def _to_days_dump(self, days: List[Day]) -> List[dict]:
+        await self.reference_data.ensure_loaded(self.session)
+        try:
+            return [self.__to_day_dump(day) for day in days]
+        except KeyError:
+            await self.reference_data.refresh(self.session)
+            return [self.__to_day_dump(day) for day in days]
+
+    def __to_day_dump(self, day: Day) -> dict:
+        day_dump = day.model_dump(exclude={"presence", "type_of_mark"})
+        day_dump["presence_id"] = self.reference_data.attendance_id(day.presence)
+        day_dump["type_of_mark_id"] = self.reference_data.type_of_mark_id(day.type_of_mark)
+        return day_dump
+
+    async def get_days_by_module_id(self, module_id: UUID) -> ModuleGradebook:
+        """
+        Получает журнал модуля: средние оценки студентов по датам занятий.
+
+        Оценки группируются по студенту и календарной дате одним запросом по индексу
+        ix_days_module_id_date, матрица собирается из отсортированных строк.
+
+        Args:
+            module_id (UUID): Идентификатор модуля.
+
+        Returns:
+            ModuleGradebook: Матрица студенты x даты.
+        """
+
+        day = cast(DayDao.date, Date).label('day')
+        stmt_to_select_marks = (
+            select(DayDao.user_id, UserDao.first_name, UserDao.last_name, day,
+                   func.avg(DayDao.mark).label('mark'))
+            .join(UserDao, UserDao.id == DayDao.user_id)
+            .filter(DayDao.module_id == module_id)
+            .group_by(DayDao.user_id, UserDao.first_name, UserDao.last_name, day)
+            .order_by(UserDao.last_name, UserDao.first_name, DayDao.user_id, day)
         )
-        days = await self.session.execute(stmt_to_select_days)
-        days = days.scalars().all()
-        return []
+        rows = (await self.session.execute(stmt_to_select_marks)).all()
 
-    async def get_days_by_user_id(self, user_id: UUID) -> List[UserMarks]:
+        dates = sorted({row.day for row in rows})
+        date_index = {value: index for index, value in enumerate(dates)}
+        student_ids, student_names, marks = [], [], []
+        for user_id, user_rows in groupby(rows, key=attrgetter('user_id')):
+            user_marks = [None] * len(dates)
+            for row in user_rows:
+                user_marks[date_index[row.day]] = row.mark
+            student_ids.append(user_id)
+            student_names.append(f"{row.first_name} {row.last_name}")
+            marks.append(user_marks)
+
+        return ModuleGradebook(module_id=module_id, student_ids=student_ids, student_names=student_names,
+                               dates=dates, marks=marks)
 
-        stmt_to_select_user = select(UserDao).filter(UserDao.id == user_id).options(selectinload(UserDao.days).options(selectinload(DayDao.module),
-                                                                                          selectinload(
-                                                                                              DayDao.type_of_mark),
-                                                                                          selectinload(
-                                                                                              DayDao.presence)))
+    async def get_days_by_user_id(self, user_id: UUID) -> List[UserMarks]:
 
-        user_days = await self.session.execute(stmt_to_select_user)
+        await self.reference_data.ensure_loaded(self.session)
+        stmt_to_select_days = self._select_users_marks().filter(UserDao.id == user_id)
 
-        user_days = user_days.scalars().all()
-        user_marks = self.__to_User_Marks(user_days)
-        return user_marks
+        rows = await self.session.execute(stmt_to_select_days)
+        return self._rows_to_User_Marks(rows)
 
 
     async def get_days_by_module_user(self, user_id: UUID, module_id: UUID) -> List[DayInfo]:
-        stmt_to_select_days = select(DayDao).filter((DayDao.user_id == user_id) and (DayDao.module_id == module_id))
-        days = await self.session.execute(stmt_to_select_days)
-        days = days.scalars().all()
-        return [self.__to_DayInfo(day) for day in days]
+        """
+        Получает оценки студента по модулю в порядке дат.
+
+        Запрос читает индекс ix_days_user_id_module_id_date и выбирает только колонки DayInfo,
+        название модуля берется одним join, справочники - из кэша.
+
+        Args:
+            user_id (UUID): Идентификатор студента.
+            module_id (UUID): Идентификатор модуля.
+
+        Returns:
+            List[DayInfo]: Оценки студента по модулю.
+        """
+
+        await self.reference_data.ensure_loaded(self.session)
+        stmt_to_select_days = (
+            select(
+                DayDao.id,
+                DayDao.presence_id,
+                DayDao.type_of_mark_id,
+                DayDao.mark,
+                DayDao.user_id,
+                DayDao.module_id,
+                ModuleDao.title.label('module_title'),
+                DayDao.date
+            )
+            .join(ModuleDao, ModuleDao.id == DayDao.module_id)
+            .filter(and_(DayDao.user_id == user_id, DayDao.module_id == module_id))
+            .order_by(DayDao.date)
+        )
+        rows = await self.session.execute(stmt_to_select_days)
+        return [self._row_to_DayInfo(row) for row in rows]
 
     async def get_days_users(self) -> List[UserMarks]:
-        stmt_to_select_users = select(UserDao).options(selectinload(UserDao.days).options( selectinload(DayDao.module),
-            selectinload(DayDao.type_of_mark),
-            selectinload(DayDao.presence)))
+        await self.reference_data.ensure_loaded(self.session)
+        stmt_to_select_days = self._select_users_marks()
 
-        users_days = await self.session.execute(stmt_to_select_users)
+        rows = await self.session.execute(stmt_to_select_days)
+        return self._rows_to_User_Marks(rows)
 
-        users_days = users_days.scalars().all()
-        users_marks = self.__to_User_Marks(users_days)
+    async def get_days_by_teacher_id(self, teacher_id: uuid.UUID) -> List[UserMarks]:
+        await self.reference_data.ensure_loaded(self.session)
+        teacher_module_ids = (
+            select(ActionDao.module_id)
+            .filter(and_(ActionDao.user_id == teacher_id, ActionDao.role == Roles.TEACHER))
+        )
+        stmt_to_select_days = (
+            self._select_marks()
+            .filter(DayDao.module_id.in_(teacher_module_ids))
+            .order_by(DayDao.user_id, DayDao.date)
+        )
 
-        return users_marks
+        rows = await self.session.stream(stmt_to_select_days)
+        return [user_marks async for user_marks in self._stream_User_Marks(rows)]
 
-    async def get_days_by_teacher_id(self, module_ids: List[uuid.UUID]) -> List[UserMarks]:
-        # Define the subquery to filter days based on module_ids
-        subquery = (
-            select(UserDao)
-            .options(
-                selectinload(UserDao.days)  # Ensure UserDao.days is eagerly loaded
-                .options(
-                    selectinload(DayDao.module),
-                    selectinload(DayDao.type_of_mark),
-                    selectinload(DayDao.presence)
-                )
-            )
+    async def get_days_users_page(self, limit: int, after: Optional[Tuple[UUID, datetime, UUID]] = None
+                                  ) -> Tuple[List[UserMarks], Optional[Tuple[UUID, datetime, UUID]]]:
+        """
+        Получает страницу оценок, упорядоченную по ключу (user_id, date, id).
+
+        Args:
+            limit (int): Максимальное количество оценок на странице.
+            after (Optional[Tuple[UUID, datetime, UUID]]): Ключ последней оценки предыдущей страницы.
+
+        Returns:
+            Tuple[List[UserMarks], Optional[Tuple[UUID, datetime, UUID]]]: Оценки страницы
+                и ключ для следующей страницы или None, если страница последняя.
+        """
+
+        await self.reference_data.ensure_loaded(self.session)
+        stmt_to_select_days = (
+            self._select_marks()
+            .order_by(DayDao.user_id, DayDao.date, DayDao.id)
+            .limit(limit + 1)
         )
+        if after is not None:
+            stmt_to_select_days = stmt_to_select_days.filter(
+                tuple_(DayDao.user_id, DayDao.date, DayDao.id) > tuple_(*after))
 
-        # Execute the subquery to retrieve the filtered users with their days
-        users_with_filtered_days = await self.session.execute(subquery)
-        users_with_filtered_days = users_with_filtered_days.scalars().all()
+        rows = (await self.session.execute(stmt_to_select_days)).all()
+        next_key = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_row = rows[-1]
+            next_key = (last_row.user_id, last_row.date, last_row.id)
+        return self._rows_to_User_Marks(rows), next_key
 
-        # Filter users' days and leave only days where module_id is in module_ids
-        for user in users_with_filtered_days:
-            user.days = [day for day in user.days if day.module_id in module_ids]
+    async def stream_days_users(self) -> AsyncIterable[UserMarks]:
+        await self.reference_data.ensure_loaded(self.session)
+        stmt_to_select_days = (
+            self._select_marks()
+            .order_by(DayDao.user_id, DayDao.date, DayDao.id)
+            .execution_options(yield_per=1000)
+        )
+        rows = await self.session.stream(stmt_to_select_days)
+        async for user_marks in self._stream_User_Marks(rows):
+            yield user_marks
 
-        # Convert the filtered results to the desired format
-        users_marks = self.__to_User_Marks(users_with_filtered_days)
+    async def stream_marks_export(self, batch_size: int, module_id: Optional[UUID] = None,
+                                  date_from: Optional[datetime] = None, date_to: Optional[datetime] = None,
+                                  teacher_id: Optional[UUID] = None) -> AsyncIterator[Sequence[Row]]:
+        """
+        Читает оценки в плоском виде пачками фиксированного размера через серверный курсор.
 
-        # Return the converted results
-        return users_marks
+        В памяти одновременно находится не больше одной пачки, поэтому расход памяти
+        не зависит от объема выгрузки.
 
-    def __to_User_Marks(self, users_days: Iterable[UserDao]) -> List[UserMarks]:
-        users_marks = []
+        Args:
+            batch_size (int): Количество строк в пачке.
+            module_id (Optional[UUID]): Только оценки модуля.
+            date_from (Optional[datetime]): Только оценки не раньше даты.
+            date_to (Optional[datetime]): Только оценки раньше даты.
+            teacher_id (Optional[UUID]): Только оценки модулей преподавателя.
 
-        for user in users_days:
+        Returns:
+            AsyncIterator[Sequence[Row]]: Пачки строк в порядке (date, id).
+        """
 
-            user_marks = UserMarks(
-                id=user.id,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                days=[]
+        stmt_to_select_days = (
+            select(
+                DayDao.id.label('day_id'),
+                DayDao.user_id,
+                UserDao.first_name,
+                UserDao.last_name,
+                DayDao.module_id,
+                ModuleDao.title.label('module_title'),
+                ModuleDao.alias.label('module_alias'),
+                DayDao.date,
+                AttendanceDao.type.label('presence'),
+                TypeOfMarkDao.type_of_mark,
+                DayDao.mark
             )
-            users_marks.append(user_marks)
-            for day in user.days:
-                user_marks.days.append(self.__to_DayInfo(day))
+            .join(UserDao, UserDao.id == DayDao.user_id)
+            .join(ModuleDao, ModuleDao.id == DayDao.module_id)
+            .join(AttendanceDao, AttendanceDao.id == DayDao.presence_id)
+            .join(TypeOfMarkDao, TypeOfMarkDao.id == DayDao.type_of_mark_id)
+            .order_by(DayDao.date, DayDao.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if module_id is not None:
+            stmt_to_select_days = stmt_to_select_days.filter(DayDao.module_id == module_id)
+        if date_from is not None:
+            stmt_to_select_days = stmt_to_select_days.filter(DayDao.date >= date_from)
+        if date_to is not None:
+            stmt_to_select_days = stmt_to_select_days.filter(DayDao.date < date_to)
+        if teacher_id is not None:
+            teacher_module_ids = (
+                select(ActionDao.module_id)
+                .filter(and_(ActionDao.user_id == teacher_id, ActionDao.role == Roles.TEACHER))
+            )
+            stmt_to_select_days = stmt_to_select_days.filter(DayDao.module_id.in_(teacher_module_ids))
+
+        rows = await self.session.stream(stmt_to_select_days)
+        async for batch in rows.partitions(batch_size):
+            yield batch
 
+    @staticmethod
+    def _select_marks() -> Select:
+        return (
+            select(
+                DayDao.user_id,
+                UserDao.first_name,
+                UserDao.last_name,
+                DayDao.id,
+                DayDao.presence_id,
+                DayDao.type_of_mark_id,
+                DayDao.mark,
+                DayDao.module_id,
+                ModuleDao.title.label('module_title'),
+                DayDao.date
+            )
+            .join(UserDao, UserDao.id == DayDao.user_id)
+            .join(ModuleDao, ModuleDao.id == DayDao.module_id)
+        )
+
+    @staticmethod
+    def _select_users_marks() -> Select:
+        """
+        Оценки всех пользователей, включая пользователей без оценок: для них
+        колонки оценки равны NULL.
+        """
+
+        return (
+            select(
+                UserDao.id.label('user_id'),
+                UserDao.first_name,
+                UserDao.last_name,
+                DayDao.id,
+                DayDao.presence_id,
+                DayDao.type_of_mark_id,
+                DayDao.mark,
+                DayDao.module_id,
+                ModuleDao.title.label('module_title'),
+                DayDao.date
+            )
+            .select_from(UserDao)
+            .outerjoin(DayDao, DayDao.user_id == UserDao.id)
+            .outerjoin(ModuleDao, ModuleDao.id == DayDao.module_id)
+            .order_by(UserDao.id, DayDao.date, DayDao.id)
+        )
+
+    def _rows_to_User_Marks(self, rows: Iterable[Row]) -> List[UserMarks]:
+        """
+        Собирает UserMarks из строк, упорядоченных по user_id.
+
+        Строки получены из базы данных, поэтому модели создаются без валидации.
+        """
+
+        users_marks = []
+        for user_id, user_rows in groupby(rows, key=attrgetter('user_id')):
+            user_rows = list(user_rows)
+            users_marks.append(UserMarks.model_construct(
+                id=user_id,
+                first_name=user_rows[0].first_name,
+                last_name=user_rows[0].last_name,
+                days=[self._row_to_DayInfo(row) for row in user_rows if row.id is not None]
+            ))
         return users_marks
 
+    async def _stream_User_Marks(self, rows: AsyncIterable[Row]) -> AsyncIterable[UserMarks]:
+        """
+        Собирает UserMarks из строк, упорядоченных по user_id.
+        """
 
-    def __to_DayInfo(self, day: DayDao):
+        user_marks = None
+        async for row in rows:
+            if user_marks is None or user_marks.id != row.user_id:
+                if user_marks is not None:
+                    yield user_marks
+                user_marks = UserMarks.model_construct(
+                    id=row.user_id,
+                    first_name=row.first_name,
+                    last_name=row.last_name,
+                    days=[]
+                )
+            user_marks.days.append(self._row_to_DayInfo(row))
+
+        if user_marks is not None:
+            yield user_marks
 
-        return DayInfo(
-            id=day.id,
-            presence=day.presence.type,
-            type_of_mark=day.type_of_mark.type_of_mark,
-            mark=day.mark,
-            user_id=day.user_id,
-            module_id=day.module_id,
-            module_title=day.module.title,
-            date=day.date
-        )
\ No newline at end of file
+    def _row_to_DayInfo(self, row: Row) -> DayInfo:
+        return DayInfo.model_construct(
+            id=row.id,
+            presence=self.reference_data.attendance_type(row.presence_id),
+            type_of_mark=self.reference_data.type_of_mark(row.type_of_mark_id),
+            mark=row.mark,
+            user_id=row.user_id,
+            module_id=row.module_id,
+            module_title=row.module_title,
+            date=row.date
+        )
@@ -12,20 +12,37 @@ Constants:
     - settings: Объект настроек подключения к БД
     - engine: Объект SQLAlchemy для работы с базой данных.
     - async_session_maker: Функция для создания асинхронных сессий SQLAlchemy.
+    - redis_pool: Общий для приложения пул соединений Redis.
 
 Functions:
     - get_async_session: Получает асинхронную сессию для взаимодействия с базой данных.
     - get_redis_session: Получает сессию Redis для выполнения операций с кэшем.
+    - close_connections: Закрывает соединения с БД и Redis при остановке приложения.
 """
 
 from sqlalchemy.ext.asyncio import (AsyncSession, async_sessionmaker,
                                     create_async_engine)
-from redis.asyncio import Redis
+from redis.asyncio import Redis, BlockingConnectionPool
+
+from repositories.db_metrics import InstrumentedAsyncQueuePool, instrument_engine
 from settings import DatabaseSettings
 
 settings = DatabaseSettings()
-engine = create_async_engine(settings.postgres_url.unicode_string(), echo=True)
+engine = create_async_engine(settings.postgres_url.unicode_string(),
+                             echo=settings.sql_echo,
+                             poolclass=InstrumentedAsyncQueuePool,
+                             pool_size=settings.pool_size,
+                             max_overflow=settings.max_overflow,
+                             pool_timeout=settings.pool_timeout,
+                             pool_recycle=settings.pool_recycle,
+                             pool_pre_ping=settings.pool_pre_ping,
+                             connect_args={"statement_cache_size": settings.statement_cache_size})
+instrument_engine(engine)
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+redis_pool = BlockingConnectionPool.from_url(settings.redis_url.unicode_string(),
+                                             max_connections=settings.redis_max_connections,
+                                             timeout=settings.redis_pool_timeout,
+                                             health_check_interval=settings.redis_health_check_interval)
 
 
 async def get_async_session() -> AsyncSession:
@@ -47,8 +64,19 @@ async def get_redis_session() -> Redis:
     """
     Получает сессию Redis для выполнения операций с кэшем.
 
+    Клиент использует общий пул соединений, поэтому его создание не открывает новых соединений.
+
     Returns:
         redis.Redis: Сессия Redis.
     """
 
-    return Redis.from_url(settings.redis_url.unicode_string())
+    return Redis(connection_pool=redis_pool)
+
+
+async def close_connections() -> None:
+    """
+    Закрывает пулы соединений с БД и Redis.
+    """
+
+    await redis_pool.disconnect()
+    await engine.dispose()
@@ -0,0 +1,134 @@
+"""
+Модуль db_metrics
+
+Этот модуль содержит сбор метрик пула соединений и времени выполнения SQL-запросов.
+
+Classes:
+    - DatabaseMetricsCollector: Накопитель метрик пула и запросов.
+    - InstrumentedAsyncQueuePool: Пул соединений, измеряющий время получения соединения.
+
+Functions:
+    - instrument_engine: Подключает сбор метрик запросов к движку.
+
+Constants:
+    - database_metrics: Общий для процесса накопитель метрик.
+"""
+
+import threading
+import time
+from typing import Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from schemas.metrics.database_metrics import DatabaseMetrics, PoolMetrics, StatementMetrics
+
+
+class DatabaseMetricsCollector:
+    """
+    Накапливает время получения соединений из пула и время выполнения запросов.
+
+    Attributes:
+        max_statements (int): Максимальное количество различных запросов, для которых хранится статистика.
+    """
+
+    max_statements = 500
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._acquire_count = 0
+        self._acquire_wait_total = 0.0
+        self._acquire_wait_max = 0.0
+        self._statements: Dict[str, List[float]] = {}
+
+    def record_acquire(self, wait: float) -> None:
+        with self._lock:
+            self._acquire_count += 1
+            self._acquire_wait_total += wait
+            self._acquire_wait_max = max(self._acquire_wait_max, wait)
+
+    def record_statement(self, statement: str, duration: float) -> None:
+        with self._lock:
+            stats = self._statements.get(statement)
+            if stats is None:
+                if len(self._statements) >= self.max_statements:
+                    return
+                stats = self._statements[statement] = [0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+
+    def snapshot(self, engine: AsyncEngine) -> DatabaseMetrics:
+        """
+        Возвращает текущее состояние пула и накопленные метрики.
+
+        Args:
+            engine (AsyncEngine): Движок, пул которого нужно описать.
+
+        Returns:
+            DatabaseMetrics: Метрики пула и запросов.
+        """
+
+        pool = engine.pool
+        with self._lock:
+            pool_metrics = PoolMetrics(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+                acquire_count=self._acquire_count,
+                acquire_wait_total_ms=self._acquire_wait_total * 1000,
+                acquire_wait_max_ms=self._acquire_wait_max * 1000
+            )
+            statements = [
+                StatementMetrics(statement=statement, count=count, total_ms=total * 1000, max_ms=maximum * 1000)
+                for statement, (count, total, maximum) in self._statements.items()
+            ]
+        statements.sort(key=lambda item: item.total_ms, reverse=True)
+        return DatabaseMetrics(pool=pool_metrics, statements=statements)
+
+
+database_metrics = DatabaseMetricsCollector()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений, сообщающий время ожидания соединения в database_metrics.
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            database_metrics.record_acquire(time.perf_counter() - started)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Подключает измерение времени выполнения запросов к движку.
+
+    Args:
+        engine (AsyncEngine): Движок SQLAlchemy.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        database_metrics.record_statement(statement, time.perf_counter() - started)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(exception_context):
+        # after_cursor_execute не вызывается для упавшего запроса: снимаем его отметку здесь,
+        # иначе список в conn.info растет на соединении из пула с каждой ошибкой.
+        conn = exception_context.connection
+        if conn is None or not conn.info.get("query_started"):
+            return
+        started = conn.info["query_started"].pop()
+        if exception_context.statement is not None:
+            database_metrics.record_statement(exception_context.statement, time.perf_counter() - started)
@@ -1,11 +1,121 @@
+import uuid
+from typing import AsyncIterable, AsyncIterator, Optional, Union
+
+from sqlalchemy import select
+
 from models.image import ImageDao
+from models.user import UserDao
 from repositories.base import BaseRepository
+from repositories.blob_store import BlobStore, LocalBlobStore
 from schemas.images.image_add_request import ImageAddRequest
+from schemas.images.image_info import ImageInfo, ImageTooLargeException
+from settings import StorageSettings
+
+settings = StorageSettings()
 
 
 class ImagesRepository(BaseRepository):
+    """
+    Репозиторий изображений.
+
+    Содержимое изображений хранится в blob_store по хэшу, таблица images содержит только метаданные.
+    """
 
     model = ImageDao
+    blob_store: BlobStore = LocalBlobStore(settings.blob_root)
+
+    async def add_image(self, image_add: ImageAddRequest, chunks: AsyncIterable[bytes]) -> ImageInfo:
+        """
+        Сохраняет содержимое изображения в хранилище файлов и его метаданные в базе данных.
+
+        Args:
+            image_add (ImageAddRequest): Метаданные изображения.
+            chunks (AsyncIterable[bytes]): Содержимое изображения по блокам.
+
+        Returns:
+            ImageInfo: Сохраненные метаданные.
+
+        Raises:
+            ImageTooLargeException: Если изображение больше image_max_size.
+        """
+
+        digest, size = await self.blob_store.put(self._limit_size(chunks, settings.image_max_size))
+        image = ImageInfo(id=image_add.id, name=image_add.name, content_type=image_add.content_type,
+                          digest=digest, size=size)
+        await self._add(image.model_dump(exclude={'variant'}))
+        return image
+
+    async def get_image(self, image_id: uuid.UUID) -> Union[ImageInfo, None]:
+        """
+        Получает метаданные изображения.
+
+        Args:
+            image_id (uuid.UUID): Идентификатор изображения.
+
+        Returns:
+            ImageInfo | None: Метаданные изображения, если оно найдено, иначе None.
+        """
+
+        image = await self._get(_id=image_id)
+        if image:
+            return ImageInfo.model_validate(image)
+
+    async def get_user_image(self, user_id: uuid.UUID) -> Union[ImageInfo, None]:
+        """
+        Получает метаданные изображения профиля пользователя.
+
+        Args:
+            user_id (uuid.UUID): Идентификатор пользователя.
+
+        Returns:
+            ImageInfo | None: Метаданные изображения, если у пользователя оно есть, иначе None.
+        """
+
+        stmt_to_select_image = select(self.model).join(UserDao, UserDao.image_id == self.model.id) \
+            .filter(UserDao.id == user_id)
+        image = await self.session.execute(stmt_to_select_image)
+        image = image.scalar_one_or_none()
+        if image:
+            return ImageInfo.model_validate(image)
+
+    def image_path(self, image: ImageInfo) -> Optional[str]:
+        """
+        Путь к файлу изображения, если хранилище локальное.
+
+        Args:
+            image (ImageInfo): Метаданные изображения.
+        """
+
+        return self.blob_store.local_path(image.digest, image.variant)
+
+    def read_image(self, image: ImageInfo, start: int = 0, length: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Читает содержимое изображения по блокам.
+
+        Args:
+            image (ImageInfo): Метаданные изображения.
+            start (int): Смещение первого байта.
+            length (Optional[int]): Количество байт, по умолчанию до конца файла.
+        """
+
+        return self.blob_store.read(image.digest, start=start, length=length, chunk_size=settings.upload_chunk_size,
+                                    variant=image.variant)
+
+    async def delete_image(self, image_id: uuid.UUID) -> None:
+        """
+        Удаляет метаданные изображения. Файл остается в хранилище, так как может использоваться другими записями.
+
+        Args:
+            image_id (uuid.UUID): Идентификатор изображения.
+        """
+
+        await self._delete(image_id)
 
-    async def add_image(self, image_add: ImageAddRequest):
-        await self._add(image_add.model_dump())
+    @staticmethod
+    async def _limit_size(chunks: AsyncIterable[bytes], max_size: int) -> AsyncIterator[bytes]:
+        size = 0
+        async for chunk in chunks:
+            size += len(chunk)
+            if size > max_size:
+                raise ImageTooLargeException
+            yield chunk
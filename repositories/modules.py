@@ -1,11 +1,15 @@
 import uuid
-from typing import List
-from sqlalchemy import select, delete, func
+from typing import List, Dict, Iterable
+from sqlalchemy import select, delete, func, and_
 
+from models.action import ActionDao
 from models.module import ModuleDao
+from models.user import UserDao, Roles
 from repositories.base import BaseRepository
 from schemas.modules.module import Module
 from schemas.modules.module_info import ModuleInfo
+from schemas.modules.module_users import ModuleUsers
+from schemas.users.user import UserInfo
 
 
 class ModulesRepository(BaseRepository):
@@ -22,6 +26,41 @@ class ModulesRepository(BaseRepository):
         modules = [ModuleInfo.model_validate(module) for module in modules]
         return modules
 
+    async def get_all_with_teachers(self) -> List[ModuleUsers]:
+        stmt_to_select_modules = (
+            select(ModuleDao, UserDao)
+            .outerjoin(ActionDao, and_(ActionDao.module_id == ModuleDao.id, ActionDao.role == Roles.TEACHER))
+            .outerjoin(UserDao, UserDao.id == ActionDao.user_id)
+        )
+        rows = await self.session.execute(stmt_to_select_modules)
+
+        modules_with_lecturer = {}
+        for module, teacher in rows.all():
+            module_users = modules_with_lecturer.get(module.id)
+            if module_users is None:
+                module_users = ModuleUsers(module=ModuleInfo.model_validate(module), users=[])
+                modules_with_lecturer[module.id] = module_users
+            if teacher is not None:
+                module_users.users.append(UserInfo.model_validate(teacher))
+        return list(modules_with_lecturer.values())
+
+    async def get_teachers_by_module_ids(self, module_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, List[UserInfo]]:
+        module_ids = list(module_ids)
+        if not module_ids:
+            return {}
+
+        stmt_to_select_teachers = (
+            select(ActionDao.module_id, UserDao)
+            .join(UserDao, UserDao.id == ActionDao.user_id)
+            .filter(and_(ActionDao.module_id.in_(module_ids), ActionDao.role == Roles.TEACHER))
+        )
+        rows = await self.session.execute(stmt_to_select_teachers)
+
+        teachers = {}
+        for module_id, teacher in rows.all():
+            teachers.setdefault(module_id, []).append(UserInfo.model_validate(teacher))
+        return teachers
+
     #
     # async def get_module_by_id(self, module_id: uuid) -> Module:
     #     module = await self._get(_id=module_id)
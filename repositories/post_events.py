@@ -0,0 +1,151 @@
+"""
+Модуль post_events
+
+Этот модуль содержит шину событий о новых постах на основе Redis pub/sub.
+
+Пост публикуется в канал posts:{module_id}. Каждый процесс приложения держит одну
+подписку на posts:* и раздает события локальным подписчикам через очереди, поэтому
+число соединений с Redis не зависит от числа открытых лент. Redis не хранит
+опубликованные события: пропущенные посты клиент получает из базы данных по Last-Event-ID.
+
+Classes:
+    - PostEventsBroker: Публикация и раздача событий о новых постах.
+"""
+
+import asyncio
+import uuid
+from typing import Set
+
+from redis.asyncio import Redis
+
+from repositories.db import redis_pool
+from schemas.posts.post_feed_item import PostFeedItem
+from settings import FeedSettings
+
+settings = FeedSettings()
+
+CHANNEL_PREFIX = 'posts:'
+
+
+class PostEventsBroker:
+    """
+    Шина событий о новых постах, общая для всего процесса.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+
+        if not isinstance(cls._instance, cls):
+            cls._instance = super().__new__(cls)
+            cls._instance._redis = Redis(connection_pool=redis_pool)
+            cls._instance._subscribers = {}
+            cls._instance._listener = None
+            cls._instance._ready = None
+
+        return cls._instance
+
+    async def publish(self, module_id: uuid.UUID, post: PostFeedItem) -> None:
+        """
+        Публикует новый пост для всех процессов приложения.
+
+        Args:
+            module_id (uuid.UUID): Идентификатор модуля.
+            post (PostFeedItem): Пост.
+        """
+
+        await self._redis.publish(f'{CHANNEL_PREFIX}{module_id}', post.model_dump_json())
+
+    async def subscribe(self, module_id: uuid.UUID) -> asyncio.Queue:
+        """
+        Подписывается на новые посты модуля.
+
+        Возвращает очередь только после того, как Redis подтвердил подписку процесса,
+        поэтому все посты, опубликованные после возврата, попадут в очередь.
+        Очередь ограничена feed_queue_size. Если клиент не успевает читать или подписка
+        на Redis прервалась, в очередь помещается None, и ленту нужно закрыть:
+        клиент переподключится с Last-Event-ID.
+
+        Args:
+            module_id (uuid.UUID): Идентификатор модуля.
+
+        Returns:
+            asyncio.Queue: Очередь новых постов.
+        """
+
+        if self._listener is None or self._listener.done():
+            self._ready = asyncio.Event()
+            self._listener = asyncio.create_task(self._listen(self._ready))
+        queue = asyncio.Queue(maxsize=settings.feed_queue_size)
+        self._subscribers.setdefault(module_id, set()).add(queue)
+        await self._ready.wait()
+        return queue
+
+    def unsubscribe(self, module_id: uuid.UUID, queue: asyncio.Queue) -> None:
+        """
+        Отменяет подписку на новые посты модуля.
+
+        Args:
+            module_id (uuid.UUID): Идентификатор модуля.
+            queue (asyncio.Queue): Очередь, полученная от subscribe.
+        """
+
+        queues = self._subscribers.get(module_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[module_id]
+
+    async def close(self) -> None:
+        """
+        Останавливает подписку на Redis.
+        """
+
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+    async def _listen(self, ready: asyncio.Event) -> None:
+        pubsub = self._redis.pubsub()
+        try:
+            await pubsub.psubscribe(f'{CHANNEL_PREFIX}*')
+            async for message in pubsub.listen():
+                if message['type'] == 'psubscribe':
+                    ready.set()
+                    continue
+                if message['type'] != 'pmessage':
+                    continue
+                channel = message['channel']
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                try:
+                    module_id = uuid.UUID(channel[len(CHANNEL_PREFIX):])
+                    post = PostFeedItem.model_validate_json(message['data'])
+                except ValueError as exc:
+                    print(exc)
+                    continue
+                self._dispatch(module_id, post)
+        except Exception as exc:
+            print(exc)
+            for module_id, queues in list(self._subscribers.items()):
+                for queue in list(queues):
+                    self._drop(module_id, queue)
+        finally:
+            # Ожидающие subscribe получат None в своих очередях, если подписка не удалась.
+            ready.set()
+            await pubsub.close()
+
+    def _dispatch(self, module_id: uuid.UUID, post: PostFeedItem) -> None:
+        queues: Set[asyncio.Queue] = self._subscribers.get(module_id, set())
+        for queue in list(queues):
+            try:
+                queue.put_nowait(post)
+            except asyncio.QueueFull:
+                self._drop(module_id, queue)
+
+    def _drop(self, module_id: uuid.UUID, queue: asyncio.Queue) -> None:
+        self.unsubscribe(module_id, queue)
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(None)
@@ -1,14 +1,19 @@
+import datetime
 import uuid
-from typing import List
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Row, Select, select, tuple_
 
+from models.module import ModuleDao
 from models.post import PostDao
+from models.user import UserDao
 from repositories.base import BaseRepository
+from schemas.modules.module_brief import ModuleBrief
 from schemas.modules.module_info import ModuleInfo
 from schemas.posts.post import Post
+from schemas.posts.post_feed_item import PostFeedItem
 from schemas.posts.post_info import PostInfo
+from schemas.users.author_info import AuthorInfo
 from schemas.users.user import UserInfo
 
 
@@ -20,51 +25,187 @@ class PostsRepository(BaseRepository):
         await self._add(post.model_dump())
 
     async def get_posts_by_module_id(self, module_id: uuid.UUID) -> List[PostInfo]:
-        stmt_to_select_posts = select(self.model).filter(self.model.module_id == module_id).options(
-            selectinload(self.model.module),
-            selectinload(self.model.author)
-        )
+        stmt_to_select_posts = self._select_posts_info().filter(self.model.module_id == module_id)
 
-        posts = await self.session.execute(stmt_to_select_posts)
-        posts = posts.scalars().all()
-        posts_info = []
-        for post in posts:
-            author = UserInfo.model_validate(post.author)
-            module = ModuleInfo.model_validate(post.module)
-
-            posts_info.append(
-                PostInfo(
-                    id=post.id,
-                    title=post.title,
-                    text=post.text,
-                    date=post.date,
-                    author=author,
-                    module=module
-                )
-            )
-        return posts_info
+        rows = (await self.session.execute(stmt_to_select_posts)).all()
+        return self._rows_to_PostInfos(rows)
 
     async def get_all_posts(self) -> List[PostInfo]:
-        stmt_to_select_posts = select(self.model).order_by(self.model.date).options(
-            selectinload(self.model.module),
-            selectinload(self.model.author)
+        stmt_to_select_posts = self._select_posts_info().order_by(self.model.date)
+
+        rows = (await self.session.execute(stmt_to_select_posts)).all()
+        return self._rows_to_PostInfos(rows)
+
+    async def get_posts_page(self, limit: int, after: Optional[Tuple[datetime.datetime, uuid.UUID]] = None,
+                             module_id: Optional[uuid.UUID] = None
+                             ) -> Tuple[List[PostFeedItem], Optional[Tuple[datetime.datetime, uuid.UUID]]]:
+        """
+        Получает страницу постов от новых к старым, упорядоченную по ключу (date, id).
+
+        Для постов модуля запрос читает индекс ix_posts_module_id_date_id,
+        для всех постов - ix_posts_date_id, поэтому стоимость страницы не зависит от ее номера.
+        Автор и модуль выбираются одним запросом с join и только нужными колонками.
+
+        Args:
+            limit (int): Максимальное количество постов на странице.
+            after (Optional[Tuple[datetime.datetime, uuid.UUID]]): Ключ последнего поста предыдущей страницы.
+            module_id (Optional[uuid.UUID]): Идентификатор модуля, по умолчанию посты всех модулей.
+
+        Returns:
+            Tuple[List[PostFeedItem], Optional[Tuple[datetime.datetime, uuid.UUID]]]: Посты страницы
+                и ключ для следующей страницы или None, если страница последняя.
+        """
+
+        stmt_to_select_posts = (
+            self._select_feed_items()
+            .order_by(self.model.date.desc(), self.model.id.desc())
+            .limit(limit + 1)
+        )
+        if module_id is not None:
+            stmt_to_select_posts = stmt_to_select_posts.filter(self.model.module_id == module_id)
+        if after is not None:
+            stmt_to_select_posts = stmt_to_select_posts.filter(
+                tuple_(self.model.date, self.model.id) < tuple_(*after))
+
+        rows = (await self.session.execute(stmt_to_select_posts)).all()
+        next_key = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_key = (rows[-1].date, rows[-1].id)
+        return self._rows_to_PostFeedItems(rows), next_key
+
+    async def get_feed_item(self, post_id: uuid.UUID) -> Optional[PostFeedItem]:
+        """
+        Получает пост в формате ленты.
+
+        Args:
+            post_id (uuid.UUID): Идентификатор поста.
+
+        Returns:
+            Optional[PostFeedItem]: Пост или None, если он не найден.
+        """
+
+        rows = (await self.session.execute(self._select_feed_items().filter(self.model.id == post_id))).all()
+        posts = self._rows_to_PostFeedItems(rows)
+        return posts[0] if posts else None
+
+    async def get_posts_since(self, module_id: uuid.UUID, after: Tuple[datetime.datetime, uuid.UUID],
+                              limit: int) -> List[PostFeedItem]:
+        """
+        Получает посты модуля, опубликованные после ключа (date, id), от старых к новым.
+
+        Args:
+            module_id (uuid.UUID): Идентификатор модуля.
+            after (Tuple[datetime.datetime, uuid.UUID]): Ключ последнего полученного клиентом поста.
+            limit (int): Максимальное количество постов.
+
+        Returns:
+            List[PostFeedItem]: Посты в порядке публикации.
+        """
+
+        stmt_to_select_posts = (
+            self._select_feed_items()
+            .filter(self.model.module_id == module_id)
+            .filter(tuple_(self.model.date, self.model.id) > tuple_(*after))
+            .order_by(self.model.date, self.model.id)
+            .limit(limit)
+        )
+        rows = (await self.session.execute(stmt_to_select_posts)).all()
+        return self._rows_to_PostFeedItems(rows)
+
+    async def release(self) -> None:
+        """
+        Завершает сессию и возвращает соединение в пул. Используется перед долгим ожиданием
+        событий, чтобы открытая лента не занимала соединение с базой данных.
+        """
+
+        await self.session.close()
+
+    def _select_feed_items(self) -> Select:
+        return (
+            select(
+                self.model.id,
+                self.model.title,
+                self.model.text,
+                self.model.date,
+                UserDao.id.label('author_id'),
+                UserDao.first_name,
+                UserDao.last_name,
+                UserDao.image_id,
+                ModuleDao.id.label('module_id'),
+                ModuleDao.alias
+            )
+            .join(UserDao, UserDao.id == self.model.author_id)
+            .join(ModuleDao, ModuleDao.id == self.model.module_id)
         )
-        posts = await self.session.execute(stmt_to_select_posts)
-        posts = posts.scalars().all()
-        posts_info = []
-        for post in posts:
-            author = UserInfo.model_validate(post.author)
-            module = ModuleInfo.model_validate(post.module)
-
-            posts_info.append(
-                PostInfo(
-                    id=post.id,
-                    title=post.title,
-                    text=post.text,
-                    date=post.date,
-                    author=author,
-                    module=module
-                )
+
+    @staticmethod
+    def _rows_to_PostFeedItems(rows: Sequence[Row]) -> List[PostFeedItem]:
+        """
+        Преобразует строки в посты ленты. Автор и модуль создаются один раз на страницу:
+        в ленте модуля большинство постов написаны одним преподавателем.
+        """
+
+        authors: Dict[uuid.UUID, AuthorInfo] = {}
+        modules: Dict[uuid.UUID, ModuleBrief] = {}
+        posts = []
+        for row in rows:
+            author = authors.get(row.author_id)
+            if author is None:
+                author = authors[row.author_id] = AuthorInfo(id=row.author_id, first_name=row.first_name,
+                                                             last_name=row.last_name, image_id=row.image_id)
+            module = modules.get(row.module_id)
+            if module is None:
+                module = modules[row.module_id] = ModuleBrief(id=row.module_id, alias=row.alias)
+            posts.append(PostFeedItem(id=row.id, title=row.title, text=row.text, date=row.date,
+                                      author=author, module=module))
+        return posts
+
+    def _select_posts_info(self) -> Select:
+        return (
+            select(
+                self.model.id,
+                self.model.title,
+                self.model.text,
+                self.model.date,
+                UserDao.id.label('author_id'),
+                UserDao.first_name,
+                UserDao.last_name,
+                UserDao.phone_number,
+                UserDao.city,
+                UserDao.address,
+                UserDao.email,
+                UserDao.role,
+                ModuleDao.id.label('module_id'),
+                ModuleDao.title.label('module_title'),
+                ModuleDao.alias,
+                ModuleDao.hours_taught
             )
-        return posts_info
+            .join(UserDao, UserDao.id == self.model.author_id)
+            .join(ModuleDao, ModuleDao.id == self.model.module_id)
+        )
+
+    @staticmethod
+    def _rows_to_PostInfos(rows: Sequence[Row]) -> List[PostInfo]:
+        """
+        Преобразует строки в посты. Строки получены из базы данных, поэтому модели
+        создаются без валидации, а автор и модуль создаются один раз на запрос.
+        """
 
+        authors: Dict[uuid.UUID, UserInfo] = {}
+        modules: Dict[uuid.UUID, ModuleInfo] = {}
+        posts = []
+        for row in rows:
+            author = authors.get(row.author_id)
+            if author is None:
+                author = authors[row.author_id] = UserInfo.model_construct(
+                    id=row.author_id, first_name=row.first_name, last_name=row.last_name,
+                    phone_number=row.phone_number, city=row.city, address=row.address, email=row.email,
+                    role=row.role)
+            module = modules.get(row.module_id)
+            if module is None:
+                module = modules[row.module_id] = ModuleInfo.model_construct(
+                    id=row.module_id, title=row.module_title, alias=row.alias, hours_taught=row.hours_taught)
+            posts.append(PostInfo.model_construct(id=row.id, title=row.title, text=row.text, date=row.date,
+                                                  author=author, module=module))
+        return posts
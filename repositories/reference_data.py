@@ -0,0 +1,87 @@
+"""
+Модуль reference_data
+
+Этот модуль содержит кэш справочников посещаемости и типов оценок.
+
+Таблицы attendance и type_of_mark содержат по две неизменяемые записи, поэтому
+их идентификаторы загружаются в память один раз при старте приложения и
+обновляются только по запросу.
+
+Classes:
+    - ReferenceDataCache: Кэш соответствий перечислений и идентификаторов справочников.
+"""
+
+import asyncio
+import uuid
+from typing import Dict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.attendance import AttendanceDao, AttendanceTypes
+from models.type_of_mark import TypeOfMarkDao, MarkTypes
+
+
+class ReferenceDataCache:
+    """
+    Кэш справочников attendance и type_of_mark, общий для всего процесса.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+
+        if not isinstance(cls._instance, cls):
+            cls._instance = super().__new__(cls)
+            cls._instance._lock = asyncio.Lock()
+            cls._instance._attendance_ids = {}
+            cls._instance._attendance_types = {}
+            cls._instance._type_of_mark_ids = {}
+            cls._instance._types_of_mark = {}
+
+        return cls._instance
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._attendance_ids) and bool(self._type_of_mark_ids)
+
+    async def ensure_loaded(self, session: AsyncSession) -> None:
+        """
+        Загружает справочники, если они еще не загружены.
+
+        Args:
+            session (AsyncSession): Сессия базы данных.
+        """
+
+        if not self.loaded:
+            await self.refresh(session)
+
+    async def refresh(self, session: AsyncSession) -> None:
+        """
+        Перечитывает справочники из базы данных.
+
+        Args:
+            session (AsyncSession): Сессия базы данных.
+        """
+
+        async with self._lock:
+            attendance = (await session.execute(select(AttendanceDao))).scalars().all()
+            types_of_mark = (await session.execute(select(TypeOfMarkDao))).scalars().all()
+
+            self._attendance_ids: Dict[AttendanceTypes, uuid.UUID] = {item.type: item.id for item in attendance}
+            self._attendance_types: Dict[uuid.UUID, AttendanceTypes] = {item.id: item.type for item in attendance}
+            self._type_of_mark_ids: Dict[MarkTypes, uuid.UUID] = {
+                item.type_of_mark: item.id for item in types_of_mark}
+            self._types_of_mark: Dict[uuid.UUID, MarkTypes] = {item.id: item.type_of_mark for item in types_of_mark}
+
+    def attendance_id(self, attendance_type: AttendanceTypes) -> uuid.UUID:
+        return self._attendance_ids[attendance_type]
+
+    def attendance_type(self, attendance_id: uuid.UUID) -> AttendanceTypes:
+        return self._attendance_types[attendance_id]
+
+    def type_of_mark_id(self, type_of_mark: MarkTypes) -> uuid.UUID:
+        return self._type_of_mark_ids[type_of_mark]
+
+    def type_of_mark(self, type_of_mark_id: uuid.UUID) -> MarkTypes:
+        return self._types_of_mark[type_of_mark_id]
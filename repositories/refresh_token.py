@@ -21,9 +21,19 @@ Methods:
     - __init__: Инициализирует экземпляр репозитория.
     - save_item: Сохраняет элемент в хранилище кэша Redis с указанным ключом и значением.
     - get_item: Получает элемент из хранилища кэша Redis по указанному ключу.
+    - get_items: Получает активные токены обновления пользователя.
+    - delete_item: Атомарно удаляет элемент из хранилища кэша Redis.
+    - delete_items: Удаляет все токены обновления пользователя.
+    - rotate_item: Атомарно заменяет один токен обновления другим.
+
+Каждый токен обновления дополнительно записывается в индекс сессий пользователя -
+отсортированное множество, где значение - идентификатор токена, а вес - время истечения.
+Все операции с индексом выполняются за время, пропорциональное числу сессий одного пользователя.
 """
 
-from typing import Union
+import time
+import uuid
+from typing import Union, Dict
 from redis import Redis
 
 from schemas.token import TokenRefreshNotFoundException
@@ -31,6 +41,53 @@ from settings import JwtSettings
 
 settings = JwtSettings()
 
+SAVE_SCRIPT = """
+local ttl = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ttl)
+redis.call('ZADD', KEYS[2], now + ttl, KEYS[1])
+local excess = redis.call('ZCARD', KEYS[2]) - tonumber(ARGV[4])
+if excess > 0 then
+    local evicted = redis.call('ZRANGE', KEYS[2], 0, excess - 1)
+    for _, token_id in ipairs(evicted) do
+        redis.call('DEL', token_id)
+    end
+    redis.call('ZREMRANGEBYRANK', KEYS[2], 0, excess - 1)
+end
+redis.call('EXPIRE', KEYS[2], ttl)
+return 1
+"""
+
+ROTATE_SCRIPT = """
+if redis.call('DEL', KEYS[1]) == 0 then
+    return 0
+end
+local ttl = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+redis.call('ZREM', KEYS[3], KEYS[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', now)
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ttl)
+redis.call('ZADD', KEYS[3], now + ttl, KEYS[2])
+redis.call('EXPIRE', KEYS[3], ttl)
+return 1
+"""
+
+DELETE_SCRIPT = """
+local deleted = redis.call('DEL', KEYS[1])
+redis.call('ZREM', KEYS[2], KEYS[1])
+return deleted
+"""
+
+DELETE_ALL_SCRIPT = """
+local token_ids = redis.call('ZRANGE', KEYS[1], 0, -1)
+for _, token_id in ipairs(token_ids) do
+    redis.call('DEL', token_id)
+end
+redis.call('DEL', KEYS[1])
+return #token_ids
+"""
+
 
 class RefreshTokenRepository:
     """
@@ -49,31 +106,98 @@ class RefreshTokenRepository:
         """
 
         self._redis = session
+        self._save_script = session.register_script(SAVE_SCRIPT)
+        self._rotate_script = session.register_script(ROTATE_SCRIPT)
+        self._delete_script = session.register_script(DELETE_SCRIPT)
+        self._delete_all_script = session.register_script(DELETE_ALL_SCRIPT)
 
-    async def save_item(self, key: str, value: str = "0") -> None:
+    @staticmethod
+    def _index_key(user_id: Union[uuid.UUID, str]) -> str:
+        return f"refresh_sessions:{user_id}"
+
+    async def save_item(self, key: str, user_id: Union[uuid.UUID, str], value: str = "0") -> None:
+        """
+        Сохраняет токен обновления и добавляет его в индекс сессий пользователя.
 
-        await self._redis.set(key, value)
-        await self._redis.expire(key, settings.refresh_expiration)
+        Если количество сессий превышает refresh_max_sessions, самые старые сессии удаляются.
+
+        Args:
+            key (str): Идентификатор токена обновления.
+            user_id (Union[uuid.UUID, str]): Идентификатор пользователя.
+            value (str): Значение токена обновления.
+        """
+
+        await self._save_script(keys=[key, self._index_key(user_id)],
+                                args=[value, settings.refresh_expiration, int(time.time()),
+                                      settings.refresh_max_sessions])
 
     async def get_item(self, key: str) -> Union[str, None]:
 
         result = await self._redis.get(key)
         return result
 
-    async def get_items(self):
-        keys = [key.decode() for key in await self._redis.keys("*")]
-        results = {key: await self._redis.get(key) for key in keys}
-        return results
+    async def get_items(self, user_id: Union[uuid.UUID, str]) -> Dict[str, int]:
+        """
+        Получает активные сессии пользователя.
 
-    async def delete_item(self, key: str) -> None:
+        Args:
+            user_id (Union[uuid.UUID, str]): Идентификатор пользователя.
+
+        Returns:
+            Dict[str, int]: Идентификаторы токенов обновления и время их истечения (unix time).
+        """
+
+        index_key = self._index_key(user_id)
+        now = int(time.time())
+        await self._redis.zremrangebyscore(index_key, "-inf", now)
+        return {token_id.decode(): int(expires_at)
+                async for token_id, expires_at in self._redis.zscan_iter(index_key)
+                if expires_at > now}
+
+    async def delete_item(self, key: str, user_id: Union[uuid.UUID, str]) -> None:
         """
         Удаляет элемент из хранилища кэша Redis по указанному ключу.
 
         Args:
             key (str): Ключ, по которому будет удалён элемент из кэша.
+            user_id (Union[uuid.UUID, str]): Идентификатор пользователя.
         """
 
-        result = await self._redis.get(key)
-        if not result:
+        deleted = await self._delete_script(keys=[key, self._index_key(user_id)])
+        if not deleted:
+            raise TokenRefreshNotFoundException
+
+    async def delete_items(self, user_id: Union[uuid.UUID, str]) -> int:
+        """
+        Удаляет все токены обновления пользователя.
+
+        Args:
+            user_id (Union[uuid.UUID, str]): Идентификатор пользователя.
+
+        Returns:
+            int: Количество удаленных сессий.
+        """
+
+        return await self._delete_all_script(keys=[self._index_key(user_id)])
+
+    async def rotate_item(self, old_key: str, new_key: str, user_id: Union[uuid.UUID, str], value: str = "0") -> None:
+        """
+        Удаляет старый токен обновления и сохраняет новый за один запрос к Redis.
+
+        Операция выполняется Lua-скриптом атомарно, поэтому повторное использование
+        одного и того же токена обновления в параллельных запросах удается только один раз.
+
+        Args:
+            old_key (str): Ключ текущего токена обновления.
+            new_key (str): Ключ нового токена обновления.
+            user_id (Union[uuid.UUID, str]): Идентификатор пользователя.
+            value (str): Значение нового токена обновления.
+
+        Raises:
+            TokenRefreshNotFoundException: Если текущий токен обновления не найден.
+        """
+
+        rotated = await self._rotate_script(keys=[old_key, new_key, self._index_key(user_id)],
+                                            args=[value, settings.refresh_expiration, int(time.time())])
+        if not rotated:
             raise TokenRefreshNotFoundException
-        await self._redis.delete(key)
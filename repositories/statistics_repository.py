@@ -0,0 +1,84 @@
+import uuid
+from typing import List, Optional, Sequence
+
+from sqlalchemy import select, func, case, and_, literal_column
+
+from models.action import ActionDao
+from models.attendance import AttendanceDao, AttendanceTypes
+from models.day import DayDao
+from models.type_of_mark import TypeOfMarkDao
+from models.user import Roles
+from repositories.base import BaseRepository
+from schemas.statistics.marks_statistics import MarksStatistics
+from schemas.statistics.statistics_group import StatisticsDimension, TimeBucket
+
+
+class StatisticsRepository(BaseRepository):
+
+    model = DayDao
+
+    dimension_columns = {
+        StatisticsDimension.USER: DayDao.user_id.label('user_id'),
+        StatisticsDimension.MODULE: DayDao.module_id.label('module_id'),
+        StatisticsDimension.TYPE_OF_MARK: TypeOfMarkDao.type_of_mark.label('type_of_mark'),
+    }
+
+    async def get_user_average(self, user_id: uuid.UUID) -> Optional[float]:
+        stmt_to_select_average = select(func.avg(DayDao.mark)).filter(DayDao.user_id == user_id)
+        average = await self.session.execute(stmt_to_select_average)
+        return average.scalar_one()
+
+    async def get_marks_statistics(self, group_by: Sequence[StatisticsDimension],
+                                   bucket: Optional[TimeBucket] = None,
+                                   user_id: Optional[uuid.UUID] = None,
+                                   module_id: Optional[uuid.UUID] = None,
+                                   teacher_id: Optional[uuid.UUID] = None) -> List[MarksStatistics]:
+        """
+        Считает агрегаты оценок и посещаемости на стороне БД.
+
+        Args:
+            group_by (Sequence[StatisticsDimension]): Измерения для GROUP BY.
+            bucket (Optional[TimeBucket]): Интервал группировки по дате.
+            user_id (Optional[uuid.UUID]): Фильтр по студенту.
+            module_id (Optional[uuid.UUID]): Фильтр по модулю.
+            teacher_id (Optional[uuid.UUID]): Фильтр по модулям преподавателя.
+
+        Returns:
+            List[MarksStatistics]: Строка статистики на каждую группу.
+        """
+
+        group_columns = [self.dimension_columns[dimension] for dimension in group_by]
+        if bucket is not None:
+            # Интервал подставляется литералом, чтобы выражения в SELECT и GROUP BY совпадали.
+            group_columns.append(func.date_trunc(literal_column(f"'{bucket.value}'"), DayDao.date).label('period'))
+
+        stmt_to_select_statistics = (
+            select(
+                *group_columns,
+                func.count(DayDao.id).label('days_count'),
+                func.count(DayDao.mark).label('marks_count'),
+                func.avg(DayDao.mark).label('average'),
+                func.min(DayDao.mark).label('minimum'),
+                func.max(DayDao.mark).label('maximum'),
+                func.stddev_samp(DayDao.mark).label('stddev'),
+                func.avg(case((AttendanceDao.type == AttendanceTypes.PRESENT, 1.0), else_=0.0)).label('attendance_rate')
+            )
+            .join(AttendanceDao, AttendanceDao.id == DayDao.presence_id)
+            .join(TypeOfMarkDao, TypeOfMarkDao.id == DayDao.type_of_mark_id)
+            .group_by(*group_columns)
+            .order_by(*group_columns)
+        )
+
+        if user_id is not None:
+            stmt_to_select_statistics = stmt_to_select_statistics.filter(DayDao.user_id == user_id)
+        if module_id is not None:
+            stmt_to_select_statistics = stmt_to_select_statistics.filter(DayDao.module_id == module_id)
+        if teacher_id is not None:
+            teacher_module_ids = (
+                select(ActionDao.module_id)
+                .filter(and_(ActionDao.user_id == teacher_id, ActionDao.role == Roles.TEACHER))
+            )
+            stmt_to_select_statistics = stmt_to_select_statistics.filter(DayDao.module_id.in_(teacher_module_ids))
+
+        rows = await self.session.execute(stmt_to_select_statistics)
+        return [MarksStatistics.model_validate(row._mapping) for row in rows.all()]
@@ -0,0 +1,82 @@
+"""
+Модуль user_cache
+
+Этот модуль содержит кэш профилей пользователей для проверки авторизации.
+
+Профили хранятся в локальном LRU-кэше процесса с коротким временем жизни и,
+если включено в настройках, дополнительно в Redis, чтобы их разделяли все воркеры.
+
+Classes:
+    - UserCache: Кэш профилей пользователей.
+
+Constants:
+    - settings: Объект настроек кэша
+"""
+
+import uuid
+from typing import Optional, Union
+
+from redis.asyncio import Redis
+
+from helpers.ttl_cache import TTLCache
+from repositories.db import redis_pool
+from schemas.users.user import UserInfo
+from settings import CacheSettings
+
+settings = CacheSettings()
+
+
+class UserCache:
+    """
+    Кэш профилей пользователей, общий для всего процесса.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+
+        if not isinstance(cls._instance, cls):
+            cls._instance = super().__new__(cls)
+            cls._instance._local = TTLCache(maxsize=settings.user_cache_size, ttl=settings.user_cache_ttl)
+            cls._instance._redis = Redis(connection_pool=redis_pool) if settings.user_cache_redis else None
+
+        return cls._instance
+
+    @staticmethod
+    def _key(user_id: Union[uuid.UUID, str]) -> str:
+        return f"user_profile:{user_id}"
+
+    async def get(self, user_id: Union[uuid.UUID, str]) -> Optional[UserInfo]:
+        """
+        Получает профиль пользователя из кэша.
+
+        Args:
+            user_id (Union[uuid.UUID, str]): Идентификатор пользователя.
+
+        Returns:
+            Optional[UserInfo]: Профиль пользователя или None, если его нет в кэше.
+        """
+
+        key = self._key(user_id)
+        user = self._local.get(key)
+        if user is not None or self._redis is None:
+            return user
+
+        raw_user = await self._redis.get(key)
+        if raw_user is None:
+            return None
+        user = UserInfo.model_validate_json(raw_user)
+        self._local.set(key, user)
+        return user
+
+    async def set(self, user: UserInfo) -> None:
+        key = self._key(user.id)
+        self._local.set(key, user)
+        if self._redis is not None:
+            await self._redis.set(key, user.model_dump_json(), ex=settings.user_cache_ttl)
+
+    async def invalidate(self, user_id: Union[uuid.UUID, str]) -> None:
+        key = self._key(user_id)
+        self._local.pop(key)
+        if self._redis is not None:
+            await self._redis.delete(key)
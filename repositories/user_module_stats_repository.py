@@ -0,0 +1,133 @@
+import uuid
+from typing import List, Tuple, Iterable
+
+from sqlalchemy import select, insert, delete, func, case, or_, Select
+from sqlalchemy.dialects.postgresql import Insert, insert as pg_insert
+
+from models.attendance import AttendanceDao, AttendanceTypes
+from models.day import DayDao
+from models.user_module_stats import UserModuleStatsDao
+from repositories.base import BaseRepository
+from schemas.days.day import Day
+from schemas.statistics.user_module_stats import UserModuleStats
+
+# Пар студент-модуль в одном upsert: по 7 параметров на пару, предел asyncpg - 32767 параметров.
+UPSERT_CHUNK_SIZE = 1000
+
+
+class UserModuleStatsRepository(BaseRepository):
+    """
+    Репозиторий свертки оценок по паре студент-модуль.
+
+    Методы, изменяющие свертку вместе с оценками, не фиксируют транзакцию:
+    это делает вызывающий репозиторий после записи самой оценки.
+    """
+
+    model = UserModuleStatsDao
+
+    async def apply_day(self, day: Day) -> None:
+        await self.apply_days([day])
+
+    async def apply_days(self, days: Iterable[Day]) -> None:
+        deltas = {}
+        for day in days:
+            delta = deltas.setdefault((day.user_id, day.module_id), {
+                'user_id': day.user_id,
+                'module_id': day.module_id,
+                'marks_sum': 0,
+                'marks_count': 0,
+                'days_count': 0,
+                'absences': 0,
+                'last_mark_at': None
+            })
+            delta['days_count'] += 1
+            delta['absences'] += int(day.presence == AttendanceTypes.ABSENT)
+            if day.mark is not None:
+                delta['marks_sum'] += day.mark
+                delta['marks_count'] += 1
+                if delta['last_mark_at'] is None or day.date > delta['last_mark_at']:
+                    delta['last_mark_at'] = day.date
+        rows = list(deltas.values())
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            await self.session.execute(self._upsert_deltas(rows[start:start + UPSERT_CHUNK_SIZE]))
+
+    @staticmethod
+    def _upsert_deltas(rows: List[dict]) -> Insert:
+        stmt_to_upsert = pg_insert(UserModuleStatsDao).values(rows)
+        return stmt_to_upsert.on_conflict_do_update(
+            index_elements=[UserModuleStatsDao.user_id, UserModuleStatsDao.module_id],
+            set_={
+                'marks_sum': UserModuleStatsDao.marks_sum + stmt_to_upsert.excluded.marks_sum,
+                'marks_count': UserModuleStatsDao.marks_count + stmt_to_upsert.excluded.marks_count,
+                'days_count': UserModuleStatsDao.days_count + stmt_to_upsert.excluded.days_count,
+                'absences': UserModuleStatsDao.absences + stmt_to_upsert.excluded.absences,
+                'last_mark_at': func.greatest(UserModuleStatsDao.last_mark_at, stmt_to_upsert.excluded.last_mark_at)
+            }
+        )
+
+    async def get_by_user_id(self, user_id: uuid.UUID) -> List[UserModuleStats]:
+        stmt_to_select_stats = select(UserModuleStatsDao).filter(UserModuleStatsDao.user_id == user_id)
+        stats = await self.session.execute(stmt_to_select_stats)
+        return [UserModuleStats.model_validate(item) for item in stats.scalars().all()]
+
+    async def get_by_module_id(self, module_id: uuid.UUID) -> List[UserModuleStats]:
+        stmt_to_select_stats = select(UserModuleStatsDao).filter(UserModuleStatsDao.module_id == module_id)
+        stats = await self.session.execute(stmt_to_select_stats)
+        return [UserModuleStats.model_validate(item) for item in stats.scalars().all()]
+
+    async def rebuild(self) -> None:
+        """
+        Пересчитывает свертку целиком по таблице days.
+        """
+
+        recomputed = self._select_recomputed()
+        await self.session.execute(delete(UserModuleStatsDao))
+        await self.session.execute(
+            insert(UserModuleStatsDao).from_select(
+                [column.name for column in recomputed.selected_columns], recomputed))
+        await self.session.commit()
+
+    async def find_inconsistencies(self) -> List[Tuple[uuid.UUID, uuid.UUID]]:
+        """
+        Сравнивает свертку с полным пересчетом.
+
+        Returns:
+            List[Tuple[uuid.UUID, uuid.UUID]]: Пары (user_id, module_id), значения которых расходятся.
+        """
+
+        recomputed = self._select_recomputed().subquery()
+        stats = UserModuleStatsDao.__table__
+
+        stmt_to_compare = (
+            select(func.coalesce(stats.c.user_id, recomputed.c.user_id),
+                   func.coalesce(stats.c.module_id, recomputed.c.module_id))
+            .select_from(stats.join(recomputed,
+                                    (stats.c.user_id == recomputed.c.user_id)
+                                    & (stats.c.module_id == recomputed.c.module_id),
+                                    full=True))
+            .filter(or_(
+                stats.c.marks_count.is_distinct_from(recomputed.c.marks_count),
+                stats.c.days_count.is_distinct_from(recomputed.c.days_count),
+                stats.c.absences.is_distinct_from(recomputed.c.absences),
+                stats.c.last_mark_at.is_distinct_from(recomputed.c.last_mark_at),
+                func.abs(func.coalesce(stats.c.marks_sum, 0) - func.coalesce(recomputed.c.marks_sum, 0)) > 1e-6
+            ))
+        )
+        rows = await self.session.execute(stmt_to_compare)
+        return [(user_id, module_id) for user_id, module_id in rows.all()]
+
+    @staticmethod
+    def _select_recomputed() -> Select:
+        return (
+            select(
+                DayDao.user_id.label('user_id'),
+                DayDao.module_id.label('module_id'),
+                func.coalesce(func.sum(DayDao.mark), 0).label('marks_sum'),
+                func.count(DayDao.mark).label('marks_count'),
+                func.count(DayDao.id).label('days_count'),
+                func.count(case((AttendanceDao.type == AttendanceTypes.ABSENT, 1))).label('absences'),
+                func.max(case((DayDao.mark.isnot(None), DayDao.date))).label('last_mark_at')
+            )
+            .join(AttendanceDao, AttendanceDao.id == DayDao.presence_id)
+            .group_by(DayDao.user_id, DayDao.module_id)
+        )
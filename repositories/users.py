@@ -24,6 +24,7 @@ from sqlalchemy import select, update
 
 from models.user import UserDao, Roles
 from repositories.base import BaseRepository
+from repositories.user_cache import UserCache
 from schemas.users.user import User, UserListResponse, UserInfo, RoleNotFoundException
 
 
@@ -53,14 +54,25 @@ class UsersRepository(BaseRepository):
 
         """
         Получает список всех пользователей из базы данных.
+        Выбираются только колонки UserInfo, модели создаются без валидации.
 
         Returns:
         List[UserDao]: Список пользователей.
         """
 
-        users = await self._get_all()
-        users = [UserInfo.model_validate(user) for user in users]
-        return UserListResponse(users=users)
+        stmt_to_select_users = select(
+            self.model.id,
+            self.model.first_name,
+            self.model.last_name,
+            self.model.phone_number,
+            self.model.city,
+            self.model.address,
+            self.model.email,
+            self.model.role
+        )
+        rows = await self.session.execute(stmt_to_select_users)
+        users = [UserInfo.model_construct(**row._mapping) for row in rows]
+        return UserListResponse.model_construct(users=users)
 
     async def get_users_by_role(self, role: str) -> Union[UserListResponse, None]:
         """
@@ -132,9 +144,42 @@ class UsersRepository(BaseRepository):
         stmt_to_update_user = update(self.model).values(user.model_dump()).filter(UserDao.email == user.email)
         await self.session.execute(stmt_to_update_user)
         await self.session.commit()
+        await UserCache().invalidate(user.id)
+
+    async def update_password_hash(self, user_id: uuid.UUID, password_hash: str) -> None:
+        """
+        Обновляет хэш пароля пользователя.
+
+        Args:
+            user_id (uuid.UUID): Идентификатор пользователя.
+            password_hash (str): Новый хэш пароля.
+        """
+
+        stmt_to_update_hash = update(self.model).values(password_hash=password_hash).filter(self.model.id == user_id)
+        await self.session.execute(stmt_to_update_hash)
+        await self.session.commit()
+
+    async def set_image(self, user_id: uuid.UUID, image_id: uuid.UUID) -> Union[uuid.UUID, None]:
+        """
+        Устанавливает изображение профиля пользователя.
+
+        Args:
+            user_id (uuid.UUID): Идентификатор пользователя.
+            image_id (uuid.UUID): Идентификатор изображения.
+
+        Returns:
+            uuid.UUID | None: Идентификатор предыдущего изображения, если оно было.
+        """
+
+        previous = await self.session.execute(select(self.model.image_id).filter(self.model.id == user_id))
+        stmt_to_update_image = update(self.model).values(image_id=image_id).filter(self.model.id == user_id)
+        await self.session.execute(stmt_to_update_image)
+        await self.session.commit()
+        return previous.scalar_one_or_none()
 
     async def delete_user(self, user_id: uuid.UUID) -> None:
         try:
             await self._delete(user_id)
+            await UserCache().invalidate(user_id)
         except Exception as exc:
             print(exc)
@@ -0,0 +1,19 @@
+"""
+Модуль с исключениями курсорной пагинации.
+
+Classes:
+    - CursorException: Базовый класс исключения для курсоров.
+    - CursorCorruptedException: Исключение, возникающее при повреждении курсора.
+"""
+
+
+class CursorException(Exception):
+    """
+    Базовый класс исключения для курсоров пагинации.
+    """
+
+
+class CursorCorruptedException(CursorException):
+    """
+    Исключение, возникающее, когда курсор поврежден или имеет неверный формат.
+    """
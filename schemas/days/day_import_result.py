@@ -0,0 +1,13 @@
+from typing import List
+
+from schemas.base import BaseSchema
+
+
+class DayImportError(BaseSchema):
+    row: int
+    error: str
+
+
+class DayImportResult(BaseSchema):
+    imported: int
+    errors: List[DayImportError]
@@ -0,0 +1,25 @@
+import uuid
+from datetime import date
+from typing import List, Optional
+
+from schemas.base import BaseSchema
+
+
+class ModuleGradebook(BaseSchema):
+    """
+    Журнал модуля в колоночном виде: матрица студенты x даты занятий.
+
+    Attributes:
+        module_id (uuid.UUID): Идентификатор модуля.
+        student_ids (List[uuid.UUID]): Студенты - строки матрицы.
+        student_names (List[str]): Имена студентов в том же порядке.
+        dates (List[date]): Даты занятий - столбцы матрицы.
+        marks (List[List[Optional[float]]]): marks[i][j] - средняя оценка студента i за дату j
+            или None, если оценки нет.
+    """
+
+    module_id: uuid.UUID
+    student_ids: List[uuid.UUID]
+    student_names: List[str]
+    dates: List[date]
+    marks: List[List[Optional[float]]]
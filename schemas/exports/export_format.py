@@ -0,0 +1,34 @@
+"""
+Модуль с форматами выгрузки данных.
+
+Classes:
+    - ExportFormat: Формат файла выгрузки.
+"""
+
+import enum
+
+
+class ExportFormat(enum.Enum):
+    """
+    Формат файла выгрузки.
+    """
+
+    CSV = 'csv'
+    ARROW = 'arrow'
+    PARQUET = 'parquet'
+
+    @property
+    def media_type(self) -> str:
+        return {
+            ExportFormat.CSV: 'text/csv',
+            ExportFormat.ARROW: 'application/vnd.apache.arrow.stream',
+            ExportFormat.PARQUET: 'application/vnd.apache.parquet'
+        }[self]
+
+    @property
+    def extension(self) -> str:
+        return {
+            ExportFormat.CSV: 'csv',
+            ExportFormat.ARROW: 'arrows',
+            ExportFormat.PARQUET: 'parquet'
+        }[self]
@@ -7,5 +7,5 @@ from schemas.base import BaseSchema
 
 class ImageAddRequest(BaseSchema):
     id: uuid.UUID
-    name: str
-    image_data: bytes = Field(..., description="Binary image data")
+    name: str = Field(..., max_length=50)
+    content_type: str = Field(..., max_length=100)
@@ -0,0 +1,67 @@
+"""
+Модуль, содержащий модель метаданных изображения и исключения изображений.
+
+Classes:
+    ImageInfo: Метаданные изображения.
+    ImageException: Базовый класс исключений изображений.
+    ImageNotFoundException: Исключение, возникающее, когда изображение не найдено.
+    ImageTooLargeException: Исключение, возникающее, когда изображение превышает допустимый размер.
+    ImageTypeNotAllowedException: Исключение, возникающее, когда файл не является изображением.
+    ImageSizeNotAllowedException: Исключение, возникающее, когда запрошен неподдерживаемый размер копии.
+    RangeNotSatisfiableException: Исключение, возникающее, когда запрошенный диапазон байт лежит за пределами файла.
+    MultipartInvalidException: Исключение, возникающее, когда тело запроса с файлом повреждено или не содержит файла.
+"""
+
+import uuid
+from typing import Optional
+
+from schemas.base import BaseSchema
+
+
+class ImageInfo(BaseSchema):
+    """
+    Представляет метаданные изображения. Содержимое хранится в хранилище файлов по digest.
+
+    Attributes:
+        id (uuid.UUID): Идентификатор изображения.
+        name (str): Имя файла.
+        digest (str): SHA-256 содержимого.
+        content_type (str): MIME-тип изображения.
+        size (int): Размер в байтах.
+        variant (Optional[str]): Имя производного файла (уменьшенной копии), None для исходного.
+    """
+
+    id: uuid.UUID
+    name: str
+    digest: str
+    content_type: str
+    size: int
+    variant: Optional[str] = None
+
+
+class ImageException(Exception):
+    pass
+
+
+class ImageNotFoundException(ImageException):
+    pass
+
+
+class ImageTooLargeException(ImageException):
+    pass
+
+
+class ImageTypeNotAllowedException(ImageException):
+    pass
+
+
+class RangeNotSatisfiableException(ImageException):
+    pass
+
+
+class ImageSizeNotAllowedException(ImageException):
+    pass
+
+
+class MultipartInvalidException(ImageException):
+    pass
@@ -0,0 +1,25 @@
+from typing import List
+
+from schemas.base import BaseSchema
+
+
+class PoolMetrics(BaseSchema):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    acquire_count: int
+    acquire_wait_total_ms: float
+    acquire_wait_max_ms: float
+
+
+class StatementMetrics(BaseSchema):
+    statement: str
+    count: int
+    total_ms: float
+    max_ms: float
+
+
+class DatabaseMetrics(BaseSchema):
+    pool: PoolMetrics
+    statements: List[StatementMetrics]
@@ -0,0 +1,8 @@
+import uuid
+
+from schemas.base import BaseSchema
+
+
+class ModuleBrief(BaseSchema):
+    id: uuid.UUID
+    alias: str
@@ -0,0 +1,15 @@
+import datetime
+import uuid
+
+from schemas.base import BaseSchema
+from schemas.modules.module_brief import ModuleBrief
+from schemas.users.author_info import AuthorInfo
+
+
+class PostFeedItem(BaseSchema):
+    id: uuid.UUID
+    title: str
+    text: str
+    date: datetime.datetime
+    author: AuthorInfo
+    module: ModuleBrief
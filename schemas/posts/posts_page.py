@@ -0,0 +1,9 @@
+from typing import List, Optional
+
+from schemas.base import BaseSchema
+from schemas.posts.post_feed_item import PostFeedItem
+
+
+class PostsPage(BaseSchema):
+    posts: List[PostFeedItem]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,20 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from models.type_of_mark import MarkTypes
+from schemas.base import BaseSchema
+
+
+class MarksStatistics(BaseSchema):
+    user_id: Optional[uuid.UUID] = None
+    module_id: Optional[uuid.UUID] = None
+    type_of_mark: Optional[MarkTypes] = None
+    period: Optional[datetime] = None
+    days_count: int
+    marks_count: int
+    average: Optional[float] = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    stddev: Optional[float] = None
+    attendance_rate: Optional[float] = None
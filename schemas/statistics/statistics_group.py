@@ -0,0 +1,13 @@
+import enum
+
+
+class StatisticsDimension(enum.Enum):
+    USER = 'USER'
+    MODULE = 'MODULE'
+    TYPE_OF_MARK = 'TYPE_OF_MARK'
+
+
+class TimeBucket(enum.Enum):
+    DAY = 'day'
+    WEEK = 'week'
+    MONTH = 'month'
@@ -0,0 +1,15 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from schemas.base import BaseSchema
+
+
+class UserModuleStats(BaseSchema):
+    user_id: uuid.UUID
+    module_id: uuid.UUID
+    marks_sum: float
+    marks_count: int
+    days_count: int
+    absences: int
+    last_mark_at: Optional[datetime] = None
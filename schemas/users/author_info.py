@@ -0,0 +1,21 @@
+import uuid
+from typing import Optional
+
+from schemas.base import BaseSchema
+
+
+class AuthorInfo(BaseSchema):
+    """
+    Краткие данные автора поста без контактной информации.
+
+    Attributes:
+        id (uuid.UUID): Идентификатор пользователя.
+        first_name (str): Имя пользователя.
+        last_name (str): Фамилия пользователя.
+        image_id (Optional[uuid.UUID]): Идентификатор изображения профиля.
+    """
+
+    id: uuid.UUID
+    first_name: str
+    last_name: str
+    image_id: Optional[uuid.UUID] = None
@@ -0,0 +1,9 @@
+from typing import List, Optional
+
+from schemas.base import BaseSchema
+from schemas.users.user_marks import UserMarks
+
+
+class UserMarksPage(BaseSchema):
+    users: List[UserMarks]
+    next_cursor: Optional[str] = None
@@ -2,6 +2,7 @@ import uuid
 from typing import List
 
 from repositories.actions_repo import ActionsRepository
+from repositories.modules import ModulesRepository
 from schemas.actions.action import Action
 from schemas.actions.action_add_request import ActionAddRequest
 from schemas.modules.module_info import ModuleInfo
@@ -10,9 +11,10 @@ from schemas.modules.module_users import ModuleUsers
 
 class ActionsService:
 
-    def __init__(self, actions_repo: ActionsRepository):
+    def __init__(self, actions_repo: ActionsRepository, modules_repo: ModulesRepository):
 
         self.actions_repo = actions_repo
+        self.modules_repo = modules_repo
 
     async def enroll_user(self, action_add: ActionAddRequest) -> None:
 
@@ -31,20 +33,8 @@ class ActionsService:
     async def get_modules(self, user_id: uuid.UUID) -> List[ModuleUsers]:
 
         modules = await self.actions_repo.get_modules_by_user_id(user_id)
-        modules_with_lecturer = []
-        for module in modules:
-            user = await self.actions_repo.get_action_by_module_id(module_id=module.id)
-            if user != 'N/A':
-                modules_with_lecturer.append(ModuleUsers(
-                    module=module,
-                    users=[user]
-                ))
-            else:
-                modules_with_lecturer.append(ModuleUsers(
-                    module=module,
-                    users=[]
-                ))
-        return modules_with_lecturer
+        teachers = await self.modules_repo.get_teachers_by_module_ids(module.id for module in modules)
+        return [ModuleUsers(module=module, users=teachers.get(module.id, [])) for module in modules]
 
 
     def delete_user(self):
@@ -11,7 +11,7 @@ Attributes:
     - uuid: Класс UUID из модуля uuid.
     - IntegrityError: Исключение IntegrityError из модуля sqlalchemy.exc.
     - HttpHeaders: Класс HttpHeaders из модуля constants.http_headers.
-    - PasswordHelper: Класс PasswordHelper из модуля helpers.password_helper.
+    - PasswordService: Класс PasswordService из модуля services.password_service.
     - RefreshTokenRepository: Класс RefreshTokenRepository из модуля repositories.refresh_token.
     - UsersRepository: Класс UsersRepository из модуля repositories.users.
     - TokensPair: Класс TokensPair из модуля schemas.token.
@@ -32,14 +32,14 @@ from phone_gen import PhoneNumber
 from sqlalchemy.exc import IntegrityError
 
 from constants.http_headers import HttpHeaders
-from helpers.password_helper import PasswordHelper
 from models.user import Roles
 from repositories.refresh_token import RefreshTokenRepository
 from repositories.users import UsersRepository
-from schemas.token import TokensPair, TokenCorruptedException
+from schemas.token import TokensPair, TokenCorruptedException, TokenRefreshNotFoundException
 from schemas.users.UserAuth0 import UserAuth0
 from schemas.users.user import UserAddRequest, User, UserExistsException, UserLogin, UserNotFoundException, \
     WrongPasswordException
+from services.password_service import PasswordService
 from services.token import JwtProcessorSingleton
 from settings import AppSettings
 
@@ -58,7 +58,7 @@ class AuthService:
         """
 
         self.users_repo = users_repo
-        self.password_helper = PasswordHelper()
+        self.password_service = PasswordService()
         self.jwt_processor = JwtProcessorSingleton(session=self.users_repo.session)
         self.refresh_token_repo = refresh_token_repo
         self.http_headers = HttpHeaders()
@@ -73,6 +73,7 @@ class AuthService:
             :raise: UserExistsException: Если пользователь уже существует.
         """
 
+        password_hash = await self.password_service.hash_password(user_add.password)
         try:
             user = User(
                 id=uuid.uuid4(),
@@ -82,7 +83,7 @@ class AuthService:
                 city=user_add.city,
                 phone_number=user_add.phone_number,
                 email=user_add.email,
-                password_hash=self.password_helper.hash_password(user_add.password),
+                password_hash=password_hash,
                 role=Roles.ADMIN
             )
 
@@ -104,14 +105,17 @@ class AuthService:
         user = await self.users_repo.get_by_email(email=user_to_login.email)
         if not user:
             raise UserNotFoundException
-        if not self.password_helper.check_password(login_password=user_to_login.password,
-                                                   password=user.password_hash):
+        if not await self.password_service.check_password(login_password=user_to_login.password,
+                                                          password=user.password_hash):
             raise WrongPasswordException
+        if self.password_service.needs_rehash(user.password_hash):
+            password_hash = await self.password_service.hash_password(user_to_login.password)
+            await self.users_repo.update_password_hash(user.id, password_hash)
         access_token, access_token_id = self.jwt_processor.access_jwt_processor.generate(
             user_id=user.id, role=user.role.value)
         refresh_token, refresh_token_id = self.jwt_processor.refresh_jwt_processor.generate(
             user_id=user.id, role=user.role.value)
-        await self.refresh_token_repo.save_item(refresh_token_id)
+        await self.refresh_token_repo.save_item(refresh_token_id, user_id=user.id)
         return TokensPair(access_token=access_token,
                           refresh_token=refresh_token,
                           type="bearer")
@@ -119,7 +123,7 @@ class AuthService:
     async def login_with_auth0(self, user_to_login: UserAuth0) -> TokensPair:
         user = await self.users_repo.get_by_email(email=user_to_login.email)
         if not user:
-
+            password_hash = await self.password_service.hash_password(self.app_settings.artificial_password)
             user = User(
                 id=uuid.uuid4(),
                 first_name=user_to_login.first_name,
@@ -128,7 +132,7 @@ class AuthService:
                 city='Not Provided',
                 phone_number=PhoneNumber("Great Britain").get_number(),
                 email=user_to_login.email,
-                password_hash=self.password_helper.hash_password(self.app_settings.artificial_password),
+                password_hash=password_hash,
                 role=Roles.STUDENT
             )
 
@@ -137,7 +141,7 @@ class AuthService:
             user_id=user.id, role=user.role.value)
         refresh_token, refresh_token_id = self.jwt_processor.refresh_jwt_processor.generate(
             user_id=user.id, role=user.role.value)
-        await self.refresh_token_repo.save_item(refresh_token_id)
+        await self.refresh_token_repo.save_item(refresh_token_id, user_id=user.id)
         return TokensPair(access_token=access_token,
                           refresh_token=refresh_token,
                           type="bearer")
@@ -152,7 +156,20 @@ class AuthService:
         """
 
         refresh_token_decode = self.jwt_processor.refresh_jwt_processor.decode(refresh_token)
-        await self.refresh_token_repo.delete_item(refresh_token_decode.token_id)
+        await self.refresh_token_repo.delete_item(refresh_token_decode.token_id, user_id=refresh_token_decode.user_id)
+
+    async def logout_everywhere(self, refresh_token: str) -> None:
+        """
+        Завершает все сессии пользователя, которому принадлежит токен обновления.
+
+            :param refresh_token: Токен обновления.
+            :raise: TokenRefreshNotFoundException: Если токен обновления не найден.
+        """
+
+        refresh_token_decode = self.jwt_processor.refresh_jwt_processor.decode(refresh_token)
+        if not await self.refresh_token_repo.get_item(refresh_token_decode.token_id):
+            raise TokenRefreshNotFoundException
+        await self.refresh_token_repo.delete_items(refresh_token_decode.user_id)
 
     async def refresh(self, refresh_token: str) -> TokensPair:
         """
@@ -164,7 +181,6 @@ class AuthService:
         """
         try:
             refresh_token_decode = self.jwt_processor.refresh_jwt_processor.decode(refresh_token)
-            await self.refresh_token_repo.delete_item(refresh_token_decode.token_id)
 
             new_access_token, new_access_token_id = self.jwt_processor.access_jwt_processor.generate(
                 user_id=refresh_token_decode.user_id,
@@ -172,7 +188,8 @@ class AuthService:
             new_refresh_token, new_refresh_token_id = self.jwt_processor.refresh_jwt_processor.generate(
                 user_id=refresh_token_decode.user_id,
                 role=refresh_token_decode.role)
-            await self.refresh_token_repo.save_item(new_refresh_token_id)
+            await self.refresh_token_repo.rotate_item(refresh_token_decode.token_id, new_refresh_token_id,
+                                                      user_id=refresh_token_decode.user_id)
         except AttributeError as error:
             raise TokenCorruptedException from error
 
@@ -1,16 +1,26 @@
 from dateutil.parser import parse
 
+import csv
+import io
 from datetime import datetime, timezone
 import uuid
-from typing import List
+from typing import List, Optional, AsyncIterable, Iterable, Dict, Any
+
+from pydantic import ValidationError
+
+from helpers.cursor_helper import CursorHelper
 
 from repositories.actions_repo import ActionsRepository
 from repositories.days_repository import DaysRepository
 from repositories.modules import ModulesRepository
 from schemas.days.day import Day
 from schemas.days.day_add_request import DayAddRequest
+from schemas.days.day_import_result import DayImportResult, DayImportError
 from schemas.days.day_module import DayModule
+from schemas.days.module_gradebook import ModuleGradebook
+from schemas.cursor import CursorCorruptedException
 from schemas.users.user_marks import UserMarks
+from schemas.users.user_marks_page import UserMarksPage
 
 
 class DaysService:
@@ -21,30 +31,52 @@ class DaysService:
         self.actions_repo = actions_repo
 
     async def add_day(self, day_add: DayAddRequest):
-
-        frontend_datetime = datetime.strptime(day_add.date, "%Y-%m-%dT%H:%M:%S.%fZ")
-
-        formatted_date = frontend_datetime.strftime("%Y-%m-%d %H:%M:%S.%f")
-
-        day = Day(
-            id=uuid.uuid4(),
-            presence=day_add.presence,
-            mark=day_add.mark,
-            type_of_mark=day_add.type_of_mark,
-            user_id=day_add.user_id,
-            module_id=day_add.module_id,
-            date=formatted_date
-        )
-
-        await self.days_repo.add_day(day)
-
-    async def get_days_by_module(self, module_id: uuid.UUID):
-        days = await self.days_repo.get_days_by_module_id(module_id)
-        if not days:
-            return []
-        else:
-            pass
-
+        await self.days_repo.add_day(self.__to_Day(day_add))
+
+    async def import_days(self, rows: Iterable[Dict[str, Any]]) -> DayImportResult:
+        """
+        Импортирует пакет оценок.
+
+        Невалидные строки и строки с несуществующими user_id или module_id пропускаются
+        и возвращаются в списке ошибок, остальные записываются одной транзакцией.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): Строки с полями DayAddRequest.
+
+        Returns:
+            DayImportResult: Количество импортированных оценок и ошибки по строкам.
+        """
+
+        numbered_days = []
+        errors = []
+        for row_number, row in enumerate(rows, start=1):
+            try:
+                numbered_days.append((row_number, self.__to_Day(DayAddRequest.model_validate(row))))
+            except (ValidationError, ValueError) as exc:
+                errors.append(DayImportError(row=row_number, error=str(exc)))
+
+        user_ids, module_ids = await self.days_repo.get_existing_references(
+            {day.user_id for _, day in numbered_days}, {day.module_id for _, day in numbered_days})
+        days = []
+        for row_number, day in numbered_days:
+            if day.user_id not in user_ids:
+                errors.append(DayImportError(row=row_number, error=f"Unknown user_id {day.user_id}"))
+            elif day.module_id not in module_ids:
+                errors.append(DayImportError(row=row_number, error=f"Unknown module_id {day.module_id}"))
+            else:
+                days.append(day)
+        errors.sort(key=lambda error: error.row)
+
+        await self.days_repo.add_days(days)
+        return DayImportResult(imported=len(days), errors=errors)
+
+    async def import_days_csv(self, content: str) -> DayImportResult:
+        reader = csv.DictReader(io.StringIO(content))
+        rows = ({key: value if value != '' else None for key, value in row.items()} for row in reader)
+        return await self.import_days(rows)
+
+    async def get_days_by_module(self, module_id: uuid.UUID) -> ModuleGradebook:
+        return await self.days_repo.get_days_by_module_id(module_id)
 
     async def get_days_by_user(self, user_id: uuid.UUID) -> List[UserMarks]:
         days = await self.days_repo.get_days_by_user_id(user_id)
@@ -55,9 +87,38 @@ class DaysService:
     async def get_days_users(self) -> List[UserMarks]:
         return await self.days_repo.get_days_users()
 
+    async def get_days_users_page(self, limit: int, cursor: Optional[str] = None) -> UserMarksPage:
+        after = None
+        if cursor:
+            user_id, date, day_id = CursorHelper.decode(cursor, size=3)
+            try:
+                after = (uuid.UUID(user_id), datetime.fromisoformat(date), uuid.UUID(day_id))
+            except ValueError as exc:
+                raise CursorCorruptedException from exc
+
+        users_marks, next_key = await self.days_repo.get_days_users_page(limit=limit, after=after)
+        next_cursor = CursorHelper.encode(*next_key) if next_key else None
+        return UserMarksPage(users=users_marks, next_cursor=next_cursor)
+
+    def stream_days_users(self) -> AsyncIterable[UserMarks]:
+        return self.days_repo.stream_days_users()
+
     async def get_days_by_teacher(self, teacher_id: uuid.UUID) -> List[UserMarks]:
-        module_ids = await self.actions_repo.get_module_ids_by_teacher_id(teacher_id=teacher_id)
-        print(module_ids)
+        return await self.days_repo.get_days_by_teacher_id(teacher_id=teacher_id)
 
-        return await self.days_repo.get_days_by_teacher_id(module_ids=module_ids)
+    @staticmethod
+    def __to_Day(day_add: DayAddRequest) -> Day:
+
+        frontend_datetime = datetime.strptime(day_add.date, "%Y-%m-%dT%H:%M:%S.%fZ")
+
+        formatted_date = frontend_datetime.strftime("%Y-%m-%d %H:%M:%S.%f")
 
+        return Day(
+            id=uuid.uuid4(),
+            presence=day_add.presence,
+            mark=day_add.mark,
+            type_of_mark=day_add.type_of_mark,
+            user_id=day_add.user_id,
+            module_id=day_add.module_id,
+            date=formatted_date
+        )
@@ -0,0 +1,191 @@
+"""
+Модуль ExportService
+
+Этот модуль содержит сервис выгрузки оценок для аналитики.
+
+Оценки читаются из базы данных пачками через серверный курсор, каждая пачка
+кодируется в колоночный формат и сразу отдается клиенту. Размер пачки задает
+export_batch_size: он же становится размером группы строк Parquet и пакета
+записей Arrow. Кодирование выполняется в потоке, чтобы не блокировать цикл событий.
+
+Classes:
+    - ExportService: Потоковая выгрузка оценок в CSV, Arrow IPC или Parquet.
+"""
+
+import asyncio
+import csv
+import enum
+import io
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Optional, Sequence
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy.engine import Row
+
+from repositories.days_repository import DaysRepository
+from schemas.exports.export_format import ExportFormat
+from settings import ExportSettings
+
+settings = ExportSettings()
+
+MARKS_SCHEMA = pa.schema([
+    ('day_id', pa.string()),
+    ('user_id', pa.string()),
+    ('first_name', pa.string()),
+    ('last_name', pa.string()),
+    ('module_id', pa.string()),
+    ('module_title', pa.string()),
+    ('module_alias', pa.string()),
+    ('date', pa.timestamp('us')),
+    ('presence', pa.dictionary(pa.int8(), pa.string())),
+    ('type_of_mark', pa.dictionary(pa.int8(), pa.string())),
+    ('mark', pa.float64())
+])
+
+
+class ExportService:
+
+    def __init__(self, days_repo: DaysRepository):
+
+        self.days_repo = days_repo
+
+    async def export_marks(self, export_format: ExportFormat, module_id: Optional[uuid.UUID] = None,
+                           date_from: Optional[datetime] = None, date_to: Optional[datetime] = None,
+                           teacher_id: Optional[uuid.UUID] = None) -> AsyncIterator[bytes]:
+        """
+        Выгружает оценки в файл заданного формата.
+
+        Args:
+            export_format (ExportFormat): Формат файла.
+            module_id (Optional[uuid.UUID]): Только оценки модуля.
+            date_from (Optional[datetime]): Только оценки не раньше даты.
+            date_to (Optional[datetime]): Только оценки раньше даты.
+            teacher_id (Optional[uuid.UUID]): Только оценки модулей преподавателя.
+
+        Returns:
+            AsyncIterator[bytes]: Содержимое файла по частям.
+        """
+
+        encoder = {
+            ExportFormat.CSV: _CsvEncoder,
+            ExportFormat.ARROW: _ArrowEncoder,
+            ExportFormat.PARQUET: _ParquetEncoder
+        }[export_format]()
+        batches = self.days_repo.stream_marks_export(settings.export_batch_size, module_id=module_id,
+                                                     date_from=date_from, date_to=date_to, teacher_id=teacher_id)
+        async for batch in batches:
+            chunk = await asyncio.to_thread(encoder.write, batch)
+            if chunk:
+                yield chunk
+        chunk = await asyncio.to_thread(encoder.close)
+        if chunk:
+            yield chunk
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Приемник записи, который отдает записанные байты частями.
+
+    Позиция продолжает расти после опустошения, поэтому смещения, которые
+    ParquetWriter записывает в метаданные файла, остаются верными.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+class _Encoder(ABC):
+    """
+    Кодирует пачки строк в приемник, который опустошается после каждой пачки.
+    """
+
+    def __init__(self):
+        self.sink = _ChunkSink()
+
+    @abstractmethod
+    def write(self, rows: Sequence[Row]) -> bytes:
+        """
+        Кодирует пачку строк и возвращает накопленные байты.
+        """
+
+    def close(self) -> bytes:
+        return self.sink.drain()
+
+    @staticmethod
+    def _to_table(rows: Sequence[Row]) -> pa.Table:
+        columns = {name: [] for name in MARKS_SCHEMA.names}
+        for row in rows:
+            for name, value in row._mapping.items():
+                if isinstance(value, uuid.UUID):
+                    value = str(value)
+                elif isinstance(value, enum.Enum):
+                    value = value.value
+                columns[name].append(value)
+        return pa.Table.from_pydict(columns, schema=MARKS_SCHEMA)
+
+
+class _CsvEncoder(_Encoder):
+
+    def __init__(self):
+        super().__init__()
+        self.text = io.TextIOWrapper(self.sink, encoding='utf-8', newline='', write_through=True)
+        self.writer = csv.writer(self.text)
+        self.writer.writerow(MARKS_SCHEMA.names)
+
+    def write(self, rows: Sequence[Row]) -> bytes:
+        self.writer.writerows(
+            [value.value if isinstance(value, enum.Enum) else value for value in row]
+            for row in rows
+        )
+        return self.sink.drain()
+
+
+class _ArrowEncoder(_Encoder):
+
+    def __init__(self):
+        super().__init__()
+        self.writer = pa.ipc.new_stream(self.sink, MARKS_SCHEMA)
+
+    def write(self, rows: Sequence[Row]) -> bytes:
+        self.writer.write_table(self._to_table(rows))
+        return self.sink.drain()
+
+    def close(self) -> bytes:
+        self.writer.close()
+        return self.sink.drain()
+
+
+class _ParquetEncoder(_Encoder):
+
+    def __init__(self):
+        super().__init__()
+        self.writer = pq.ParquetWriter(self.sink, MARKS_SCHEMA, compression='zstd')
+
+    def write(self, rows: Sequence[Row]) -> bytes:
+        self.writer.write_table(self._to_table(rows), row_group_size=len(rows))
+        return self.sink.drain()
+
+    def close(self) -> bytes:
+        self.writer.close()
+        return self.sink.drain()
@@ -0,0 +1,148 @@
+"""
+Модуль для подписи и проверки JWT
+
+Этот модуль содержит интерфейс алгоритма подписи JWT и его реализации.
+JwtProcessor работает только через интерфейс JwtSigner, поэтому алгоритм
+подписи выбирается настройкой jwt_algorithm без изменения остального кода.
+
+Classes:
+    - JwtSigner: Интерфейс алгоритма подписи JWT.
+    - HmacJwtSigner: Подпись общим секретом (HS256).
+    - EcdsaJwtSigner: Подпись закрытым ключом ECDSA (ES256) с ротацией ключей по kid.
+
+Functions:
+    - create_signer: Создает алгоритм подписи по настройкам.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from jose import jwt, jwk, JWTError
+from jose.backends.base import Key
+
+from schemas.token import TokenExpiredException, TokenCorruptedException
+
+
+class JwtSigner(ABC):
+    """
+    Интерфейс алгоритма подписи JWT.
+
+    Attributes:
+        algorithm (str): Название алгоритма подписи в заголовке JWT.
+    """
+
+    algorithm: str
+
+    @abstractmethod
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """
+        Подписывает полезную нагрузку.
+
+        Args:
+            claims (Dict[str, Any]): Полезная нагрузка токена.
+
+        Returns:
+            str: Подписанный токен.
+        """
+
+    @abstractmethod
+    def decode(self, token: str) -> Dict[str, Any]:
+        """
+        Проверяет подпись и срок действия токена.
+
+        Args:
+            token (str): Токен.
+
+        Returns:
+            Dict[str, Any]: Полезная нагрузка токена.
+
+        Raises:
+            TokenExpiredException: Если токен истек.
+            TokenCorruptedException: Если токен поврежден или подписан неизвестным ключом.
+        """
+
+    def _verify(self, token: str, key: Key) -> Dict[str, Any]:
+        try:
+            return jwt.decode(token, key, algorithms=[self.algorithm])
+        except jwt.ExpiredSignatureError as exc:
+            raise TokenExpiredException from exc
+        except JWTError as exc:
+            raise TokenCorruptedException from exc
+
+
+class HmacJwtSigner(JwtSigner):
+    """
+    Подпись JWT общим секретом.
+    """
+
+    algorithm = 'HS256'
+
+    def __init__(self, secret_key: str):
+        self._key = jwk.construct(secret_key, self.algorithm)
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        return jwt.encode(claims, self._key, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        return self._verify(token, self._key)
+
+
+class EcdsaJwtSigner(JwtSigner):
+    """
+    Подпись JWT закрытым ключом ECDSA.
+
+    Токены подписываются активным ключом, его идентификатор записывается в заголовок kid.
+    Проверка принимает любой ключ из набора, поэтому при ротации старый ключ остается
+    в наборе, пока не истекут подписанные им токены.
+    """
+
+    algorithm = 'ES256'
+
+    def __init__(self, private_keys: Dict[str, str], active_kid: str):
+        """
+        Args:
+            private_keys (Dict[str, str]): Закрытые ключи в формате PEM по идентификатору kid.
+            active_kid (str): Идентификатор ключа для подписи новых токенов.
+        """
+
+        if active_kid not in private_keys:
+            raise ValueError(f"Signing key {active_kid} is not configured")
+        self._active_kid = active_kid
+        self._signing_key = jwk.construct(private_keys[active_kid], self.algorithm)
+        self._verifying_keys = {kid: jwk.construct(pem, self.algorithm).public_key()
+                                for kid, pem in private_keys.items()}
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        return jwt.encode(claims, self._signing_key, algorithm=self.algorithm, headers={'kid': self._active_kid})
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            kid = jwt.get_unverified_header(token).get('kid')
+        except JWTError as exc:
+            raise TokenCorruptedException from exc
+        key = self._verifying_keys.get(kid)
+        if key is None:
+            raise TokenCorruptedException
+        return self._verify(token, key)
+
+
+def create_signer(algorithm: str, secret_key: str, private_keys: Optional[Dict[str, str]] = None,
+                  active_kid: Optional[str] = None) -> JwtSigner:
+    """
+    Создает алгоритм подписи JWT.
+
+    Args:
+        algorithm (str): HS256 или ES256.
+        secret_key (str): Общий секрет для HS256.
+        private_keys (Optional[Dict[str, str]]): Закрытые ключи ES256 по kid.
+        active_kid (Optional[str]): Ключ ES256 для подписи новых токенов.
+
+    Returns:
+        JwtSigner: Алгоритм подписи.
+    """
+
+    if algorithm == HmacJwtSigner.algorithm:
+        return HmacJwtSigner(secret_key)
+    if algorithm == EcdsaJwtSigner.algorithm:
+        return EcdsaJwtSigner(private_keys or {}, active_kid)
+    raise ValueError(f"Unsupported JWT algorithm: {algorithm}")
@@ -32,23 +32,7 @@ class ModulesService:
         self.actions_repo = actions_repo
 
     async def get_modules(self) -> List[ModuleUsers]:
-
-        modules = await self.modules_repo.get_all()
-        modules_with_lecturer = []
-
-        for module in modules:
-            user = await self.actions_repo.get_action_by_module_id(module_id=module.id)
-            if user != 'N/A':
-                modules_with_lecturer.append(ModuleUsers(
-                    module=module,
-                    users=[user]
-                ))
-            else:
-                modules_with_lecturer.append(ModuleUsers(
-                    module=module,
-                    users=[]
-                ))
-        return modules_with_lecturer
+        return await self.modules_repo.get_all_with_teachers()
 
 
     # async def get_module(self, module_alias: str) -> ModuleInfo:
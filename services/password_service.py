@@ -0,0 +1,94 @@
+"""
+Модуль PasswordService
+
+Этот модуль содержит сервис хэширования паролей вне цикла событий.
+
+scrypt намеренно медленный и требует много памяти, поэтому вычисления выполняются
+в общем пуле потоков (hashlib.scrypt освобождает GIL). Семафор ограничивает число
+одновременных вычислений: при массовом входе пользователей запросы ждут своей очереди,
+а остальные обработчики продолжают работать.
+
+Classes:
+    - PasswordService: Асинхронное хэширование и проверка паролей.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from helpers.password_helper import PasswordHelper
+from settings import PasswordSettings
+
+settings = PasswordSettings()
+
+T = TypeVar('T')
+
+
+class PasswordService:
+    """
+    Сервис хэширования паролей, общий для всего процесса.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+
+        if not isinstance(cls._instance, cls):
+            cls._instance = super().__new__(cls)
+            cls._instance.password_helper = PasswordHelper()
+            cls._instance._executor = ThreadPoolExecutor(max_workers=settings.hash_workers,
+                                                         thread_name_prefix='password-hash')
+            cls._instance._semaphore = asyncio.Semaphore(settings.hash_max_concurrency)
+
+        return cls._instance
+
+    async def hash_password(self, password: str) -> str:
+        """
+        Хэширует пароль.
+
+        Args:
+            password (str): Пароль.
+
+        Returns:
+            str: Хэш пароля.
+        """
+
+        return await self._run(self.password_helper.hash_password, password)
+
+    async def check_password(self, login_password: str, password: str) -> bool:
+        """
+        Проверяет пароль по сохраненному хэшу.
+
+        Args:
+            login_password (str): Введенный пользователем пароль.
+            password (str): Сохраненный хэш пароля.
+
+        Returns:
+            bool: True, если пароль верный, иначе False.
+        """
+
+        return await self._run(self.password_helper.check_password, login_password, password)
+
+    def needs_rehash(self, password: str) -> bool:
+        """
+        Проверяет, нужно ли пересчитать хэш пароля после успешного входа.
+
+        Args:
+            password (str): Сохраненный хэш пароля.
+
+        Returns:
+            bool: True, если хэш устарел.
+        """
+
+        return self.password_helper.needs_rehash(password)
+
+    def shutdown(self) -> None:
+        """
+        Останавливает пул потоков.
+        """
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
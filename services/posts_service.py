@@ -1,16 +1,26 @@
+import asyncio
 import datetime
 import uuid
-from typing import List
+from typing import AsyncIterator, List, Optional, Tuple
 
+from helpers.cursor_helper import CursorHelper
+from repositories.post_events import PostEventsBroker
 from repositories.posts_repository import PostsRepository
+from schemas.cursor import CursorCorruptedException
 from schemas.posts.post import Post
 from schemas.posts.post_add_request import PostAddRequest
+from schemas.posts.post_feed_item import PostFeedItem
 from schemas.posts.post_info import PostInfo
+from schemas.posts.posts_page import PostsPage
+from settings import FeedSettings
+
+feed_settings = FeedSettings()
 
 
 class PostsService:
     def __init__(self, posts_repo: PostsRepository):
         self.posts_repo = posts_repo
+        self.post_events = PostEventsBroker()
 
     async def get_posts_by_module(self, module_id: uuid.UUID) -> List[PostInfo]:
         return await self.posts_repo.get_posts_by_module_id(module_id)
@@ -23,9 +33,81 @@ class PostsService:
             post["date"] = datetime.datetime.now()
             post = Post.model_validate(post)
             await self.posts_repo.add_post(post)
+            feed_item = await self.posts_repo.get_feed_item(post.id)
+            await self.post_events.publish(post.module_id, feed_item)
         except Exception as exc:
             print(exc)
 
 
     async def get_all_posts(self) -> List[PostInfo]:
         return await self.posts_repo.get_all_posts()
+
+    async def get_posts_page(self, limit: int, cursor: Optional[str] = None,
+                             module_id: Optional[uuid.UUID] = None) -> PostsPage:
+        after = self.__decode_key(cursor) if cursor else None
+        posts, next_key = await self.posts_repo.get_posts_page(limit=limit, after=after, module_id=module_id)
+        next_cursor = CursorHelper.encode(*next_key) if next_key else None
+        return PostsPage(posts=posts, next_cursor=next_cursor)
+
+    def stream_module_posts(self, module_id: uuid.UUID, last_event_id: Optional[str] = None
+                            ) -> AsyncIterator[Optional[Tuple[str, PostFeedItem]]]:
+        """
+        Возвращает поток новых постов модуля.
+
+        Если передан last_event_id, сначала отправляются посты, опубликованные после него.
+        Подписка оформляется до чтения пропущенных постов, а из событий отбрасываются только
+        посты, уже отправленные при чтении, поэтому пост, опубликованный во время чтения,
+        не теряется и не дублируется. События по ключу (date, id) не фильтруются: дата
+        ставится до вставки, и пост, опубликованный позже соседа с большей датой, тоже доходит.
+
+        Args:
+            module_id (uuid.UUID): Идентификатор модуля.
+            last_event_id (Optional[str]): Идентификатор последнего полученного клиентом события.
+
+        Returns:
+            AsyncIterator[Optional[Tuple[str, PostFeedItem]]]: Пары (идентификатор события, пост)
+                или None, когда пора отправить пульс.
+
+        Raises:
+            CursorCorruptedException: Если last_event_id поврежден.
+        """
+
+        after = self.__decode_key(last_event_id) if last_event_id else None
+        return self.__module_posts(module_id, after)
+
+    async def __module_posts(self, module_id: uuid.UUID, after: Optional[Tuple[datetime.datetime, uuid.UUID]]
+                             ) -> AsyncIterator[Optional[Tuple[str, PostFeedItem]]]:
+        queue = await self.post_events.subscribe(module_id)
+        backfilled = set()
+        try:
+            while after is not None:
+                posts = await self.posts_repo.get_posts_since(module_id, after, feed_settings.feed_backfill_limit)
+                for post in posts:
+                    after = (post.date, post.id)
+                    backfilled.add(post.id)
+                    yield CursorHelper.encode(*after), post
+                if len(posts) < feed_settings.feed_backfill_limit:
+                    break
+            await self.posts_repo.release()
+
+            while True:
+                try:
+                    post = await asyncio.wait_for(queue.get(), timeout=feed_settings.feed_heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if post is None:
+                    return
+                if post.id in backfilled:
+                    continue
+                yield CursorHelper.encode(post.date, post.id), post
+        finally:
+            self.post_events.unsubscribe(module_id, queue)
+
+    @staticmethod
+    def __decode_key(cursor: str) -> Tuple[datetime.datetime, uuid.UUID]:
+        date, post_id = CursorHelper.decode(cursor, size=2)
+        try:
+            return datetime.datetime.fromisoformat(date), uuid.UUID(post_id)
+        except ValueError as exc:
+            raise CursorCorruptedException from exc
@@ -1,26 +1,46 @@
-import math
 import uuid
-from itertools import count
+from typing import List, Optional
 
-from repositories.actions_repo import ActionsRepository
-from repositories.days_repository import DaysRepository
+from repositories.statistics_repository import StatisticsRepository
+from repositories.user_module_stats_repository import UserModuleStatsRepository
+from schemas.statistics.marks_statistics import MarksStatistics
+from schemas.statistics.statistics_group import StatisticsDimension, TimeBucket
+from schemas.statistics.user_module_stats import UserModuleStats
 
 
 class StatisticsService:
 
-    def __init__(self, days_repo: DaysRepository):
-        self.days_repo = days_repo
+    def __init__(self, statistics_repo: StatisticsRepository, user_module_stats_repo: UserModuleStatsRepository):
+        self.statistics_repo = statistics_repo
+        self.user_module_stats_repo = user_module_stats_repo
 
-    async def get_user_statistics(self, user_id: uuid.UUID) -> float:
-        users_marks = await self.days_repo.get_days_by_user_id(user_id)
-        user_marks = users_marks[0]
-        days_count = 0
-        total = 0
-        for day in user_marks.days:
-            if day.mark is not None:
-                total += day.mark
-                days_count += 1
+    async def get_user_statistics(self, user_id: uuid.UUID) -> Optional[float]:
+        user_stats = await self.user_module_stats_repo.get_by_user_id(user_id)
+        marks_count = sum(stats.marks_count for stats in user_stats)
+        if not marks_count:
+            return None
+        return round(sum(stats.marks_sum for stats in user_stats) / marks_count, 2)
 
-        average = round(float(total / days_count), 2)
+    async def get_user_module_summary(self, user_id: uuid.UUID) -> List[UserModuleStats]:
+        return await self.user_module_stats_repo.get_by_user_id(user_id)
 
-        return average
+    async def get_module_summary(self, module_id: uuid.UUID) -> List[UserModuleStats]:
+        return await self.user_module_stats_repo.get_by_module_id(module_id)
+
+    async def get_module_statistics(self, module_id: uuid.UUID,
+                                    bucket: Optional[TimeBucket] = None) -> List[MarksStatistics]:
+        return await self.statistics_repo.get_marks_statistics(group_by=[StatisticsDimension.TYPE_OF_MARK],
+                                                               bucket=bucket,
+                                                               module_id=module_id)
+
+    async def get_cohort_statistics(self, module_id: uuid.UUID,
+                                    bucket: Optional[TimeBucket] = None) -> List[MarksStatistics]:
+        return await self.statistics_repo.get_marks_statistics(group_by=[StatisticsDimension.USER],
+                                                               bucket=bucket,
+                                                               module_id=module_id)
+
+    async def get_teacher_statistics(self, teacher_id: uuid.UUID,
+                                     bucket: Optional[TimeBucket] = None) -> List[MarksStatistics]:
+        return await self.statistics_repo.get_marks_statistics(group_by=[StatisticsDimension.MODULE],
+                                                               bucket=bucket,
+                                                               teacher_id=teacher_id)
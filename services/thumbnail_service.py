@@ -0,0 +1,143 @@
+"""
+Модуль ThumbnailService
+
+Этот модуль содержит сервис уменьшенных копий изображений профиля.
+
+Копии фиксированных размеров создаются в фоне после загрузки изображения и хранятся
+в хранилище файлов рядом с исходным под именем варианта `<size>`. Если копии еще нет,
+она создается при первом запросе. Блокировка на изображение не дает нескольким
+одновременным запросам декодировать один и тот же файл.
+
+Декодирование и масштабирование выполняются в пуле потоков: Pillow освобождает GIL
+на время этих операций.
+
+Classes:
+    - ThumbnailService: Создание и получение уменьшенных копий изображений.
+"""
+
+import asyncio
+import io
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps
+
+from repositories.images_repo import ImagesRepository
+from schemas.images.image_info import ImageInfo, ImageSizeNotAllowedException
+from settings import StorageSettings
+
+settings = StorageSettings()
+
+
+class ThumbnailService:
+    """
+    Сервис уменьшенных копий изображений, общий для всего процесса.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+
+        if not isinstance(cls._instance, cls):
+            cls._instance = super().__new__(cls)
+            cls._instance.blob_store = ImagesRepository.blob_store
+            cls._instance.sizes = sorted(settings.image_thumbnail_sizes)
+            cls._instance._executor = ThreadPoolExecutor(max_workers=settings.image_workers,
+                                                         thread_name_prefix='thumbnail')
+            cls._instance._locks = weakref.WeakValueDictionary()
+            cls._instance._tasks = set()
+
+        return cls._instance
+
+    def schedule(self, image: ImageInfo) -> None:
+        """
+        Запускает создание всех копий изображения в фоне.
+
+        Args:
+            image (ImageInfo): Метаданные исходного изображения.
+        """
+
+        task = asyncio.create_task(self._generate_all(image))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def get_thumbnail(self, image: ImageInfo, size: int) -> ImageInfo:
+        """
+        Получает копию изображения, при необходимости создавая ее.
+
+        Args:
+            image (ImageInfo): Метаданные исходного изображения.
+            size (int): Размер стороны копии в пикселях.
+
+        Returns:
+            ImageInfo: Метаданные копии или исходного изображения, если файл не удалось декодировать.
+
+        Raises:
+            ImageSizeNotAllowedException: Если размер не входит в image_thumbnail_sizes.
+        """
+
+        if size not in self.sizes:
+            raise ImageSizeNotAllowedException
+        variant = str(size)
+        content_type = self._content_type(image)
+        byte_size = await self.blob_store.size(image.digest, variant)
+        if byte_size is None:
+            async with self._lock(image.digest):
+                byte_size = await self.blob_store.size(image.digest, variant)
+                if byte_size is None:
+                    original = b''.join([chunk async for chunk in self.blob_store.read(image.digest)])
+                    try:
+                        byte_size = await self._render_and_store(image, original, size)
+                    except (OSError, Image.DecompressionBombError) as exc:
+                        print(exc)
+                        return image
+        return image.model_copy(update={'variant': variant, 'size': byte_size, 'content_type': content_type})
+
+    def shutdown(self) -> None:
+        """
+        Останавливает пул потоков.
+        """
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _generate_all(self, image: ImageInfo) -> None:
+        async with self._lock(image.digest):
+            missing = [size for size in self.sizes if await self.blob_store.size(image.digest, str(size)) is None]
+            if not missing:
+                return
+            original = b''.join([chunk async for chunk in self.blob_store.read(image.digest)])
+            for size in missing:
+                try:
+                    await self._render_and_store(image, original, size)
+                except (OSError, Image.DecompressionBombError) as exc:
+                    print(exc)
+                    return
+
+    async def _render_and_store(self, image: ImageInfo, original: bytes, size: int) -> int:
+        image_format = 'PNG' if self._content_type(image) == 'image/png' else 'JPEG'
+        data = await asyncio.get_running_loop().run_in_executor(self._executor, self._render, original, size,
+                                                                image_format)
+        return await self.blob_store.put_variant(image.digest, str(size), data)
+
+    def _lock(self, digest: str) -> asyncio.Lock:
+        lock = self._locks.get(digest)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[digest] = lock
+        return lock
+
+    @staticmethod
+    def _content_type(image: ImageInfo) -> str:
+        return 'image/png' if image.content_type in ('image/png', 'image/gif') else 'image/jpeg'
+
+    @staticmethod
+    def _render(original: bytes, size: int, image_format: str) -> bytes:
+        with Image.open(io.BytesIO(original)) as source:
+            source.draft('RGB', (size * 2, size * 2))
+            thumbnail = ImageOps.fit(ImageOps.exif_transpose(source), (size, size), Image.LANCZOS)
+        output = io.BytesIO()
+        if image_format == 'JPEG':
+            thumbnail.convert('RGB').save(output, format=image_format, optimize=True, quality=85)
+        else:
+            thumbnail.save(output, format=image_format, optimize=True)
+        return output.getvalue()
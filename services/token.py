@@ -2,23 +2,23 @@
 Модуль для обработки JWT
 """
 
-import datetime
+import time
 import uuid
-from typing import Tuple
+from typing import Tuple, Dict, Any, Optional
 
-import pytz
 from fastapi import HTTPException
-from jose import jwt, JWTError
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from helpers.ttl_cache import TTLCache
 from repositories.users import UsersRepository
-from schemas.token import TokenExpiredException, TokenCorruptedException
 from schemas.users.user import UserRole
-from settings import JwtSettings
+from services.jwt_signers import JwtSigner, HmacJwtSigner, create_signer
+from settings import JwtSettings, CacheSettings
 
 settings = JwtSettings()
+cache_settings = CacheSettings()
 
 
 class JwtProcessorSingleton:
@@ -33,10 +33,14 @@ class JwtProcessorSingleton:
         session = kwargs.get("session")
         if not isinstance(cls._instance, cls):
             cls._instance = super().__new__(cls)
+            access_signer = create_signer(settings.jwt_algorithm, settings.access_secret_key,
+                                          settings.access_signing_keys, settings.access_signing_kid)
+            refresh_signer = create_signer(settings.jwt_algorithm, settings.refresh_secret_key,
+                                           settings.refresh_signing_keys, settings.refresh_signing_kid)
             cls._instance.access_jwt_processor = AccessJwtProcessor(secret_key=settings.access_secret_key,
-                                                                    session=session)
+                                                                    session=session, signer=access_signer)
             cls._instance.refresh_jwt_processor = RefreshJwtProcessor(secret_key=settings.refresh_secret_key,
-                                                                      session=session)
+                                                                      session=session, signer=refresh_signer)
 
         return cls._instance
 
@@ -46,18 +50,22 @@ class JwtProcessor:
     Базовый класс для обработки JWT
     """
 
-    algorithm = 'HS256'
-
-    def __init__(self, secret_key: str, session: AsyncSession):
+    def __init__(self, secret_key: str, session: AsyncSession, signer: Optional[JwtSigner] = None):
         """
         Инициализирует экземпляр класса JwtProcessor.
 
         Args:
             secret_key (str): Секретный ключ для создания и проверки подписи JWT.
             session (AsyncSession): Сессия базы данных.
+            signer (Optional[JwtSigner]): Алгоритм подписи. По умолчанию HS256 с secret_key.
         """
         self.secret_key = secret_key
         self.session = session
+        self.signer = signer or HmacJwtSigner(secret_key)
+
+    @property
+    def algorithm(self) -> str:
+        return self.signer.algorithm
 
     def _generate(self, delta_time_in_s: int, user_id: str, role: str) -> Tuple[str, str]:
         """
@@ -72,16 +80,13 @@ class JwtProcessor:
             Tuple[str, str]: Generated token and its id.
         """
 
-        request_tz = 'UTC'
-        exp_time = datetime.datetime.now(pytz.timezone(request_tz)) + \
-            datetime.timedelta(seconds=delta_time_in_s)
         token_id = str(uuid.uuid4())
-        token = jwt.encode({
+        token = self.signer.encode({
             'token_id': token_id,
             'role': role,
             'user_id': str(user_id),
-            'exp': str(int(exp_time.timestamp()))
-        }, self.secret_key, algorithm=self.algorithm)
+            'exp': int(time.time()) + delta_time_in_s
+        })
 
         return token, token_id
 
@@ -96,21 +101,28 @@ class JwtProcessor:
                 TokenCorruptedException, если токен поврежден.
         """
 
-        try:
+        return UserRole(**self._decode_payload(token))
 
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-        except jwt.ExpiredSignatureError as exc:
-            raise TokenExpiredException from exc
-        except JWTError as exc:
-            raise TokenCorruptedException from exc
-        return UserRole(**payload)
+    def _decode_payload(self, token: str) -> Dict[str, Any]:
+        """
+        Проверяет подпись и срок действия токена и возвращает его полезную нагрузку.
+        """
+
+        return self.signer.decode(token)
 
 
 class AccessJwtProcessor(JwtProcessor):
     """
     Класс для работы с JWT доступа
+
+    Декодированные токены кэшируются до истечения их срока действия,
+    но не дольше token_cache_ttl.
     """
 
+    def __init__(self, secret_key: str, session: AsyncSession, signer: Optional[JwtSigner] = None):
+        super().__init__(secret_key=secret_key, session=session, signer=signer)
+        self._decoded_tokens = TTLCache(maxsize=cache_settings.token_cache_size, ttl=cache_settings.token_cache_ttl)
+
     def generate(self, user_id: str, role: str):
         """
         Создание токена доступа.
@@ -136,7 +148,12 @@ class AccessJwtProcessor(JwtProcessor):
             UserRole: Данные UserRole токена или None, если токен невалиден.
         """
 
-        return self._decode(token)
+        user = self._decoded_tokens.get(token)
+        if user is None:
+            payload = self._decode_payload(token)
+            user = UserRole(**payload)
+            self._decoded_tokens.set(token, user, ttl=float(payload['exp']) - time.time())
+        return user
 
     async def refresh(self, token: str):
         """
@@ -11,16 +11,18 @@ Attributes:
 
 import uuid
 
-from typing import Union
+from typing import AsyncIterable, AsyncIterator, Optional, Union
 
 from sqlalchemy.exc import IntegrityError
 
-from helpers.password_helper import PasswordHelper
 from repositories.images_repo import ImagesRepository
 from repositories.users import UsersRepository
 from schemas.images.image_add_request import ImageAddRequest
+from schemas.images.image_info import ImageInfo, ImageNotFoundException, ImageTypeNotAllowedException
 from schemas.users.user import UserListResponse, UserNotFoundException, \
     UsersNotFoundException, UserInfo, UserUpdateRequest, UserExistsException, User
+from services.password_service import PasswordService
+from services.thumbnail_service import ThumbnailService
 
 
 class UsersService:
@@ -40,7 +42,8 @@ class UsersService:
 
         self.users_repo = users_repo
         self.images_repo = images_repo
-        self.password_helper = PasswordHelper()
+        self.password_service = PasswordService()
+        self.thumbnail_service = ThumbnailService()
 
     async def get_users(self) -> UserListResponse:
         """
@@ -110,6 +113,7 @@ class UsersService:
             UserExistsException: Если пользователь с такими данными уже существует.
         """
 
+        password_hash = await self.password_service.hash_password(update_user.password)
         user = User(
             id=update_user.id,
             first_name=update_user.first_name,
@@ -118,7 +122,7 @@ class UsersService:
             city=update_user.city,
             address=update_user.address,
             email=update_user.email,
-            password_hash=self.password_helper.hash_password(update_user.password),
+            password_hash=password_hash,
             role=update_user.role
         )
         try:
@@ -126,8 +130,63 @@ class UsersService:
         except IntegrityError as error:
             raise UserExistsException from error
 
-    async def add_image(self, image_add_request: ImageAddRequest):
-        await self.images_repo.add_image(image_add=image_add_request)
+    async def set_user_image(self, user_id: uuid.UUID, name: str, content_type: str,
+                             chunks: AsyncIterable[bytes]) -> ImageInfo:
+        """
+        Сохраняет изображение профиля пользователя.
+
+        Args:
+            user_id (uuid.UUID): Идентификатор пользователя.
+            name (str): Имя файла.
+            content_type (str): MIME-тип файла.
+            chunks (AsyncIterable[bytes]): Содержимое файла по блокам.
+
+        Returns:
+            ImageInfo: Метаданные сохраненного изображения.
+
+        Raises:
+            ImageTypeNotAllowedException: Если файл не является изображением.
+            ImageTooLargeException: Если изображение превышает допустимый размер.
+        """
+
+        if not content_type.startswith('image/'):
+            raise ImageTypeNotAllowedException
+        image_add = ImageAddRequest(id=uuid.uuid4(), name=name[:50], content_type=content_type)
+        image = await self.images_repo.add_image(image_add=image_add, chunks=chunks)
+        previous_image_id = await self.users_repo.set_image(user_id=user_id, image_id=image.id)
+        if previous_image_id:
+            await self.images_repo.delete_image(previous_image_id)
+        self.thumbnail_service.schedule(image)
+        return image
+
+    async def get_user_image(self, user_id: uuid.UUID, size: Optional[int] = None) -> ImageInfo:
+        """
+        Получает метаданные изображения профиля пользователя или его уменьшенной копии.
+
+        Args:
+            user_id (uuid.UUID): Идентификатор пользователя.
+            size (Optional[int]): Размер уменьшенной копии, по умолчанию исходное изображение.
+
+        Returns:
+            ImageInfo: Метаданные изображения.
+
+        Raises:
+            ImageNotFoundException: Если у пользователя нет изображения.
+            ImageSizeNotAllowedException: Если размер не поддерживается.
+        """
+
+        image = await self.images_repo.get_user_image(user_id=user_id)
+        if not image:
+            raise ImageNotFoundException
+        if size is not None:
+            return await self.thumbnail_service.get_thumbnail(image, size)
+        return image
+
+    def image_path(self, image: ImageInfo) -> Optional[str]:
+        return self.images_repo.image_path(image)
+
+    def read_image(self, image: ImageInfo, start: int = 0, length: Optional[int] = None) -> AsyncIterator[bytes]:
+        return self.images_repo.read_image(image, start=start, length=length)
 
     async def delete_user(self, user_id: uuid.UUID) -> None:
         try:
@@ -6,6 +6,8 @@
 """
 
 
+from typing import Dict, List, Optional
+
 from dotenv import load_dotenv
 from pydantic import PostgresDsn, RedisDsn, Field
 from pydantic_settings import BaseSettings
@@ -32,10 +34,30 @@ class DatabaseSettings(BaseSettings):
     Attributes:
         postgres_url (PostgresDsn): Строка подключения к PostgreSQL
         redis_url (RedisDsn): Строка подключения к Redis
+        pool_size (int): Количество постоянных соединений в пуле.
+        max_overflow (int): Количество соединений сверх pool_size.
+        pool_timeout (float): Время ожидания свободного соединения в секундах.
+        pool_recycle (int): Время жизни соединения в секундах (-1 - без ограничения).
+        pool_pre_ping (bool): Проверять соединение перед выдачей из пула.
+        statement_cache_size (int): Размер кэша подготовленных запросов asyncpg.
+        sql_echo (bool): Логировать SQL-запросы.
+        redis_max_connections (int): Максимальное количество соединений в пуле Redis.
+        redis_pool_timeout (int): Время ожидания свободного соединения Redis в секундах.
+        redis_health_check_interval (int): Интервал проверки простаивающих соединений Redis в секундах.
     """
 
     postgres_url: PostgresDsn
     redis_url: RedisDsn
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 100
+    sql_echo: bool = False
+    redis_max_connections: int = 50
+    redis_pool_timeout: int = 5
+    redis_health_check_interval: int = 30
 
 
 class JwtSettings(BaseSettings):
@@ -47,12 +69,43 @@ class JwtSettings(BaseSettings):
         access_expiration (int): Время истечения токенов доступа в секундах.
         refresh_secret_key (str): Секретный ключ для генерации токенов обновления.
         refresh_expiration (int): Время истечения токенов обновления в секундах.
+        refresh_max_sessions (int): Максимальное количество одновременных сессий пользователя.
+        jwt_algorithm (str): Алгоритм подписи токенов (HS256 или ES256).
+        access_signing_keys (Dict[str, str]): Закрытые ключи ES256 токенов доступа в формате PEM по kid.
+        access_signing_kid (Optional[str]): Ключ ES256 для подписи новых токенов доступа.
+        refresh_signing_keys (Dict[str, str]): Закрытые ключи ES256 токенов обновления в формате PEM по kid.
+        refresh_signing_kid (Optional[str]): Ключ ES256 для подписи новых токенов обновления.
     """
 
     access_secret_key: str
     access_expiration: int
     refresh_secret_key: str
     refresh_expiration: int
+    refresh_max_sessions: int = 10
+    jwt_algorithm: str = 'HS256'
+    access_signing_keys: Dict[str, str] = {}
+    access_signing_kid: Optional[str] = None
+    refresh_signing_keys: Dict[str, str] = {}
+    refresh_signing_kid: Optional[str] = None
+
+
+class CacheSettings(BaseSettings):
+    """
+    Представляет настройки кэшей авторизации
+
+    Attributes:
+        token_cache_size (int): Максимальное количество декодированных токенов доступа в кэше.
+        token_cache_ttl (int): Время жизни декодированного токена в кэше в секундах.
+        user_cache_size (int): Максимальное количество профилей пользователей в кэше.
+        user_cache_ttl (int): Время жизни профиля пользователя в кэше в секундах.
+        user_cache_redis (bool): Хранить профили пользователей также в Redis.
+    """
+
+    token_cache_size: int = 10000
+    token_cache_ttl: int = 60
+    user_cache_size: int = 10000
+    user_cache_ttl: int = 30
+    user_cache_redis: bool = False
 
 
 class PasswordSettings(BaseSettings):
@@ -60,10 +113,69 @@ class PasswordSettings(BaseSettings):
     Представляет настройки паролей
 
     Attributes:
-        password_salt (str): Соль для хеширования паролей.
+        password_salt (str): Соль устаревших хэшей SHA-256.
+        scrypt_n (int): Параметр стоимости scrypt, степень двойки.
+        scrypt_r (int): Размер блока scrypt.
+        scrypt_p (int): Параметр параллелизма scrypt.
+        hash_workers (int): Количество потоков для хэширования паролей.
+        hash_max_concurrency (int): Максимальное количество одновременных вычислений хэша.
     """
 
     password_salt: str = Field(alias='salt_password')
+    scrypt_n: int = 2 ** 14
+    scrypt_r: int = 8
+    scrypt_p: int = 1
+    hash_workers: int = 4
+    hash_max_concurrency: int = 8
+
+
+class StorageSettings(BaseSettings):
+    """
+    Представляет настройки хранилища файлов
+
+    Attributes:
+        blob_root (str): Каталог локального хранилища файлов.
+        image_max_size (int): Максимальный размер изображения в байтах.
+        upload_chunk_size (int): Размер блока чтения и отдачи файла в байтах.
+        image_cache_max_age (int): Время кэширования изображений клиентами и CDN в секундах.
+        image_thumbnail_sizes (List[int]): Размеры уменьшенных копий изображений в пикселях.
+        image_workers (int): Количество потоков для создания уменьшенных копий.
+    """
+
+    blob_root: str = 'storage/blobs'
+    image_max_size: int = 10 * 1024 * 1024
+    upload_chunk_size: int = 64 * 1024
+    image_cache_max_age: int = 300
+    image_thumbnail_sizes: List[int] = [40, 80, 160]
+    image_workers: int = 2
+
+
+class FeedSettings(BaseSettings):
+    """
+    Представляет настройки ленты постов в реальном времени
+
+    Attributes:
+        feed_heartbeat_interval (int): Интервал отправки комментария-пульса в открытую ленту в секундах.
+        feed_backfill_limit (int): Размер страницы пропущенных постов, читаемых при переподключении.
+        feed_queue_size (int): Размер очереди новых постов одного клиента.
+        feed_retry_ms (int): Рекомендуемая клиенту задержка перед переподключением в миллисекундах.
+    """
+
+    feed_heartbeat_interval: int = 15
+    feed_backfill_limit: int = 100
+    feed_queue_size: int = 100
+    feed_retry_ms: int = 3000
+
+
+class ExportSettings(BaseSettings):
+    """
+    Представляет настройки выгрузки данных
+
+    Attributes:
+        export_batch_size (int): Количество строк в пачке чтения и в группе строк файла.
+    """
+
+    export_batch_size: int = 10000
 
 
 class AppSettings(BaseSettings):